@@ -0,0 +1,142 @@
+import argparse
+import os
+import sys
+from quiz_engine import FEEDBACK_TIERS, TIME_TAKEN_PATTERN
+from results_store import LEGACY_RESULTS_FILE, RESULTS_FILE, ResultsStore
+
+try:
+    import pandas as pd
+except ImportError:  # pandas is optional; only this command needs it
+    pd = None
+
+
+def _require_pandas():
+    if pd is None:
+        raise RuntimeError("Results analytics needs pandas: pip install -r requirements.txt")
+
+
+def load_results(path=RESULTS_FILE):
+    """Load the results history into a DataFrame, one row per quiz; empty if there are none"""
+    _require_pandas()
+    if not os.path.exists(path) and os.path.exists(LEGACY_RESULTS_FILE):
+        frame = pd.read_json(LEGACY_RESULTS_FILE, convert_dates=False, dtype=False)
+    else:
+        frame = _read_lines(path)
+    if frame.empty:
+        return frame
+    frame["timestamp"] = pd.to_datetime(frame["timestamp"], format="%Y-%m-%d %H:%M:%S", errors="coerce")
+    frame["seconds"] = result_seconds(frame)
+    return frame
+
+
+def _read_lines(path):
+    try:
+        # The pyarrow engine parses JSON Lines far faster when it is installed
+        return pd.read_json(path, lines=True, engine="pyarrow")
+    except (ImportError, ValueError, TypeError):
+        pass
+    try:
+        return pd.read_json(path, lines=True, convert_dates=False, dtype=False)
+    except ValueError:
+        # A line left half-written by a crashed session: ResultsStore skips it
+        return pd.DataFrame.from_records(list(ResultsStore(path, legacy_path=None)))
+
+
+def result_seconds(frame):
+    """Quiz durations in seconds
+
+    Results record the exact duration in "time_taken_ns"; only rows
+    written before that field existed need their "Xm Ys" string parsed.
+    """
+    _require_pandas()
+    if "time_taken_ns" not in frame:
+        return parse_time_taken(frame["time_taken"])
+    seconds = pd.to_numeric(frame["time_taken_ns"], errors="coerce") / 1e9
+    missing = seconds.isna()
+    if missing.any():
+        seconds[missing] = parse_time_taken(frame.loc[missing, "time_taken"])
+    return seconds.astype("float64")
+
+
+def parse_time_taken(series):
+    """Convert a column of "Xm Ys" strings to seconds
+
+    A history holds only a few thousand distinct durations, so the column
+    is made categorical and only the distinct strings are parsed; every
+    row then maps to its category's value.
+    """
+    _require_pandas()
+    column = series.astype("category")
+    categories = column.cat.categories.to_series().astype("string")
+    parts = categories.str.extract(TIME_TAKEN_PATTERN).astype("float64")
+    seconds = dict(zip(column.cat.categories, parts["minutes"] * 60 + parts["seconds"]))
+    return column.map(seconds).astype("float64")
+
+
+def feedback_bands(percentage):
+    """Count results per feedback tier shown at the end of a quiz"""
+    tiers = sorted(FEEDBACK_TIERS)
+    bins = [minimum for minimum, _ in tiers] + [float("inf")]
+    labels = [message for _, message in tiers]
+    bands = pd.cut(percentage, bins=bins, labels=labels, right=False, include_lowest=True)
+    return bands.value_counts().reindex(labels[::-1], fill_value=0)
+
+
+def summarize(frame):
+    """Aggregate statistics over a results DataFrame"""
+    _require_pandas()
+    day = frame["timestamp"].dt.floor("D")
+    daily = frame.groupby(day).agg(
+        quizzes=("score", "size"),
+        mean_percentage=("percentage", "mean"),
+        median_seconds=("seconds", "median"),
+        mean_seconds=("seconds", "mean")
+    )
+    return {
+        "count": len(frame),
+        "percentage": frame["percentage"].describe(percentiles=[0.1, 0.25, 0.5, 0.75, 0.9]),
+        "score_distribution": frame.groupby(["score", "total"]).size().rename("quizzes"),
+        "feedback_bands": feedback_bands(frame["percentage"]),
+        "seconds": frame["seconds"].describe(percentiles=[0.5, 0.9, 0.99]),
+        "daily": daily
+    }
+
+
+def print_summary(summary):
+    print("=" * 60)
+    print(f"📊 RESULTS ANALYTICS ({summary['count']} quizzes)")
+    print("=" * 60)
+    print("\n📈 Percentage")
+    print(summary["percentage"].round(1).to_string())
+    print("\n🏷️  Feedback tiers")
+    print(summary["feedback_bands"].to_string())
+    print("\n🗂️  Score distribution")
+    print(summary["score_distribution"].to_string())
+    print("\n⏱️  Time taken (seconds)")
+    print(summary["seconds"].round(1).to_string())
+    print("\n📅 Per day")
+    print(summary["daily"].round(1).to_string())
+
+
+def main():
+    """Print analytics over the results history"""
+    parser = argparse.ArgumentParser(description="Analyse the quiz results history")
+    parser.add_argument("--results", default=RESULTS_FILE, help="results file (default: results.jsonl)")
+    args = parser.parse_args()
+
+    try:
+        frame = load_results(args.results)
+    except RuntimeError as e:
+        print(f"❌ Error: {e}")
+        return 1
+    except (FileNotFoundError, ValueError):
+        frame = None
+    if frame is None or frame.empty:
+        print(f"❌ Error: no results found in {args.results}!")
+        return 1
+    print_summary(summarize(frame))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
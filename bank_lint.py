@@ -0,0 +1,369 @@
+import argparse
+import hashlib
+import json
+import re
+import sys
+import zlib
+from array import array
+from question_bank import QUESTIONS_FILE, BankSnapshot, Question, scan_questions
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional; it makes near-duplicate search much faster
+    np = None
+
+EXPECTED_OPTIONS = 4  # the CLI asks for a choice between 1 and 4, the GUI shows 4 buttons
+DEFAULT_THRESHOLD = 0.7
+NUM_HASHES = 48
+BAND_ROWS = 4  # 12 bands of 4 MinHash values each
+CHUNK = 50000
+
+_MASK = (1 << 64) - 1
+_MULTIPLIER = 0x9E3779B97F4A7C15
+_MIX1 = 0xBF58476D1CE4E5B9
+_MIX2 = 0x94D049BB133111EB
+_SALTS = tuple((0x5BD1E995 * (i + 1) * _MULTIPLIER) & _MASK for i in range(NUM_HASHES))
+_WORD = re.compile(r"\w+")
+
+
+def normalize(text):
+    """Question text reduced to lowercase words, ignoring punctuation and spacing"""
+    return " ".join(_WORD.findall(text.casefold()))
+
+
+def shingles(normalized):
+    """The words and word pairs of normalized text"""
+    words = normalized.split()
+    return set(words).union(f"{a} {b}" for a, b in zip(words, words[1:])) or {""}
+
+
+def jaccard(a, b):
+    return len(a & b) / len(a | b)
+
+
+def text_digest(normalized):
+    return int.from_bytes(hashlib.blake2b(normalized.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+def check_structure(data):
+    """Problems with one questions.json entry, as (is_error, message) pairs"""
+    if not isinstance(data, dict):
+        return [(True, "is not a JSON object")]
+    problems = []
+    for field in ("question", "options", "answer"):
+        if field not in data:
+            problems.append((True, f"missing field '{field}'"))
+    if problems:
+        return problems
+    text, options, answer = data["question"], data["options"], data["answer"]
+    if not isinstance(text, str) or not text.strip():
+        problems.append((True, "question text is empty"))
+    if not isinstance(options, list) or not all(isinstance(option, str) for option in options):
+        return problems + [(True, "options must be a list of strings")]
+    if len(options) != EXPECTED_OPTIONS:
+        problems.append((True, f"has {len(options)} options; the quiz expects exactly {EXPECTED_OPTIONS}"))
+    if answer not in options:
+        problems.append((True, f"answer {answer!r} is not one of its options"))
+    if len(set(options)) != len(options):
+        problems.append((False, "has repeated options"))
+    try:
+        Question.from_dict(data)  # the optional category/difficulty/tags fields
+    except ValueError as e:
+        if answer in options:
+            problems.append((True, str(e)))
+    return problems
+
+
+def _mix(value):
+    """One MinHash permutation step (the splitmix64 finalizer); _mix_array is the numpy version"""
+    value = ((value ^ (value >> 30)) * _MIX1) & _MASK
+    value = ((value ^ (value >> 27)) * _MIX2) & _MASK
+    return value ^ (value >> 31)
+
+
+def _mix_array(values):
+    values = (values ^ (values >> np.uint64(30))) * np.uint64(_MIX1)
+    values = (values ^ (values >> np.uint64(27))) * np.uint64(_MIX2)
+    return values ^ (values >> np.uint64(31))
+
+
+def _band_key(mins):
+    key = 0
+    for value in mins:
+        key = ((key * _MULTIPLIER) + value) & _MASK
+    return key >> 32
+
+
+class MinHashBands:
+    """LSH band keys of MinHash signatures, computed in chunks
+
+    Two questions whose shingle sets have Jaccard similarity s share at
+    least one of the 12 band keys with probability 1 - (1 - s^4)^12:
+    about 96% at s = 0.7 and under 10% at s = 0.3. Only questions sharing a
+    key are ever compared, which keeps the search linear in bank size.
+    """
+
+    def __init__(self, count):
+        self.bands = NUM_HASHES // BAND_ROWS
+        if np is not None:
+            self.keys = np.zeros((self.bands, count), dtype=np.uint32)
+            self._salts = np.array(_SALTS, dtype=np.uint64)
+        else:
+            self.keys = [array("I", bytes(4 * count)) for _ in range(self.bands)]
+        self._pending = []
+        self._first = 0
+
+    def add(self, shingle_set):
+        self._pending.append([zlib.crc32(shingle.encode("utf-8")) for shingle in shingle_set])
+        if len(self._pending) == CHUNK:
+            self.flush()
+
+    def flush(self):
+        if not self._pending:
+            return
+        if np is not None:
+            self._flush_numpy()
+        else:
+            for offset, hashes in enumerate(self._pending):
+                mins = [min(_mix(h ^ salt) for h in hashes) for salt in _SALTS]
+                for band in range(self.bands):
+                    self.keys[band][self._first + offset] = _band_key(mins[band * BAND_ROWS:(band + 1) * BAND_ROWS])
+        self._first += len(self._pending)
+        self._pending = []
+
+    def _flush_numpy(self):
+        lengths = np.fromiter((len(hashes) for hashes in self._pending), dtype=np.int64, count=len(self._pending))
+        starts = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+        hashes = np.fromiter((h for group in self._pending for h in group), dtype=np.uint64, count=int(lengths.sum()))
+        mins = np.empty((NUM_HASHES, len(self._pending)), dtype=np.uint64)
+        for i, salt in enumerate(self._salts):
+            mins[i] = np.minimum.reduceat(_mix_array(hashes ^ salt), starts)
+        end = self._first + len(self._pending)
+        for band in range(self.bands):
+            key = np.zeros(len(self._pending), dtype=np.uint64)
+            for row in mins[band * BAND_ROWS:(band + 1) * BAND_ROWS]:
+                key = key * np.uint64(_MULTIPLIER) + row
+            self.keys[band][self._first:end] = key >> np.uint64(32)
+
+    def candidate_pairs(self, skip):
+        """(leader, member) positions that share a band key; positions in `skip` are left out
+
+        Each member is paired with the first question of its bucket only, so
+        a large bucket yields as many pairs as it has members.
+        """
+        self.flush()
+        for band in range(self.bands):
+            if np is not None:
+                keys = self.keys[band]
+                positions = np.flatnonzero(~skip) if skip is not None else np.arange(len(keys))
+                order = positions[np.argsort(keys[positions], kind="stable")]
+                sorted_keys = keys[order]
+                same = np.flatnonzero(sorted_keys[1:] == sorted_keys[:-1]) + 1
+                if not len(same):
+                    continue
+                run_start = np.ones(len(order), dtype=bool)
+                run_start[same] = False
+                leaders = np.maximum.accumulate(np.where(run_start, np.arange(len(order)), 0))
+                yield from zip(order[leaders[same]].tolist(), order[same].tolist())
+            else:
+                keys = self.keys[band]
+                order = sorted((p for p in range(len(keys)) if not skip[p]), key=keys.__getitem__)
+                leader = None
+                for previous, position in zip([None] + order, order):
+                    if previous is not None and keys[previous] == keys[position]:
+                        yield leader, position
+                    else:
+                        leader = position
+
+
+def _groups(pairs):
+    """Connected groups of positions from (a, b) pairs, each sorted"""
+    parent = {}
+
+    def find(x):
+        parent.setdefault(x, x)
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    for a, b in pairs:
+        root_a, root_b = find(a), find(b)
+        if root_a != root_b:
+            parent[max(root_a, root_b)] = min(root_a, root_b)
+    groups = {}
+    for x in parent:
+        groups.setdefault(find(x), []).append(x)
+    return sorted(sorted(group) for group in groups.values())
+
+
+def _exact_duplicates(digests):
+    """Groups of positions whose normalized text hashes are equal"""
+    if np is not None:
+        values = np.frombuffer(digests, dtype=np.uint64)
+        order = np.argsort(values, kind="stable")
+        sorted_values = values[order]
+        same = np.flatnonzero(sorted_values[1:] == sorted_values[:-1]) + 1
+        pairs = zip(order[same - 1].tolist(), order[same].tolist())
+    else:
+        order = sorted(range(len(digests)), key=digests.__getitem__)
+        pairs = ((a, b) for a, b in zip(order, order[1:]) if digests[a] == digests[b])
+    return _groups(pairs)
+
+
+def open_for_lint(path=QUESTIONS_FILE):
+    """(bank of every question object found in `path`, [(line, message)] for anything else in the file)
+
+    Unlike opening the bank for a quiz, text between the questions that
+    does not belong in the array is reported rather than raised, so one
+    run lists every place a merge or an edit broke the file.
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+    problems = []
+    starts, lengths = scan_questions(data, problems)
+    syntax_errors = [(data.count(b"\n", 0, offset) + 1, message) for offset, message in problems]
+    return BankSnapshot(data, starts, lengths, [None] * len(starts)), syntax_errors
+
+
+def lint_bank(path=QUESTIONS_FILE, threshold=DEFAULT_THRESHOLD, near=True):
+    """Check every question in a questions.json bank
+
+    Returns a report dict with "count", "syntax_errors" (list of (line,
+    message) for text between the questions that makes the file invalid),
+    "errors" and "warnings" (lists of (position, message)), "duplicates"
+    (groups of positions with the same normalized text) and
+    "near_duplicates" (groups whose texts have word shingle Jaccard
+    similarity of at least `threshold`).
+    """
+    errors, warnings = [], []
+    bank, syntax_errors = open_for_lint(path)
+    with bank:
+        count = len(bank)
+        digests = array("Q")
+        bands = MinHashBands(count) if near else None
+        for i in range(count):
+            try:
+                data = bank.raw(i)
+            except ValueError as e:
+                data, problems = None, [(True, f"invalid JSON: {e}")]
+            else:
+                problems = check_structure(data)
+            for is_error, message in problems:
+                (errors if is_error else warnings).append((i, message))
+            text = data.get("question") if isinstance(data, dict) else None
+            normalized = normalize(text) if isinstance(text, str) else ""
+            digests.append(text_digest(normalized))
+            if bands is not None:
+                bands.add(shingles(normalized))
+
+        duplicates = _exact_duplicates(digests)
+        near_duplicates = []
+        if bands is not None:
+            # Later copies of an exact duplicate are already reported
+            skip = np.zeros(count, dtype=bool) if np is not None else bytearray(count)
+            for group in duplicates:
+                for position in group[1:]:
+                    skip[position] = True
+            texts = {}
+
+            def shingle_set(position):
+                if position not in texts:
+                    data = bank.raw(position)
+                    texts[position] = shingles(normalize(data["question"]))
+                return texts[position]
+
+            checked, similar = set(), []
+            for leader, member in bands.candidate_pairs(skip):
+                if (leader, member) in checked:
+                    continue
+                checked.add((leader, member))
+                try:
+                    if jaccard(shingle_set(leader), shingle_set(member)) >= threshold:
+                        similar.append((leader, member))
+                except (ValueError, KeyError, TypeError, AttributeError):
+                    continue  # already reported as a structural error
+            near_duplicates = _groups(similar)
+    return {
+        "count": count,
+        "syntax_errors": syntax_errors,
+        "errors": errors,
+        "warnings": warnings,
+        "duplicates": duplicates,
+        "near_duplicates": near_duplicates
+    }
+
+
+def _question_list(positions):
+    return ", ".join(str(p + 1) for p in positions)
+
+
+def print_report(report, path, bank=None, limit=20):
+    print("=" * 60)
+    print(f"🧹 BANK LINT: {path} ({report['count']} questions)")
+    print("=" * 60)
+    syntax_errors = report["syntax_errors"]
+    if syntax_errors:
+        print(f"\n❌ {len(syntax_errors)} errors in the JSON between questions")
+        for line, message in syntax_errors[:limit]:
+            print(f"   Line {line}: {message}")
+        if len(syntax_errors) > limit:
+            print(f"   ... and {len(syntax_errors) - limit} more")
+    sections = (
+        ("errors", "❌", "structural errors"),
+        ("warnings", "⚠️ ", "warnings"),
+    )
+    for key, icon, title in sections:
+        items = report[key]
+        if items:
+            print(f"\n{icon} {len(items)} {title}")
+            for position, message in items[:limit]:
+                print(f"   Question {position + 1}: {message}")
+            if len(items) > limit:
+                print(f"   ... and {len(items) - limit} more")
+    for key, icon, title in (("duplicates", "🔁", "groups of exact duplicates"),
+                             ("near_duplicates", "🔍", "groups of near-duplicates")):
+        groups = report[key]
+        if groups:
+            print(f"\n{icon} {len(groups)} {title}")
+            for group in groups[:limit]:
+                text = ""
+                if bank is not None:
+                    try:
+                        text = f": {bank.raw(group[0])['question']!r}"
+                    except (ValueError, KeyError, TypeError):
+                        pass
+                print(f"   Questions {_question_list(group)}{text}")
+            if len(groups) > limit:
+                print(f"   ... and {len(groups) - limit} more")
+    if not any(report[key] for key in ("syntax_errors", "errors", "warnings", "duplicates", "near_duplicates")):
+        print("\n✅ No problems found")
+
+
+def main():
+    """Lint a question bank for structural errors and duplicates"""
+    parser = argparse.ArgumentParser(description="Find broken and duplicated questions in a question bank")
+    parser.add_argument("path", nargs="?", default=QUESTIONS_FILE)
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="word-shingle similarity for near-duplicates (default: 0.7)")
+    parser.add_argument("--no-near", action="store_true", help="skip the near-duplicate search")
+    parser.add_argument("--limit", type=int, default=20, help="items listed per section")
+    parser.add_argument("--json", action="store_true", help="print the full report as JSON")
+    args = parser.parse_args()
+
+    try:
+        report = lint_bank(args.path, args.threshold, near=not args.no_near)
+    except FileNotFoundError:
+        print(f"❌ Error: {args.path} file not found!")
+        return 1
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        bank, _ = open_for_lint(args.path)
+        print_report(report, args.path, bank, args.limit)
+    failed = ("syntax_errors", "errors", "duplicates", "near_duplicates")
+    return 1 if any(report[key] for key in failed) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
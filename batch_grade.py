@@ -0,0 +1,219 @@
+import argparse
+import os
+import re
+import sys
+from array import array
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain, compress
+from question_bank import QUESTIONS_FILE, load_bank
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional; it makes finding repeats across shards much faster
+    np = None
+
+# Set in each worker process by _init_worker
+_bank = None
+_answer_keys = None
+
+_SESSION = re.compile(rb"^[^,\n]*", re.MULTILINE)
+
+
+def _init_worker(bank_path):
+    global _bank, _answer_keys
+    _bank = load_bank(bank_path)
+    _answer_keys = {}
+
+
+def _answer_key(question_id):
+    """(correct option, option count) for a question, cached per worker"""
+    key = _answer_keys.get(question_id)
+    if key is None:
+        key = _answer_keys[question_id] = (_bank.answer_index(question_id), _bank.option_count(question_id))
+    return key
+
+
+def read_range(path, start, end):
+    """The answer rows whose lines start in [start, end) of `path`, as bytes"""
+    with open(path, "rb") as f:
+        if start:
+            f.seek(start - 1)
+            if f.read(1) != b"\n":
+                f.readline()  # the rest of this line belongs to the previous range
+        begin = f.tell()
+        if begin >= end:
+            return b""
+        data = f.read(end - begin)
+        if not data.endswith(b"\n"):
+            data += f.readline()  # finish the last line that starts in range
+    if begin == 0 and data.startswith(b"session"):
+        data = data.partition(b"\n")[2]  # header row
+    return data
+
+
+def range_sessions(path, start, end):
+    """The sessions named in the answer rows of [start, end) of `path`"""
+    return set(_SESSION.findall(read_range(path, start, end)))
+
+
+def grade_range(path, start, end, shared=None):
+    """Grade the answer rows whose lines start in [start, end) of `path`
+
+    Only the first answer to a question in each session counts; later
+    ones are counted as invalid. Returns ({session: (score, answered)},
+    keys, correct, invalid row count). `shared` maps the sessions that
+    other ranges answer too to a number; each question they answered here
+    has a key, number << 32 | question_id, in the array("Q") `keys`, and
+    the array("B") `correct` says which of them were answered correctly.
+    """
+    answers = {}
+    invalid = 0
+    bank_size = len(_bank)
+    for line in read_range(path, start, end).splitlines():
+        try:
+            session, question_id, choice = line.split(b",")
+            question_id = int(question_id)
+            choice = int(choice)
+        except ValueError:
+            if line.strip():
+                invalid += 1
+            continue
+        if not 0 <= question_id < bank_size:
+            invalid += 1
+            continue
+        answer_index, option_count = _answer_key(question_id)
+        if not 1 <= choice <= option_count:
+            invalid += 1
+            continue
+        graded = answers.get(session)
+        if graded is None:
+            graded = answers[session] = {}
+        if question_id in graded:
+            invalid += 1
+            continue
+        graded[question_id] = choice - 1 == answer_index
+    totals = {session: (sum(graded.values()), len(graded)) for session, graded in answers.items()}
+    spread = [(shared[session] << 32, graded) for session, graded in answers.items()
+              if session in shared] if shared else []
+    keys = array("Q", [base | question_id for base, graded in spread for question_id in graded])
+    correct = array("B", [right for _, graded in spread for right in graded.values()])
+    return totals, keys, correct, invalid
+
+
+def repeated_answers(keys, correct):
+    """(key, correct) of every answer but the first to a key, given each shard's arrays in file order"""
+    if np is not None and keys:
+        flat = np.concatenate([np.frombuffer(shard_keys, dtype=np.uint64) for shard_keys in keys])
+        flags = np.concatenate([np.frombuffer(shard_correct, dtype=np.uint8) for shard_correct in correct])
+        order = np.argsort(flat, kind="stable")  # stable: the first answer stays first
+        sorted_keys = flat[order]
+        later = order[np.flatnonzero(sorted_keys[1:] == sorted_keys[:-1]) + 1]
+        return list(zip(flat[later].tolist(), flags[later].tolist()))
+    repeats = []
+    seen = set()
+    for shard_keys, shard_correct in zip(keys, correct):
+        # Answers within a shard are already unique, so only earlier shards can repeat them
+        again = seen.intersection(shard_keys)
+        if again:
+            repeated = list(map(again.__contains__, shard_keys))
+            repeats.extend(zip(compress(shard_keys, repeated), compress(shard_correct, repeated)))
+        seen.update(shard_keys)
+    return repeats
+
+
+def _shard_sessions(shard):
+    return range_sessions(*shard)
+
+
+def _grade_shard(shard):
+    return grade_range(*shard)
+
+
+def shard_file(path, shards):
+    """Split `path` into byte ranges; grade_range aligns them to lines"""
+    size = os.path.getsize(path)
+    step = max(1, -(-size // shards))
+    return [(path, start, min(size, start + step)) for start in range(0, size, step)]
+
+
+def grade_file(answers_path, bank_path=QUESTIONS_FILE, jobs=None):
+    """Grade an answer sheet file across a process pool
+
+    Each row is "session,question_id,choice", where question_id is the
+    question's 0-based position in the bank and choice is the 1-based
+    option number, as typed in the CLI. As in the quiz, only the first
+    answer to a question counts: repeated (session, question_id) rows are
+    counted as invalid. Returns ({session: (score, answered)}, invalid
+    row count).
+
+    Raises FileNotFoundError or ValueError for a missing or invalid bank
+    before any worker starts.
+    """
+    jobs = jobs or os.cpu_count() or 1
+    load_bank(bank_path).close()  # each worker opens its own copy
+    results = {}
+    invalid = 0
+    # A few shards per worker keeps every core busy until the end
+    shards = shard_file(answers_path, jobs * 4)
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker, initargs=(bank_path,)) as pool:
+        # Workers grade repeats within a shard themselves; only sessions found in
+        # more than one shard need their question ids sent back to catch the rest
+        shard_sessions = list(pool.map(_shard_sessions, shards))
+        counts = Counter(chain.from_iterable(shard_sessions))
+        shared = [session for session, count in counts.items() if count > 1]
+        numbers = {session: number for number, session in enumerate(shared)}
+        tasks = [shard + ({session: numbers[session] for session in sessions if session in numbers},)
+                 for shard, sessions in zip(shards, shard_sessions)]
+        # Shards come back in file order, so the first answer seen is the first in the file
+        graded = list(pool.map(_grade_shard, tasks))
+    for totals, _, _, shard_invalid in graded:
+        invalid += shard_invalid
+        for session, (score, total) in totals.items():
+            current = results.get(session)
+            results[session] = (score, total) if current is None else (current[0] + score, current[1] + total)
+    repeats = repeated_answers([keys for _, keys, _, _ in graded], [correct for _, _, correct, _ in graded])
+    invalid += len(repeats)
+    for key, correct in repeats:
+        session = shared[key >> 32]
+        score, total = results[session]
+        results[session] = (score - correct, total - 1)
+    return {session.decode("utf-8"): totals for session, totals in results.items()}, invalid
+
+
+def main():
+    """Grade offline answer sheets"""
+    parser = argparse.ArgumentParser(description="Grade answer sheets in parallel")
+    parser.add_argument("answers", help="CSV file of session,question_id,choice rows")
+    parser.add_argument("--bank", default=QUESTIONS_FILE, help="question bank (default: questions.json)")
+    parser.add_argument("-j", "--jobs", type=int, help="worker processes (default: one per core)")
+    parser.add_argument("-o", "--output", help="write scores here instead of stdout")
+    args = parser.parse_args()
+
+    try:
+        results, invalid = grade_file(args.answers, args.bank, args.jobs)
+    except FileNotFoundError as e:
+        print(f"❌ Error: {e.filename} not found!", file=sys.stderr)
+        return 1
+    except ValueError as e:  # includes invalid JSON
+        print(f"❌ Error: Invalid question bank: {e}", file=sys.stderr)
+        return 1
+
+    out = open(args.output, "w") if args.output else sys.stdout
+    try:
+        out.write("session,score,total,percentage\n")
+        for session in sorted(results):
+            score, total = results[session]
+            # Same figures as the CLI's final results screen
+            out.write(f"{session},{score},{total},{(score / total) * 100:.1f}\n")
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    print(f"✅ Graded {len(results)} sessions", file=sys.stderr)
+    if invalid:
+        print(f"⚠️  Skipped {invalid} invalid rows", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,37 @@
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import analytics
+from synth import write_results
+
+
+def run(count):
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "results.jsonl")
+        write_results(path, count)
+        start = time.perf_counter()
+        frame = analytics.load_results(path)
+        loaded = time.perf_counter()
+        analytics.summarize(frame)
+        done = time.perf_counter()
+    return {"results": count, "load_seconds": loaded - start, "aggregate_seconds": done - loaded}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark results analytics")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100000, 1000000, 10000000])
+    args = parser.parse_args()
+
+    print(f"{'results':>10}  {'load (s)':>9}  {'aggregate (s)':>13}")
+    for size in args.sizes:
+        row = run(size)
+        print(f"{row['results']:>10}  {row['load_seconds']:9.2f}  {row['aggregate_seconds']:13.2f}")
+
+
+if __name__ == "__main__":
+    main()
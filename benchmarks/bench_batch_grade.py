@@ -0,0 +1,71 @@
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from batch_grade import grade_file
+from question_bank import compile_bank
+from synth import write_bank
+
+
+def write_answers(path, rows, bank_size, sessions, seed=0, interleaved=False):
+    """Write `rows` random session,question_id,choice answer rows
+
+    Each session's rows come together, as on a real answer sheet, unless
+    `interleaved`, which scatters every session over the whole file.
+    """
+    rng = random.Random(seed)
+    with open(path, "w") as f:
+        f.write("session,question_id,choice\n")
+        for first in range(0, rows, 100000):
+            f.write("".join(
+                f"s{rng.randrange(sessions) if interleaved else row * sessions // rows},"
+                f"{rng.randrange(bank_size)},{rng.randint(1, 4)}\n"
+                for row in range(first, min(rows, first + 100000))
+            ))
+
+
+def run(rows, jobs_list, bank_size=10000, sessions=100000, interleaved=False):
+    timings = []
+    with tempfile.TemporaryDirectory() as tmp:
+        bank_path = os.path.join(tmp, "questions.json")
+        write_bank(bank_path, bank_size)
+        compile_bank(bank_path)
+        answers_path = os.path.join(tmp, "answers.csv")
+        write_answers(answers_path, rows, bank_size, sessions, interleaved=interleaved)
+        reference = None
+        for jobs in jobs_list:
+            start = time.perf_counter()
+            results, _ = grade_file(answers_path, bank_path, jobs)
+            elapsed = time.perf_counter() - start
+            if reference is None:
+                reference = results
+            elif results != reference:
+                raise AssertionError(f"{jobs} workers graded differently from {jobs_list[0]}")
+            timings.append({"jobs": jobs, "seconds": elapsed, "rows_per_second": rows / elapsed})
+    return timings
+
+
+def main():
+    cores = os.cpu_count() or 1
+    parser = argparse.ArgumentParser(description="Benchmark parallel batch grading")
+    parser.add_argument("--rows", type=int, default=100000000)
+    parser.add_argument("--jobs", type=int, nargs="+",
+                        default=sorted({1, 2, 4, cores} & set(range(1, cores + 1))))
+    parser.add_argument("--interleaved", action="store_true",
+                        help="scatter each session's rows over the whole file (worst case for merging)")
+    args = parser.parse_args()
+
+    timings = run(args.rows, args.jobs, interleaved=args.interleaved)
+    base = timings[0]["seconds"] * timings[0]["jobs"]
+    print(f"{'workers':>7}  {'seconds':>9}  {'rows/s':>12}  {'efficiency':>10}")
+    for t in timings:
+        print(f"{t['jobs']:>7}  {t['seconds']:9.2f}  {t['rows_per_second']:12,.0f}  {base / (t['seconds'] * t['jobs']):10.0%}")
+
+
+if __name__ == "__main__":
+    main()
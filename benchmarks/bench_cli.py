@@ -0,0 +1,80 @@
+import argparse
+import contextlib
+import io
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from main import QuizApp
+from synth import write_bank
+
+
+class Terminal(io.StringIO):
+    """Collects output, counting writes and optionally spending `latency` seconds on each"""
+
+    def __init__(self, latency=0):
+        super().__init__()
+        self.latency = latency
+        self.writes = 0
+
+    def write(self, text):
+        self.writes += 1
+        if self.latency:
+            time.sleep(self.latency)
+        return super().write(text)
+
+
+def scripted_session(questions, latency):
+    """(seconds, writes, bytes) to answer `questions` questions from a script in-process"""
+    terminal = Terminal(latency)
+    answers = io.StringIO("1\n" * questions)
+    app = QuizApp(questions, seed=0, delay=0, answers=answers, out=terminal)
+    with contextlib.redirect_stdout(terminal):
+        start = time.perf_counter()
+        app.run_quiz()
+        elapsed = time.perf_counter() - start
+    return elapsed, terminal.writes, len(terminal.getvalue().encode("utf-8"))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Drive the CLI quiz from scripted answers at full speed")
+    parser.add_argument("--bank-size", type=int, default=10000)
+    parser.add_argument("-n", "--num-questions", type=int, default=1000)
+    parser.add_argument("--write-latency-us", type=float, default=200,
+                        help="simulated cost of one terminal write, e.g. a packet over SSH (default: 200)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        write_bank(os.path.join(tmp, "questions.json"), args.bank_size)
+        previous = os.getcwd()
+        os.chdir(tmp)
+        try:
+            scripted_session(10, 0)  # builds questions.json.idx
+            local, writes, size = scripted_session(args.num_questions, 0)
+            remote, _, _ = scripted_session(args.num_questions, args.write_latency_us / 1e6)
+        finally:
+            os.chdir(previous)
+
+        answers = os.path.join(tmp, "answers.txt")
+        with open(answers, "w") as f:
+            f.write("1\n" * args.num_questions)
+        start = time.perf_counter()
+        subprocess.run([sys.executable, os.path.join(ROOT, "main.py"), "-n", str(args.num_questions),
+                        "--answers", answers], cwd=tmp, stdout=subprocess.DEVNULL, check=True)
+        process = time.perf_counter() - start
+
+    n = args.num_questions
+    print(f"{n:,} scripted answers from a bank of {args.bank_size:,} questions")
+    print(f"writes per question:      {writes / n:8.2f} ({size / n:.0f} bytes)")
+    print(f"per question, in-process: {local / n * 1e6:8.1f} µs")
+    print(f"per question, {args.write_latency_us:g} µs writes: {remote / n * 1e6:8.1f} µs")
+    print(f"main.py --answers:        {process:8.2f} s ({n / process:,.0f} questions/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from question_bank import FacetIndex, draw_questions, index_keys
+
+CATEGORIES = ("geography", "history", "science", "literature", "music", "sport", "art", "maths")
+DIFFICULTIES = ("easy", "medium", "hard")
+
+
+class FacetedBank:
+    """Stand-in bank whose questions only have a category and difficulty"""
+
+    def __init__(self, size, seed=0):
+        rng = random.Random(seed)
+        self.categories = [rng.choice(CATEGORIES) for _ in range(size)]
+        self.difficulties = [rng.choice(DIFFICULTIES) for _ in range(size)]
+        postings = {}
+        for position, (category, difficulty) in enumerate(zip(self.categories, self.difficulties)):
+            for key in index_keys(category, difficulty):
+                postings.setdefault(key, []).append(position)
+        self.facets = FacetIndex(postings)
+
+    def __len__(self):
+        return len(self.categories)
+
+    def matching(self, category=None, difficulty=None, tags=()):
+        return self.facets.matching(category, difficulty, tags)
+
+    def scan(self, category, difficulty, num_questions):
+        """Filter by walking every question, as a bank without an index would"""
+        pool = [i for i, (c, d) in enumerate(zip(self.categories, self.difficulties))
+                if c == category and d == difficulty]
+        return random.sample(pool, min(num_questions, len(pool)))
+
+
+def best_of(repeat, func):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run(bank_size, num_questions, repeat=5, faceted=None):
+    # draw_questions only needs len(), so a range stands in for an indexed bank
+    bank = range(bank_size)
+    questions = list(bank)
+    faceted = faceted or FacetedBank(bank_size)
+    return {
+        "bank_size": bank_size,
+        "num_questions": num_questions,
+        "shuffle_seconds": best_of(repeat, lambda: random.shuffle(questions)),
+        "draw_seconds": best_of(repeat, lambda: draw_questions(bank, num_questions)),
+        "scan_filter_seconds": best_of(repeat, lambda: faceted.scan("geography", "hard", num_questions)),
+        "indexed_filter_seconds": best_of(repeat, lambda: draw_questions(
+            faceted, num_questions, category="geography", difficulty="hard"))
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare full-bank shuffles with sampled draws")
+    parser.add_argument("--bank-size", type=int, default=1000000)
+    parser.add_argument("-n", "--num-questions", type=int, nargs="+", default=[10, 100, 1000])
+    args = parser.parse_args()
+
+    faceted = FacetedBank(args.bank_size)
+    print(f"{'bank':>10}  {'drawn':>6}  {'shuffle (ms)':>12}  {'draw (ms)':>10}  "
+          f"{'scan filter (ms)':>16}  {'indexed filter (ms)':>19}")
+    for k in args.num_questions:
+        row = run(args.bank_size, k, faceted=faceted)
+        print(f"{row['bank_size']:>10}  {k:>6}  {row['shuffle_seconds'] * 1000:12.3f}  "
+              f"{row['draw_seconds'] * 1000:10.3f}  {row['scan_filter_seconds'] * 1000:16.3f}  "
+              f"{row['indexed_filter_seconds'] * 1000:19.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from question_bank import draw_questions, load_bank
+from quiz_engine import QuizSession
+from synth import write_bank
+
+
+def simulate(bank, sessions, num_questions, seed=0):
+    """Run `sessions` quizzes with random answers; returns (results, seconds)"""
+    rng = random.Random(seed)
+    results = []
+    start = time.perf_counter()
+    for n in range(sessions):
+        session = QuizSession(bank, draw_questions(bank, num_questions, seed + n))
+        session.start()
+        while not session.finished:
+            session.answer(rng.randrange(len(session.question.options)))
+            session.next()
+        results.append(session.result())
+    return results, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run many headless quiz sessions in one process")
+    parser.add_argument("--bank-size", type=int, default=100000)
+    parser.add_argument("--sessions", type=int, default=10000)
+    parser.add_argument("-n", "--num-questions", type=int, default=10)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "questions.json")
+        write_bank(path, args.bank_size)
+        with load_bank(path) as bank:
+            results, seconds = simulate(bank, args.sessions, args.num_questions)
+    answers = args.sessions * args.num_questions
+    mean = sum(r["percentage"] for r in results) / len(results)
+    print(f"{args.sessions} sessions, {answers} answers in {seconds:.2f}s")
+    print(f"{args.sessions / seconds:,.0f} sessions/s, {answers / seconds:,.0f} answers/s")
+    print(f"Mean score: {mean:.1f}%")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from synth import write_bank
+
+
+def drive(app, root, questions, seed=0):
+    """Click through `questions` questions with synthetic events
+
+    Clicks go through Tk's event queue with event_generate, exactly as a
+    mouse click on an option would, and the loop waits until the next
+    question is on screen before clicking again. Finished sessions are
+    restarted as if "Play Again" had been pressed.
+    """
+    rng = random.Random(seed)
+    start = time.perf_counter()
+    for _ in range(questions):
+        if app.session.finished:
+            app.start_quiz()
+        number = app.session.number
+        canvas = app.option_canvases[rng.randrange(len(app.option_canvases))][0]
+        canvas.event_generate("<Button-1>", x=170, y=35)
+        while app.session.number == number and not app.session.finished:
+            root.update()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Push synthetic clicks through the Tkinter quiz")
+    parser.add_argument("--questions", type=int, default=2000, help="answers to click in total")
+    parser.add_argument("--session-size", type=int, default=50)
+    parser.add_argument("--feedback-ms", type=int, default=0)
+    args = parser.parse_args()
+
+    import tkinter as tk
+    try:
+        root = tk.Tk()
+    except tk.TclError as e:
+        print(f"❌ No display available ({e}); run under a virtual display, e.g. xvfb-run")
+        return 1
+
+    import gui_quiz
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        write_bank("questions.json", 10000)
+        app = gui_quiz.QuizGUI(root, args.session_size, seed=0, render_stats=True,
+                               feedback_ms=args.feedback_ms)
+        root.update()
+        seconds = drive(app, root, args.questions)
+        summary = app.render_summary()
+        if app.stats:
+            app.stats.close()
+        app.questions.close()
+        root.destroy()
+
+    print(f"{args.questions} answers in {seconds:.2f}s ({args.questions / seconds:,.0f} questions/s)")
+    print(f"Render: median {summary['median_ms']:.3f} ms, max {summary['max_ms']:.3f} ms, "
+          f"{summary['mean_tcl_commands']:.0f} Tcl commands per question (max {summary['max_tcl_commands']})")
+    print(f"Answer to next question: median {summary['answer_overhead_median_ms']:.3f} ms, "
+          f"max {summary['answer_overhead_max_ms']:.3f} ms over the {args.feedback_ms} ms feedback delay")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
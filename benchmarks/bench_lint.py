@@ -0,0 +1,84 @@
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import bank_lint
+
+VOCABULARY = 50000
+
+
+def varied_question(i, rng):
+    """A question with its own wording; synth.py's small vocabulary makes every question look alike"""
+    words = " ".join(f"w{rng.randrange(VOCABULARY)}" for _ in range(10))
+    options = [f"option {i}-{n}" for n in range(4)]
+    return {"question": f"Which {words}?", "options": options, "answer": options[0]}
+
+
+def write_bank(path, count, planted, seed=0):
+    """Write `count` questions, `planted` of which copy or reword an earlier one
+
+    Returns the (original, copy) position pairs of the exact and the
+    near-duplicates that were planted.
+    """
+    rng = random.Random(seed)
+    exact, near = [], []
+    planted_at = set(rng.sample(range(1, count), planted))
+    questions = []
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("[\n")
+        for i in range(count):
+            question = varied_question(i, rng)
+            if i in planted_at:
+                original = rng.randrange(i)
+                words = questions[original].split()
+                if rng.random() < 0.5:
+                    question["question"] = questions[original].upper()
+                    exact.append((original, i))
+                else:
+                    words[rng.randrange(1, len(words))] = "changed"
+                    question["question"] = " ".join(words)
+                    near.append((original, i))
+            questions.append(question["question"])
+            if i:
+                f.write(",\n")
+            f.write("  ")
+            f.write(json.dumps(question))
+        f.write("\n]\n")
+    return exact, near
+
+
+def found(pairs, groups):
+    group_of = {position: n for n, group in enumerate(groups) for position in group}
+    return sum(1 for a, b in pairs if a in group_of and group_of.get(a) == group_of.get(b))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time bank_lint.py on a synthetic bank with planted duplicates")
+    parser.add_argument("--size", type=int, default=1000000)
+    parser.add_argument("--planted", type=int, default=1000, help="exact and near-duplicates to plant")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "questions.json")
+        exact, near = write_bank(path, args.size, args.planted)
+        for label, with_near in (("exact only", False), ("with near-duplicates", True)):
+            start = time.perf_counter()
+            report = bank_lint.lint_bank(path, near=with_near)
+            elapsed = time.perf_counter() - start
+            print(f"{args.size:,} questions, {label}: {elapsed:.1f} s "
+                  f"({elapsed / args.size * 1e6:.1f} µs per question)")
+        # A rewording may also be an exact copy of something planted later, so count pairs found either way
+        groups = report["duplicates"] + report["near_duplicates"]
+        print(f"  exact duplicates found: {found(exact, report['duplicates'])}/{len(exact)}")
+        print(f"  near-duplicates found:  {found(near, groups)}/{len(near)}")
+        print(f"  numpy: {'yes' if bank_lint.np is not None else 'no'}")
+
+
+if __name__ == "__main__":
+    main()
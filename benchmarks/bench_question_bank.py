@@ -0,0 +1,87 @@
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from synth import write_bank
+
+# Runs in a fresh interpreter so every measurement starts from a cold process
+PROBE = r"""
+import json, random, resource, sys, time
+sys.path.insert(0, sys.argv[1])
+from question_bank import load_bank
+path, mode, draw = sys.argv[2], sys.argv[3], int(sys.argv[4])
+start = time.perf_counter()
+if mode == "json":
+    with open(path) as f:
+        questions = json.load(f)
+    count = len(questions)
+    drawn = random.sample(questions, draw)
+else:
+    bank = load_bank(path)
+    count = len(bank)
+    drawn = [bank[i] for i in random.sample(range(count), draw)]
+elapsed = time.perf_counter() - start
+rss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+try:
+    # ru_maxrss can carry over the parent's peak across exec; VmHWM does not
+    with open("/proc/self/status") as f:
+        rss_kb = next(int(line.split()[1]) for line in f if line.startswith("VmHWM"))
+except (OSError, StopIteration):
+    pass
+print(json.dumps({"count": count, "seconds": elapsed, "max_rss_mb": rss_kb / 1024}))
+"""
+
+REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def probe(path, mode, draw):
+    out = subprocess.run(
+        [sys.executable, "-c", PROBE, REPO, path, mode, str(draw)],
+        check=True, capture_output=True, text=True
+    ).stdout
+    return json.loads(out)
+
+
+def run(sizes, draw=10, json_limit=1000000):
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in sizes:
+            path = os.path.join(tmp, f"bank_{size}.json")
+            write_bank(path, size)
+            row = {"questions": size}
+            row["first_open"] = probe(path, "bank", draw)
+            row["cached_open"] = probe(path, "bank", draw)
+            if size <= json_limit:
+                row["json_load"] = probe(path, "json", draw)
+            start = time.perf_counter()
+            subprocess.run([sys.executable, os.path.join(REPO, "question_bank.py"), "compile", path],
+                           check=True, capture_output=True)
+            row["compile_seconds"] = time.perf_counter() - start
+            row["compiled_open"] = probe(path, "bank", draw)
+            rows.append(row)
+            os.remove(path)
+            os.remove(os.path.splitext(path)[0] + ".qbank")
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark question bank startup time and memory")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 1000000, 10000000])
+    parser.add_argument("--draw", type=int, default=10, help="questions materialized per session")
+    args = parser.parse_args()
+
+    print(f"{'questions':>10}  {'mode':<13} {'seconds':>9}  {'max RSS (MB)':>12}")
+    for row in run(args.sizes, args.draw):
+        for mode in ("first_open", "cached_open", "compiled_open", "json_load"):
+            if mode in row:
+                m = row[mode]
+                print(f"{row['questions']:>10}  {mode:<13} {m['seconds']:9.3f}  {m['max_rss_mb']:12.1f}")
+        print(f"{row['questions']:>10}  {'compile':<13} {row['compile_seconds']:9.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+import argparse
+import gc
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from question_bank import Question, compile_bank
+from synth import question_dict, write_bank
+
+
+def measure(build):
+    """Bytes allocated by the objects `build` returns, and the objects"""
+    gc.collect()
+    tracemalloc.start()
+    objects = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return size, objects
+
+
+def time_grading(questions, rounds=3):
+    """Seconds per graded answer, old string comparison vs answer index"""
+    dicts, models = questions
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for q in dicts:
+            q["options"][2] == q["answer"]
+    string_cost = (time.perf_counter() - start) / (rounds * len(dicts))
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for q in models:
+            q.is_correct(2)
+    index_cost = (time.perf_counter() - start) / (rounds * len(models))
+    return string_cost, index_cost
+
+
+def run(count):
+    rng = random.Random(0)
+    raw = [json.dumps(question_dict(i, rng)) for i in range(count)]
+    dict_bytes, dicts = measure(lambda: [json.loads(line) for line in raw])
+    model_bytes, models = measure(lambda: [Question.from_dict(json.loads(line)) for line in raw])
+    string_cost, index_cost = time_grading((dicts, models))
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "questions.json")
+        write_bank(path, count)
+        compiled_bytes = os.path.getsize(compile_bank(path))
+    return {
+        "questions": count,
+        "dict_bytes": dict_bytes / count,
+        "model_bytes": model_bytes / count,
+        "compiled_bytes": compiled_bytes / count,
+        "string_compare_ns": string_cost * 1e9,
+        "index_compare_ns": index_cost * 1e9
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare per-question memory of dicts and Question objects")
+    parser.add_argument("--count", type=int, default=100000)
+    args = parser.parse_args()
+
+    row = run(args.count)
+    print(f"Questions:                {row['questions']}")
+    print(f"dict per question:        {row['dict_bytes']:.0f} bytes")
+    print(f"Question per question:    {row['model_bytes']:.0f} bytes")
+    print(f"compiled bank on disk:    {row['compiled_bytes']:.0f} bytes")
+    print(f"grade by string compare:  {row['string_compare_ns']:.1f} ns")
+    print(f"grade by answer index:    {row['index_compare_ns']:.1f} ns")
+
+
+if __name__ == "__main__":
+    main()
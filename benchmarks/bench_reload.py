@@ -0,0 +1,70 @@
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from question_bank import BankSnapshot, BankWatcher
+from synth import question_dict, write_bank
+
+EDIT_SIZES = (1, 100, 10000)
+
+
+def edit(path, first, count, rng):
+    """Rewrite `count` consecutive questions starting at `first`, leaving the rest byte for byte"""
+    with open(path, "rb") as f:
+        lines = f.read().split(b"\n")
+    # write_bank puts "[" on the first line and one question per line after it
+    for i in range(first, first + count):
+        comma = b"," if lines[i + 1].endswith(b",") else b""
+        lines[i + 1] = b"  " + json.dumps(question_dict(10 ** 9 + i, rng)).encode("utf-8") + comma
+    with open(path, "wb") as f:
+        f.write(b"\n".join(lines))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time incremental reloads of an edited questions.json")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100000, 1000000], help="question bank sizes")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--filtered", action="store_true",
+                        help="keep the facet index up to date too, as a filtered --watch session does")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    print(f"{'bank':>10}{'full load':>14}" + "".join(f"{f'{n} edited':>16}" for n in EDIT_SIZES))
+    for size in args.sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "questions.json")
+            write_bank(path, size)
+            start = time.perf_counter()
+            BankSnapshot.load(path)  # no cached index yet: scans and parses offsets of the whole file
+            full = time.perf_counter() - start
+            watcher = BankWatcher(path)
+            if args.filtered:
+                watcher.current.facets
+            row = []
+            for count in EDIT_SIZES:
+                if count >= size:
+                    row.append(None)  # an edit needs unchanged questions around it
+                    continue
+                best = None
+                for _ in range(args.repeat):
+                    edit(path, rng.randrange(size - count), count, rng)
+                    start = time.perf_counter()
+                    if not watcher.poll():
+                        raise RuntimeError("the edit was not picked up")
+                    if args.filtered:
+                        watcher.current.facets
+                    elapsed = time.perf_counter() - start
+                    best = elapsed if best is None else min(best, elapsed)
+                row.append(best)
+        print(f"{size:>10,}{full * 1000:>11.1f} ms" + "".join(f"{'-':>16}" if seconds is None
+                                                             else f"{seconds * 1000:>13.1f} ms" for seconds in row))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from results_store import ResultsStore
+
+SAMPLE_RESULT = {
+    "timestamp": "2024-01-15 14:30:25",
+    "score": 8,
+    "total": 10,
+    "percentage": 80.0,
+    "time_taken": "2m 15s"
+}
+
+
+def prefill(path, count):
+    """Write `count` stored results without going through the store"""
+    line = (json.dumps(SAMPLE_RESULT) + "\n").encode("utf-8")
+    chunk = line * 10000
+    with open(path, "wb") as f:
+        for _ in range(count // 10000):
+            f.write(chunk)
+        f.write(line * (count % 10000))
+
+
+def time_saves(path, saves):
+    """Average seconds per save, one store per save like the quiz apps"""
+    start = time.perf_counter()
+    for _ in range(saves):
+        with ResultsStore(path, legacy_path=None) as store:
+            store.append(SAMPLE_RESULT)
+    return (time.perf_counter() - start) / saves
+
+
+def time_legacy_saves(path, saves):
+    """Average seconds per save with the old read-modify-write of a JSON array"""
+    start = time.perf_counter()
+    for _ in range(saves):
+        with open(path, "r") as f:
+            results = json.load(f)
+        results.append(SAMPLE_RESULT)
+        with open(path, "w") as f:
+            json.dump(results, f, indent=2)
+    return (time.perf_counter() - start) / saves
+
+
+def run(sizes, saves=200, legacy_limit=100000):
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in sizes:
+            path = os.path.join(tmp, "results.jsonl")
+            prefill(path, size)
+            row = {"stored": size, "append_ms": time_saves(path, saves) * 1000}
+            if size <= legacy_limit:
+                legacy_path = os.path.join(tmp, "results.txt")
+                with open(legacy_path, "w") as f:
+                    json.dump([SAMPLE_RESULT] * size, f)
+                row["legacy_ms"] = time_legacy_saves(legacy_path, max(1, saves // 20)) * 1000
+            rows.append(row)
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark results saving against history size")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[0, 10000, 100000, 1000000])
+    parser.add_argument("--saves", type=int, default=200)
+    args = parser.parse_args()
+
+    print(f"{'stored':>10}  {'append (ms)':>12}  {'legacy (ms)':>12}")
+    for row in run(args.sizes, args.saves):
+        legacy = f"{row['legacy_ms']:12.3f}" if "legacy_ms" in row else f"{'-':>12}"
+        print(f"{row['stored']:>10}  {row['append_ms']:12.3f}  {legacy}")
+
+
+if __name__ == "__main__":
+    main()
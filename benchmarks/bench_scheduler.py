@@ -0,0 +1,86 @@
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from question_bank import draw_questions, load_bank
+from scheduler import DAY, ReviewStore
+from synth import write_bank
+
+
+def fill(store, bank, positions, now, seed=0):
+    """Record an answer to each of `positions`, given at some time over the past year"""
+    rng = random.Random(seed)
+    for position in positions:
+        store.record(position, 0, rng.random() < 0.7, rng.uniform(1, 20), bank[position],
+                     now=now - rng.randrange(365 * DAY))
+
+
+def time_sessions(store, bank, sessions, num_questions):
+    """Seconds spent building queues and picking their questions over `sessions` sessions"""
+    build = pick = 0
+    for session in range(sessions):
+        start = time.perf_counter()
+        queue = store.queue(bank, num_questions, seed=session)
+        middle = time.perf_counter()
+        for i in range(len(queue)):
+            queue[i]
+        build += middle - start
+        pick += time.perf_counter() - middle
+    return build, pick
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time adaptive question picking against a uniform draw")
+    parser.add_argument("--bank-size", type=int, default=200000)
+    parser.add_argument("--history", type=int, default=50000, help="answers already recorded")
+    parser.add_argument("-n", "--num-questions", type=int, default=50)
+    parser.add_argument("--sessions", type=int, default=20)
+    args = parser.parse_args()
+
+    now = time.time()
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "questions.json")
+        write_bank(path, args.bank_size)
+        with load_bank(path) as bank, ReviewStore(os.path.join(tmp, "user.bin")) as store:
+            rng = random.Random(0)
+            start = time.perf_counter()
+            fill(store, bank, [rng.randrange(len(bank)) for _ in range(args.history)], now)
+            record_us = (time.perf_counter() - start) / args.history * 1e6
+            seen = len(store.due_heap())
+            build, pick = time_sessions(store, bank, args.sessions, args.num_questions)
+
+            start = time.perf_counter()
+            for session in range(args.sessions):
+                draw_questions(bank, args.num_questions, seed=session)
+            draw = time.perf_counter() - start
+
+            # Every question answered just now: nothing is due and no question is
+            # new, so the queue lists the unseen ones, finds none and reviews ahead
+            for position in range(len(bank)):
+                store.record(position, 0, True, 1, bank[position], now=now)
+        # Reopen the bank so no question is parsed yet, as in a new session
+        with load_bank(path) as bank, ReviewStore(os.path.join(tmp, "user.bin")) as store:
+            start = time.perf_counter()
+            store.queue(bank, args.num_questions)[0]
+            first_pick = time.perf_counter() - start
+            full_build, full_pick = time_sessions(store, bank, args.sessions, args.num_questions)
+
+    picks = args.sessions * args.num_questions
+    print(f"Bank: {args.bank_size:,} questions, {seen:,} seen by the user ({args.history:,} answers recorded)")
+    print(f"record answer:        {record_us:8.2f} µs")
+    print(f"build queue:          {build / args.sessions * 1000:8.2f} ms per session")
+    print(f"pick next question:   {pick / picks * 1e6:8.2f} µs")
+    print(f"uniform draw:         {draw / args.sessions * 1000:8.2f} ms per session")
+    print(f"All {args.bank_size:,} questions seen:")
+    print(f"first pick:           {first_pick * 1000:8.2f} ms")
+    print(f"build queue:          {full_build / args.sessions * 1000:8.2f} ms per session")
+    print(f"pick next question:   {full_pick / picks * 1e6:8.2f} µs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+import argparse
+import compileall
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from synth import write_bank
+
+# Modules only some sessions need; importing them at startup is a regression
+DEFERRED = ("sqlite3", "hashlib", "getpass", "datetime", "random", "scheduler")
+ENTRY_POINTS = {
+    "main": DEFERRED + ("tkinter",),
+    "gui_quiz": DEFERRED + ("tkinter.ttk", "tkinter.font", "tkinter.messagebox"),
+}
+WELCOME_PROMPT = b"Press Enter"
+
+
+def import_times(module):
+    """(module name, self µs, cumulative µs) for every import of `module` in a fresh interpreter"""
+    completed = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                               cwd=ROOT, capture_output=True, text=True)
+    if completed.returncode != 0:
+        raise RuntimeError(completed.stderr.strip().splitlines()[-1])
+    rows = []
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        own, cumulative, name = line[len("import time:"):].split("|")
+        rows.append((name.strip(), int(own), int(cumulative)))
+    return rows
+
+
+def wall_ms(args, cwd, until=None):
+    """Milliseconds until a fresh `python args` exits, or first prints `until`"""
+    start = time.perf_counter()
+    process = subprocess.Popen([sys.executable] + args, cwd=cwd, stdin=subprocess.PIPE,
+                               stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+    if until is None:
+        process.communicate()
+        return (time.perf_counter() - start) * 1000
+    output = b""
+    while until not in output:
+        chunk = process.stdout.read1(4096)
+        if not chunk:
+            raise RuntimeError(f"{' '.join(args)} exited before printing {until!r}")
+        output += chunk
+    elapsed = (time.perf_counter() - start) * 1000
+    process.kill()
+    process.wait()
+    return elapsed
+
+
+def welcome_ms(bank_dir, flags, repeat, cold):
+    """Fastest of `repeat` runs of main.py until its welcome prompt, optionally rebuilding the bank index"""
+    index = os.path.join(bank_dir, "questions.json.idx")
+    best = None
+    for _ in range(repeat):
+        if cold and os.path.exists(index):
+            os.remove(index)  # as after questions.json is edited
+        elapsed = wall_ms([os.path.join(ROOT, "main.py")] + flags, bank_dir, WELCOME_PROMPT)
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check what the entry points import and how soon the CLI is ready")
+    parser.add_argument("--bank-size", type=int, default=100000)
+    parser.add_argument("--repeat", type=int, default=7, help="runs per measurement; the fastest is kept")
+    parser.add_argument("--top", type=int, default=8, help="slowest imports to list per entry point")
+    parser.add_argument("--budget-ms", type=float, default=100,
+                        help="fail if the --fast-start welcome screen takes longer (default: 100)")
+    args = parser.parse_args()
+
+    # Measure with bytecode cached, as an installed copy would run
+    compileall.compile_dir(ROOT, maxlevels=0, quiet=1)
+    failures = []
+    for module, deferred in ENTRY_POINTS.items():
+        runs = [import_times(module) for _ in range(args.repeat)]
+        rows = min(runs, key=lambda rows: rows[-1][2])  # the run with the fastest total
+        print(f"import {module}: {rows[-1][2] / 1000:.1f} ms")
+        for name, own, _ in sorted(rows, key=lambda row: -row[1])[:args.top]:
+            print(f"    {own / 1000:6.1f} ms  {name}")
+        eager = sorted({name for name, _, _ in rows} & set(deferred))
+        if eager:
+            failures.append(f"import {module} loads {', '.join(eager)} at startup")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        write_bank(os.path.join(tmp, "questions.json"), args.bank_size)
+        interpreter = min(wall_ms(["-c", "pass"], tmp) for _ in range(args.repeat))
+        timings = {}
+        for cold in (True, False):
+            for flags in ([], ["--fast-start"]):
+                timings[cold, bool(flags)] = welcome_ms(tmp, flags, args.repeat, cold)
+        fast = max(timings[True, True], timings[False, True])
+    print(f"Welcome screen with {args.bank_size:,} questions ({interpreter:.1f} ms for python -c pass):")
+    print(f"{'':16}{'no index':>12}{'indexed':>12}")
+    for label, flag in (("main.py", False), ("--fast-start", True)):
+        print(f"{label:16}{timings[True, flag]:>9.1f} ms{timings[False, flag]:>9.1f} ms")
+    if fast > args.budget_ms:
+        failures.append(f"main.py --fast-start took {fast:.1f} ms, over the {args.budget_ms:g} ms budget")
+
+    for failure in failures:
+        print(f"❌ {failure}")
+    if failures:
+        sys.exit(1)
+    print(f"✅ Startup within {args.budget_ms:g} ms with no eager imports")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from question_bank import draw_questions
+from storage import FileStorage, SQLiteStorage, migrate
+from synth import write_bank, write_results
+
+SAMPLE_RESULT = {
+    "timestamp": "2025-01-15 14:30:25",  # outside the queried day
+    "score": 8,
+    "total": 10,
+    "percentage": 80.0,
+    "time_taken": "2m 15s",
+    "time_taken_ns": 135000000000
+}
+
+
+def timed(func, repeat=1):
+    """Average seconds per call of func()"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat
+
+
+def open_and_draw(storage):
+    """What starting a session costs: open the bank, draw 10 questions, read them"""
+    bank = storage.open_bank()
+    for position in draw_questions(bank, 10):
+        bank[position]
+    bank.close()
+
+
+def save_one(storage):
+    """One result saved the way the apps do it, opening the store each time"""
+    with storage.open_results() as store:
+        store.append(SAMPLE_RESULT)
+
+
+def one_day(storage):
+    """Results from a single day of history"""
+    store = storage.open_results()
+    if hasattr(store, "between"):
+        return sum(1 for _ in store.between("2024-06-15", "2024-06-16"))
+    return sum(1 for entry in store if entry["timestamp"].startswith("2024-06-15"))
+
+
+def run(bank_size, history, saves=200, fetches=2000):
+    rows = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        questions = os.path.join(tmp, "questions.json")
+        results = os.path.join(tmp, "results.jsonl")
+        write_bank(questions, bank_size)
+        write_results(results, history)
+        files = FileStorage(questions, results)
+        files.open_bank().close()  # build the offset index once, like a previous launch would
+        database = SQLiteStorage(os.path.join(tmp, "quiz.db"))
+        start = time.perf_counter()
+        migrate(database, questions, results)
+        rows["migrate_seconds"] = time.perf_counter() - start
+
+        for name, storage in (("file", files), ("sqlite", database)):
+            bank = storage.open_bank()
+            rng = random.Random(0)
+            positions = [rng.randrange(len(bank)) for _ in range(fetches)]
+            rows[name] = {
+                "session_start_ms": timed(lambda: open_and_draw(storage), 20) * 1000,
+                "question_fetch_us": timed(lambda: [bank[p] for p in positions]) / fetches * 1e6,
+                "save_ms": timed(lambda: save_one(storage), saves) * 1000,
+                "batch_insert_10k_ms": timed(lambda: _insert_batch(storage, 10000)) * 1000,
+                "one_day_query_ms": timed(lambda: one_day(storage), 3) * 1000
+            }
+            bank.close()
+        database.close()
+    return rows
+
+
+def _insert_batch(storage, count):
+    with storage.open_results(batch_size=count) as store:
+        store.append_many([SAMPLE_RESULT] * count)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the file and SQLite storage backends")
+    parser.add_argument("--bank-size", type=int, default=100000)
+    parser.add_argument("--history", type=int, default=100000, help="results already stored")
+    parser.add_argument("--saves", type=int, default=200)
+    args = parser.parse_args()
+
+    rows = run(args.bank_size, args.history, args.saves)
+    print(f"Bank: {args.bank_size:,} questions, history: {args.history:,} results "
+          f"(migrated in {rows['migrate_seconds']:.2f} s)")
+    print(f"{'':<22}{'file':>12}{'sqlite':>12}")
+    for metric in rows["file"]:
+        print(f"{metric:<22}{rows['file'][metric]:>12.3f}{rows['sqlite'][metric]:>12.3f}")
+
+
+if __name__ == "__main__":
+    main()
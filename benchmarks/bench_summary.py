@@ -0,0 +1,54 @@
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from results_summary import ResultsSummary, build_summaries, merge_summaries, summarize_file, summary_path
+from synth import write_results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time per-shard results summaries and merging them")
+    parser.add_argument("--shards", type=int, default=100)
+    parser.add_argument("--results", type=int, default=20000, help="results per shard")
+    parser.add_argument("-j", "--jobs", type=int, nargs="+", default=[1, 2, 4, os.cpu_count() or 1],
+                        help="worker counts to build the summaries with")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = [os.path.join(tmp, f"results-{shard:03d}.jsonl") for shard in range(args.shards)]
+        for shard, path in enumerate(paths):
+            write_results(path, args.results, seed=shard)
+        total = args.shards * args.results
+        print(f"{args.shards} shards of {args.results:,} results ({total:,} in all)")
+
+        build = {}
+        for jobs in sorted(set(args.jobs)):
+            start = time.perf_counter()
+            build_summaries(paths, jobs)
+            build[jobs] = time.perf_counter() - start
+            print(f"build, {jobs:>2} workers:   {build[jobs]:8.2f} s ({build[min(build)] / build[jobs]:.1f}x)")
+
+        for shards in sorted({1, 10, args.shards}):
+            start = time.perf_counter()
+            merged = merge_summaries(ResultsSummary.load(summary_path(path)) for path in paths[:shards])
+            merged.seconds_quantile(0.99)
+            elapsed = time.perf_counter() - start
+            print(f"merge {shards:>4} summaries: {elapsed * 1000:8.2f} ms")
+
+        start = time.perf_counter()
+        raw = merge_summaries(summarize_file(path) for path in paths)
+        reread = time.perf_counter() - start
+        print(f"reread all raw results: {reread:8.2f} s")
+        if raw.to_dict() != merged.to_dict():
+            raise RuntimeError("merged summaries differ from one built over all the results")
+        summary_bytes = sum(os.path.getsize(summary_path(path)) for path in paths)
+        raw_bytes = sum(os.path.getsize(path) for path in paths)
+        print(f"summaries: {summary_bytes / 1024:,.0f} KiB for {raw_bytes / 1024 ** 2:,.0f} MiB of results")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+import argparse
+import asyncio
+import json
+import os
+import random
+import resource
+import subprocess
+import sys
+import time
+
+REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+async def play(host, port, latencies, rng):
+    """Play one session with random answers, recording answer->feedback latency"""
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        while True:
+            line = await reader.readline()
+            if not line:
+                return False
+            message = json.loads(line)
+            if message["type"] == "result":
+                return True
+            if message["type"] == "question":
+                start = time.perf_counter()
+                writer.write(f"{rng.randint(1, len(message['options']))}\n".encode())
+                await writer.drain()
+                feedback = json.loads(await reader.readline())
+                latencies.append(time.perf_counter() - start)
+                assert feedback["type"] == "feedback", feedback
+    finally:
+        writer.close()
+
+
+def percentile(values, pct):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * pct / 100))]
+
+
+async def run(host, port, sessions, seed=0):
+    rng = random.Random(seed)
+    latencies = []
+    start = time.perf_counter()
+    outcomes = await asyncio.gather(
+        *(play(host, port, latencies, rng) for _ in range(sessions)),
+        return_exceptions=True
+    )
+    elapsed = time.perf_counter() - start
+    completed = sum(1 for outcome in outcomes if outcome is True)
+    return completed, latencies, elapsed
+
+
+def raise_fd_limit():
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if hard == resource.RLIM_INFINITY or soft < hard:
+        resource.setrlimit(resource.RLIMIT_NOFILE, (hard, hard))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test the quiz server with concurrent sessions")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--sessions", type=int, default=10000)
+    parser.add_argument("--spawn", action="store_true", help="start server.py for the duration of the test")
+    args = parser.parse_args()
+
+    raise_fd_limit()
+    server = None
+    if args.spawn:
+        server = subprocess.Popen(
+            [sys.executable, os.path.join(REPO, "server.py"), "--port", str(args.port), "--no-save"],
+            cwd=REPO, stdout=subprocess.PIPE, preexec_fn=raise_fd_limit
+        )
+        # Wait for the "Loaded" and "Serving" lines so the port is bound
+        server.stdout.readline()
+        server.stdout.readline()
+    try:
+        completed, latencies, elapsed = asyncio.run(run(args.host, args.port, args.sessions))
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+    print(f"Sessions: {completed}/{args.sessions} completed in {elapsed:.2f}s")
+    if latencies:
+        print(f"Answers:  {len(latencies)} ({len(latencies) / elapsed:,.0f}/s)")
+        print(f"p50 answer latency: {percentile(latencies, 50) * 1000:.2f} ms")
+        print(f"p99 answer latency: {percentile(latencies, 99) * 1000:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
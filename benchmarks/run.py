@@ -0,0 +1,275 @@
+import argparse
+import contextlib
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from synth import write_bank, write_results
+
+CASES = ("load_cold", "load_warm", "shuffle", "check_answer", "save_results", "gui_render")
+QUICK_SIZES = [1000, 100000]
+DEFAULT_SIZES = [1000, 100000, 1000000]
+FULL_SIZES = [1000, 100000, 1000000, 10000000]
+DEFAULT_HISTORY = [0, 10000, 100000, 1000000]
+
+
+@contextlib.contextmanager
+def quiet():
+    """Silence the apps' progress prints while they are being timed"""
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        yield
+
+
+@contextlib.contextmanager
+def working_dir(path):
+    previous = os.getcwd()
+    os.chdir(path)
+    try:
+        yield
+    finally:
+        os.chdir(previous)
+
+
+def best_of(repeat, func):
+    """Fastest of `repeat` runs of func(), which returns the seconds it measured"""
+    return min(func() for _ in range(repeat))
+
+
+def loaded_app(num_questions=10, seed=0):
+    from main import QuizApp
+    app = QuizApp(num_questions, seed)
+    with quiet():
+        if not app.load_questions():
+            raise RuntimeError("could not load the synthetic bank")
+    return app
+
+
+def close_app(app):
+    app.questions.close()
+    if app.stats:
+        app.stats.close()
+
+
+def time_load(cold):
+    """Seconds for QuizApp.load_questions, optionally without the cached index"""
+    if cold and os.path.exists("questions.json.idx"):
+        os.remove("questions.json.idx")
+    from main import QuizApp
+    app = QuizApp()
+    start = time.perf_counter()
+    with quiet():
+        app.load_questions()
+    elapsed = time.perf_counter() - start
+    close_app(app)
+    return elapsed
+
+
+def time_shuffle(calls=1000):
+    """Seconds per QuizApp.shuffle_questions draw of 10 questions"""
+    app = loaded_app()
+    start = time.perf_counter()
+    with quiet():
+        for _ in range(calls):
+            app.shuffle_questions()
+    elapsed = time.perf_counter() - start
+    close_app(app)
+    return elapsed / calls
+
+
+def time_check_answer(answers=1000):
+    """Seconds per answered question: fetch, QuizApp.check_answer, render, next()"""
+    app = loaded_app(num_questions=answers)
+    with quiet():
+        app.shuffle_questions()
+        count = app.session.total
+        app.session.start()
+        start = time.perf_counter()
+        while not app.session.finished:
+            app.check_answer(app.session.question, 1)
+            app.render()
+            app.session.next()
+        elapsed = time.perf_counter() - start
+    close_app(app)
+    return elapsed / count
+
+
+def time_save_results(saves=50):
+    """Seconds per QuizApp.save_results against the current results.jsonl"""
+    app = loaded_app()
+    with quiet():
+        app.shuffle_questions()
+        app.session.start()
+        app.session.finish()
+        start = time.perf_counter()
+        for _ in range(saves):
+            app.save_results()
+        elapsed = time.perf_counter() - start
+    close_app(app)
+    return elapsed / saves
+
+
+def gui_backend(requested):
+    """Pick "display", "xvfb" or "stub" for the GUI case, starting Xvfb if needed"""
+    if requested == "stub":
+        return "stub", None
+    import tkinter
+    try:
+        tkinter.Tk().destroy()
+        return "display", None
+    except tkinter.TclError:
+        pass
+    if shutil.which("Xvfb") and requested in ("auto", "xvfb"):
+        display = ":%d" % (90 + os.getpid() % 100)
+        xvfb = subprocess.Popen(["Xvfb", display, "-nolisten", "tcp"],
+                                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        os.environ["DISPLAY"] = display
+        for _ in range(50):
+            time.sleep(0.1)
+            try:
+                tkinter.Tk().destroy()
+                return "xvfb", xvfb
+            except tkinter.TclError:
+                pass
+        xvfb.terminate()
+    if requested in ("display", "xvfb"):
+        raise RuntimeError(f"no {requested} available for the GUI benchmark")
+    return "stub", None
+
+
+def time_gui_render(backend, questions=500):
+    """Median seconds to draw a question in QuizGUI, clicking through `questions` answers"""
+    if backend == "stub":
+        import tk_stub
+        tk_stub.install()
+    import tkinter
+    from gui_quiz import QuizGUI
+    root = tkinter.Tk()
+    app = QuizGUI(root, num_questions=50, seed=0, render_stats=True, feedback_ms=0)
+    for _ in range(questions):
+        if app.session.finished:
+            app.start_quiz()
+        number = app.session.number
+        app.check_answer(0)
+        while app.session.number == number and not app.session.finished:
+            root.update()
+    root.destroy()
+    if app.stats:
+        app.stats.close()
+    timings = sorted(seconds for seconds, _ in app.render_stats)
+    return timings[len(timings) // 2]
+
+
+def run(sizes, history, cases=CASES, repeat=3, gui="auto"):
+    """Run the suite; returns {"case[size]": seconds}"""
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp, working_dir(tmp):
+        for size in sizes:
+            write_bank("questions.json", size)
+            if "load_cold" in cases:
+                results[f"load_cold[{size}]"] = best_of(repeat, lambda: time_load(cold=True))
+            if "load_warm" in cases:
+                time_load(cold=False)  # make sure the index is cached
+                results[f"load_warm[{size}]"] = best_of(repeat, lambda: time_load(cold=False))
+            if "shuffle" in cases:
+                results[f"shuffle[{size}]"] = best_of(repeat, time_shuffle)
+            if "check_answer" in cases:
+                results[f"check_answer[{size}]"] = best_of(repeat, time_check_answer)
+            print(f"  bank of {size:,} done", file=sys.stderr)
+        write_bank("questions.json", min(sizes))
+        if "save_results" in cases:
+            for count in history:
+                write_results("results.jsonl", count)
+                results[f"save_results[{count}]"] = best_of(repeat, time_save_results)
+            print("  results history done", file=sys.stderr)
+        if "gui_render" in cases:
+            backend, xvfb = gui_backend(gui)
+            try:
+                results[f"gui_render[{backend}]"] = best_of(repeat, lambda: time_gui_render(backend))
+            finally:
+                if xvfb is not None:
+                    xvfb.terminate()
+    return results
+
+
+def environment():
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        "date": time.strftime("%Y-%m-%d %H:%M:%S")
+    }
+
+
+def compare(results, baseline, tolerance):
+    """Rows of (name, baseline, current, ratio, regressed) for benchmarks in both runs"""
+    rows = []
+    for name, seconds in results.items():
+        before = baseline.get(name)
+        if before:
+            ratio = seconds / before
+            rows.append((name, before, seconds, ratio, ratio > 1 + tolerance))
+    return rows
+
+
+def format_seconds(seconds):
+    if seconds >= 1:
+        return f"{seconds:.2f} s"
+    if seconds >= 1e-3:
+        return f"{seconds * 1e3:.2f} ms"
+    return f"{seconds * 1e6:.1f} µs"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the quiz benchmark suite and compare against a baseline")
+    sizes = parser.add_mutually_exclusive_group()
+    sizes.add_argument("--sizes", type=int, nargs="+", help="question bank sizes (default: 1k, 100k, 1M)")
+    sizes.add_argument("--quick", action="store_true", help="only 1k and 100k question banks")
+    sizes.add_argument("--full", action="store_true", help="1k up to 10M question banks")
+    parser.add_argument("--history", type=int, nargs="+", default=DEFAULT_HISTORY,
+                        help="results history sizes for save_results")
+    parser.add_argument("--cases", nargs="+", choices=CASES, default=list(CASES))
+    parser.add_argument("--repeat", type=int, default=3, help="runs per benchmark; the fastest is kept")
+    parser.add_argument("--gui", choices=("auto", "display", "xvfb", "stub"), default="auto",
+                        help="how to run Tk: an existing display, Xvfb, or the tkinter stub")
+    parser.add_argument("-o", "--output", help="write this run's results to a JSON file")
+    parser.add_argument("--baseline", help="JSON file from an earlier run to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="slowdown over the baseline that counts as a regression (default: 0.25)")
+    args = parser.parse_args()
+
+    sizes = args.sizes or (QUICK_SIZES if args.quick else FULL_SIZES if args.full else DEFAULT_SIZES)
+    results = run(sizes, args.history, args.cases, args.repeat, args.gui)
+
+    for name, seconds in results.items():
+        print(f"{name:<28} {format_seconds(seconds):>12}")
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"environment": environment(), "results": results}, f, indent=2)
+            f.write("\n")
+
+    if not args.baseline:
+        return 0
+    with open(args.baseline, encoding="utf-8") as f:
+        baseline = json.load(f)["results"]
+    rows = compare(results, baseline, args.tolerance)
+    print(f"\nAgainst {args.baseline}:")
+    for name, before, seconds, ratio, regressed in rows:
+        flag = "  ❌ REGRESSION" if regressed else ""
+        print(f"{name:<28} {format_seconds(before):>12} -> {format_seconds(seconds):>12} ({ratio:.2f}x){flag}")
+    regressions = sum(regressed for *_, regressed in rows)
+    if regressions:
+        print(f"\n{regressions} benchmark(s) more than {args.tolerance:.0%} slower than the baseline")
+        return 1
+    print("\nNo regressions")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,51 @@
+import json
+import random
+
+WORDS = (
+    "capital planet river author element ocean mountain language century "
+    "painter equation country desert island formula symphony empire treaty"
+).split()
+
+
+def question_dict(i, rng):
+    """Build one synthetic question in the questions.json format"""
+    words = " ".join(rng.choice(WORDS) for _ in range(6))
+    options = [f"{rng.choice(WORDS)} {i}-{n}" for n in range(4)]
+    return {
+        "question": f"Question {i}: which {words}?",
+        "options": options,
+        "answer": options[rng.randrange(4)]
+    }
+
+
+def write_bank(path, count, seed=0):
+    """Write a questions.json style bank with `count` synthetic questions"""
+    rng = random.Random(seed)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("[\n")
+        for i in range(count):
+            if i:
+                f.write(",\n")
+            f.write("  ")
+            f.write(json.dumps(question_dict(i, rng)))
+        f.write("\n]\n")
+
+
+def write_results(path, count, seed=0, days=365):
+    """Write a results.jsonl style history with `count` synthetic results"""
+    rng = random.Random(seed)
+    with open(path, "w", encoding="utf-8") as f:
+        for i in range(count):
+            total = 10
+            score = rng.randint(0, total)
+            seconds = rng.randint(5, 900)
+            day = 1 + (i * days // count)
+            f.write(json.dumps({
+                "timestamp": f"2024-{1 + (day - 1) // 31 % 12:02d}-{1 + (day - 1) % 28:02d} "
+                             f"{rng.randrange(24):02d}:{rng.randrange(60):02d}:{rng.randrange(60):02d}",
+                "score": score,
+                "total": total,
+                "percentage": round(score / total * 100, 1),
+                "time_taken": f"{seconds // 60}m {seconds % 60}s"
+            }))
+            f.write("\n")
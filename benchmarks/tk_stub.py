@@ -0,0 +1,205 @@
+# Stand-in for tkinter so the GUI can be benchmarked without a display.
+# Widgets keep their options in dicts and every Tk operation bumps a
+# command counter, so a run measures the Python side of rendering (what
+# gui_quiz.py does per question) rather than X11 drawing. Use a real Tk
+# under Xvfb to include drawing.
+import sys
+import time
+import types
+
+BOTH, BOTTOM, LEFT, RIGHT, TOP, CENTER, X, Y = "both", "bottom", "left", "right", "top", "center", "x", "y"
+FLAT, RAISED, SUNKEN, GROOVE, RIDGE = "flat", "raised", "sunken", "groove", "ridge"
+
+
+class TclError(Exception):
+    pass
+
+
+class _Interpreter:
+    def __init__(self):
+        self.commands = 0
+
+    def call(self, *args):
+        if args[:2] == ("info", "cmdcount"):
+            return self.commands
+        return ""
+
+
+class Misc:
+    def __init__(self, master=None, **options):
+        self.master = master
+        self.options = options
+        self.children = []
+        self.bindings = {}
+        if master is not None:
+            master.children.append(self)
+            self.tk = master.tk
+            self._root = master._root
+        else:
+            self.tk = _Interpreter()
+            self._root = self
+        self.tk.commands += 1
+
+    def _command(self):
+        self.tk.commands += 1
+
+    def pack(self, **options):
+        self._command()
+
+    def pack_forget(self):
+        self._command()
+
+    def grid(self, **options):
+        self._command()
+
+    def grid_rowconfigure(self, *args, **options):
+        self._command()
+
+    def grid_columnconfigure(self, *args, **options):
+        self._command()
+
+    def config(self, **options):
+        self._command()
+        self.options.update(options)
+
+    configure = config
+
+    def cget(self, key):
+        return self.options.get(key)
+
+    def bind(self, sequence, func):
+        self._command()
+        self.bindings[sequence] = func
+
+    def event_generate(self, sequence, **options):
+        self._command()
+        if sequence in self.bindings:
+            self.bindings[sequence](types.SimpleNamespace(**options))
+
+    def winfo_children(self):
+        return list(self.children)
+
+    def destroy(self):
+        self._command()
+
+    def focus_set(self):
+        pass
+
+    def after(self, ms, func=None, *args):
+        return self._root._schedule(ms, func, args)
+
+    def after_idle(self, func, *args):
+        return self._root._schedule(0, func, args)
+
+    def after_cancel(self, job):
+        self._root._jobs.pop(job, None)
+
+    def update_idletasks(self):
+        self._command()
+
+    def update(self):
+        self._root._run_due()
+
+
+class Tk(Misc):
+    def __init__(self, *args, **kwargs):
+        super().__init__(None)
+        self._jobs = {}
+        self._next_job = 0
+
+    def title(self, *args):
+        self._command()
+
+    def geometry(self, *args):
+        self._command()
+
+    def resizable(self, *args):
+        self._command()
+
+    def _schedule(self, ms, func, args):
+        self._next_job += 1
+        self._jobs[self._next_job] = (time.monotonic() + ms / 1000, func, args)
+        return self._next_job
+
+    def _run_due(self):
+        now = time.monotonic()
+        for job in sorted(self._jobs, key=lambda j: self._jobs[j][0]):
+            entry = self._jobs.get(job)
+            if entry is not None and entry[0] <= now:
+                del self._jobs[job]
+                entry[1](*entry[2])
+
+    def mainloop(self):
+        while self._jobs:
+            self._run_due()
+            time.sleep(0.001)
+
+
+class Frame(Misc):
+    pass
+
+
+class Label(Misc):
+    pass
+
+
+class Button(Misc):
+    pass
+
+
+class Canvas(Misc):
+    def __init__(self, master=None, **options):
+        super().__init__(master, **options)
+        self.items = {}
+
+    def _create(self, options):
+        self._command()
+        self.items[len(self.items) + 1] = dict(options)
+        return len(self.items)
+
+    def create_polygon(self, *coords, **options):
+        return self._create(options)
+
+    def create_text(self, *coords, **options):
+        return self._create(options)
+
+    def create_rectangle(self, *coords, **options):
+        return self._create(options)
+
+    def itemconfig(self, item, **options):
+        self._command()
+        self.items[item].update(options)
+
+    itemconfigure = itemconfig
+
+    def itemcget(self, item, key):
+        return self.items[item].get(key)
+
+    def tag_bind(self, *args):
+        self._command()
+
+
+class Font:
+    def __init__(self, root=None, **options):
+        self.options = options
+
+
+def _dialog(*args, **kwargs):
+    return "ok"
+
+
+def install():
+    """Register the stub as tkinter (and its submodules) in sys.modules"""
+    tkinter = types.ModuleType("tkinter")
+    for name, value in dict(globals()).items():
+        if not name.startswith("_") and name not in ("install", "sys", "time", "types"):
+            setattr(tkinter, name, value)
+    font = types.ModuleType("tkinter.font")
+    font.Font = Font
+    messagebox = types.ModuleType("tkinter.messagebox")
+    messagebox.showinfo = messagebox.showerror = messagebox.showwarning = _dialog
+    ttk = types.ModuleType("tkinter.ttk")
+    ttk.Frame, ttk.Label, ttk.Button = Frame, Label, Button
+    tkinter.font, tkinter.messagebox, tkinter.ttk = font, messagebox, ttk
+    sys.modules.update({"tkinter": tkinter, "tkinter.font": font,
+                        "tkinter.messagebox": messagebox, "tkinter.ttk": ttk})
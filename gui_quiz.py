@@ -1,370 +1,579 @@
-import tkinter as tk
-from tkinter import messagebox, ttk
-import json
-import random
-import time
-from datetime import datetime
-from tkinter import font as tkfont
-
-class QuizGUI:
-    def __init__(self, master):
-        self.master = master
-        self.master.title("Quiz")
-        self.master.configure(bg="#000000")
-        self.master.geometry("900x650")
-        self.master.resizable(False, False)
-
-        # Custom fonts
-        self.title_font = tkfont.Font(family="Arial", size=44, weight="bold")
-        self.stats_font = tkfont.Font(family="Arial", size=20, weight="bold")
-        self.feedback_font = tkfont.Font(family="Arial", size=18, weight="bold")
-        self.button_font = tkfont.Font(family="Arial", size=16, weight="bold")
-        self.option_font = tkfont.Font(family="Arial", size=16, weight="bold")
-        self.question_font = tkfont.Font(family="Arial", size=20, weight="bold")
-
-        # Quiz state
-        self.questions = []
-        self.current_question = 0
-        self.score = 0
-        self.total_questions = 0
-        self.start_time = None
-        self.end_time = None
-        self.timer_label = None
-        self.timer_running = False
-        self.answered = False
-
-        self.load_questions()
-        self.start_quiz()
-
-    def load_questions(self):
-        """Load questions from JSON file"""
-        try:
-            with open("questions.json", "r") as f:
-                self.questions = json.load(f)
-            self.total_questions = len(self.questions)
-            random.shuffle(self.questions)  # Shuffle questions
-        except FileNotFoundError:
-            messagebox.showerror("Error", "questions.json file not found!")
-            self.master.destroy()
-        except json.JSONDecodeError:
-            messagebox.showerror("Error", "Invalid JSON format in questions.json!")
-            self.master.destroy()
-
-    def start_quiz(self):
-        """Start the quiz"""
-        self.current_question = 0
-        self.score = 0
-        self.start_time = time.time()
-        self.show_question_ui()
-        self.display_question()
-        self.timer_running = True
-        self.update_timer()
-
-    def show_question_ui(self):
-        for widget in self.master.winfo_children():
-            widget.destroy()
-        # Title
-        self.title_label = tk.Label(
-            self.master,
-            text="Quiz",
-            font=self.title_font,
-            fg="white",
-            bg="#000000"
-        )
-        self.title_label.pack(pady=(30, 20))
-        # Rounded question box using Canvas
-        self.canvas = tk.Canvas(self.master, width=800, height=120, bg="#000000", highlightthickness=0)
-        self.canvas.pack(pady=(0, 40))
-        self.rounded_box = self._draw_rounded_rect(self.canvas, 0, 0, 800, 120, radius=40, fill="#151515")
-        # Question text in the center
-        self.question_text = self.canvas.create_text(
-            400, 60,
-            text="",
-            font=self.question_font,
-            fill="white",
-            justify="center",
-            width=700
-        )
-        # Option canvases (2x2 grid)
-        self.options_frame = tk.Frame(self.master, bg="#000000")
-        self.options_frame.pack(pady=(0, 0))
-        self.option_canvases = []
-        for row in range(2):
-            for col in range(2):
-                c = tk.Canvas(self.options_frame, width=340, height=70, bg="#000000", highlightthickness=0, bd=0)
-                c.grid(row=row, column=col, padx=30, pady=15)
-                # Draw rounded rectangle and text
-                rect = self._draw_rounded_rect(c, 0, 0, 340, 70, radius=35, fill="#222222")
-                text = c.create_text(170, 35, text="choose", font=self.option_font, fill="white", width=300)
-                self.option_canvases.append((c, rect, text))
-        for i in range(2):
-            self.options_frame.grid_rowconfigure(i, weight=1)
-            self.options_frame.grid_columnconfigure(i, weight=1)
-        # Timer label at the bottom
-        self.timer_label = tk.Label(self.master, text="Time: 00:00", font=self.button_font, fg="white", bg="#000000")
-        self.timer_label.pack(side=tk.BOTTOM, pady=(0, 10))
-
-    def _draw_rounded_rect(self, canvas, x1, y1, x2, y2, radius=25, **kwargs):
-        points = [
-            x1+radius, y1,
-            x2-radius, y1,
-            x2, y1,
-            x2, y1+radius,
-            x2, y2-radius,
-            x2, y2,
-            x2-radius, y2,
-            x1+radius, y2,
-            x1, y2,
-            x1, y2-radius,
-            x1, y1+radius,
-            x1, y1
-        ]
-        return canvas.create_polygon(points, smooth=True, splinesteps=36, **kwargs)
-
-    def update_timer(self):
-        if self.timer_running and self.start_time is not None:
-            elapsed = int(time.time() - self.start_time)
-            minutes = elapsed // 60
-            seconds = elapsed % 60
-            if self.timer_label:
-                self.timer_label.config(text=f"Time: {minutes:02d}:{seconds:02d}")
-            self.master.after(1000, self.update_timer)
-
-    def display_question(self):
-        """Display the current question"""
-        self.answered = False
-        if self.current_question < self.total_questions:
-            question = self.questions[self.current_question]
-            
-            # Display question
-            self.canvas.itemconfig(self.question_text, text=question['question'])
-            
-            # Display options
-            for i, (c, rect, text) in enumerate(self.option_canvases):
-                c.itemconfig(rect, fill="#222222")
-                c.itemconfig(text, text=question['options'][i] if i < len(question['options']) else "choose", fill="white")
-                c.tag_bind(rect, '<Button-1>', lambda e, idx=i: self.check_answer(idx))
-                c.tag_bind(text, '<Button-1>', lambda e, idx=i: self.check_answer(idx))
-                c.tag_bind(rect, '<Enter>', lambda e, idx=i: self._on_option_hover(idx, True))
-                c.tag_bind(text, '<Enter>', lambda e, idx=i: self._on_option_hover(idx, True))
-                c.tag_bind(rect, '<Leave>', lambda e, idx=i: self._on_option_hover(idx, False))
-                c.tag_bind(text, '<Leave>', lambda e, idx=i: self._on_option_hover(idx, False))
-                c.config(cursor="hand2")
-                c.bind('<Button-1>', lambda e, idx=i: self.check_answer(idx))
-                c.bind('<Enter>', lambda e, idx=i: self._on_option_hover(idx, True))
-                c.bind('<Leave>', lambda e, idx=i: self._on_option_hover(idx, False))
-                c.state = "normal"
-        else:
-            self.show_result()
-
-    def _on_option_hover(self, idx, entering):
-        c, rect, text = self.option_canvases[idx]
-        if c.state == "disabled":
-            return
-        if entering:
-            c.itemconfig(rect, fill="#333333")
-        else:
-            c.itemconfig(rect, fill="#222222")
-
-    def check_answer(self, idx):
-        """Check if the selected answer is correct"""
-        if self.answered:
-            return
-        self.answered = True
-        question = self.questions[self.current_question]
-        selected_answer = question['options'][idx]
-        correct_answer = question['answer']
-        
-        # Disable all buttons temporarily
-        for c, rect, text in self.option_canvases:
-            c.state = "disabled"
-        
-        if selected_answer == correct_answer:
-            self.score += 1
-            # Show correct feedback
-            for c, rect, text in self.option_canvases:
-                c.itemconfig(rect, fill="#27ae60")
-            messagebox.showinfo("Correct!", "✅ Well done! That's correct!")
-        else:
-            # Show incorrect feedback
-            for c, rect, text in self.option_canvases:
-                c.itemconfig(rect, fill="#e74c3c")
-            messagebox.showinfo("Incorrect", f"❌ Wrong! The correct answer is: {correct_answer}")
-        
-        # Reset button colors and enable them
-        for c, rect, text in self.option_canvases:
-            c.itemconfig(rect, fill="#222222")
-            c.state = "normal"
-        
-        self.master.after(900, self._after_feedback)
-
-    def _after_feedback(self):
-        self.current_question += 1
-        if self.current_question < self.total_questions:
-            self.display_question()
-        else:
-            self.end_time = time.time()
-            self.timer_running = False
-            self.show_result()
-
-    def show_result(self):
-        """Display final results"""
-        self.end_time = time.time()
-        time_taken = int(self.end_time - self.start_time)
-        minutes = time_taken // 60
-        seconds = time_taken % 60
-        
-        percentage = (self.score / self.total_questions) * 100
-        
-        # Clear the main frame
-        for widget in self.master.winfo_children():
-            widget.destroy()
-        
-        # Create results display
-        results_frame = tk.Frame(self.master, bg='#000000')
-        results_frame.pack(fill=tk.BOTH, expand=True)
-        
-        # Results title
-        tk.Label(
-            results_frame,
-            text="🎉 Quiz Completed! 🎉",
-            font=self.title_font,
-            fg="white",
-            bg='#000000'
-        ).pack(pady=(50, 30))
-        
-        # Results details
-        results_text = f"""
-🗂️  Final Score: {self.score}/{self.total_questions}
-📋 Percentage: {percentage:.1f}%
-⏰ Time Taken: {minutes}m {seconds}s
-        """
-        
-        tk.Label(
-            results_frame,
-            text=results_text,
-            font=self.stats_font,
-            fg='white',
-            bg='#000000',
-            justify=tk.CENTER
-        ).pack(pady=(0, 30))
-        
-        # Performance feedback
-        if percentage >= 90:
-            feedback = ("🏆 Excellent! Outstanding performance!", "#27ae60")
-        elif percentage >= 80:
-            feedback = ("🎯 Great job! Well done!", "#27ae60")
-        elif percentage >= 70:
-            feedback = ("👍 Good work! Keep it up!", "#27ae60")
-        elif percentage >= 60:
-            feedback = ("📚 Not bad! Room for improvement.", "#27ae60")
-        else:
-            feedback = ("📖 Keep studying! Practice makes perfect!", "#e67e22")
-        
-        feedback_label = tk.Label(
-            results_frame,
-            text=feedback[0],
-            font=self.feedback_font,
-            fg=feedback[1],
-            bg='#000000'
-        )
-        feedback_label.pack(pady=(0, 30))
-        
-        # Buttons frame
-        buttons_frame = tk.Frame(results_frame, bg='#000000')
-        buttons_frame.pack()
-        
-        # Play again button
-        play_btn = tk.Button(
-            buttons_frame,
-            text="🗂️ Play Again",
-            font=self.button_font,
-            fg="white",
-            bg="#2196f3",
-            activebackground="#1976d2",
-            width=14,
-            height=2,
-            bd=0,
-            relief=tk.FLAT,
-            cursor="hand2",
-            command=self.start_quiz
-        )
-        play_btn.pack(side=tk.LEFT, padx=10)
-        
-        # Save results button
-        save_btn = tk.Button(
-            buttons_frame,
-            text="💾 Save Results",
-            font=self.button_font,
-            fg="white",
-            bg="#27ae60",
-            activebackground="#219150",
-            width=14,
-            height=2,
-            bd=0,
-            relief=tk.FLAT,
-            cursor="hand2",
-            command=self.save_results
-        )
-        save_btn.pack(side=tk.LEFT, padx=10)
-        
-        # Exit button
-        exit_btn = tk.Button(
-            buttons_frame,
-            text="🛑 Exit",
-            font=self.button_font,
-            fg="white",
-            bg="#e74c3c",
-            activebackground="#c0392b",
-            width=14,
-            height=2,
-            bd=0,
-            relief=tk.FLAT,
-            cursor="hand2",
-            command=self.master.destroy
-        )
-        exit_btn.pack(side=tk.LEFT, padx=10)
-
-    def save_results(self):
-        """Save quiz results to file"""
-        try:
-            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            percentage = (self.score / self.total_questions) * 100
-            time_taken = int(self.end_time - self.start_time)
-            minutes = time_taken // 60
-            seconds = time_taken % 60
-            
-            result_entry = {
-                "timestamp": timestamp,
-                "score": self.score,
-                "total": self.total_questions,
-                "percentage": round(percentage, 1),
-                "time_taken": f"{minutes}m {seconds}s"
-            }
-            
-            # Load existing results or create new list
-            try:
-                with open("results.txt", "r") as f:
-                    results = json.load(f)
-            except (FileNotFoundError, json.JSONDecodeError):
-                results = []
-            
-            results.append(result_entry)
-            
-            # Save updated results
-            with open("results.txt", "w") as f:
-                json.dump(results, f, indent=2)
-            
-            messagebox.showinfo("Success", "💾 Results saved to results.txt!")
-            
-        except Exception as e:
-            messagebox.showerror("Error", f"Could not save results: {e}")
-
-def main():
-    """Main function to start the GUI quiz app"""
-    root = tk.Tk()
-    app = QuizGUI(root)
-    root.mainloop()
-
-if __name__ == "__main__":
+import tkinter as tk
+import argparse
+import json
+import threading
+import time
+from metrics import Metrics, instrument, metrics_path, profiling
+from question_bank import BankWatcher, draw_questions
+from question_stats import open_stats
+from quiz_engine import PASS_PERCENTAGE, QuizSession, chain_answers, feedback_for, format_time_taken, positive_int
+from storage import BACKENDS, DATABASE_FILE, FileStorage, open_storage
+
+WATCH_MS = 1000  # how often --watch checks questions.json for changes
+LOAD_POLL_MS = 20  # how often --fast-start checks whether the questions have loaded
+
+class QuizGUI:
+    def __init__(self, master, num_questions=None, seed=None, render_stats=False, feedback_ms=900,
+                 metrics=None, storage=None, filters=None, user=None, watch=False, fast_start=False):
+        self.master = master
+        if metrics is not None:
+            instrument(self, metrics)
+        self.num_questions = num_questions
+        self.seed = seed
+        self.storage = storage or FileStorage()
+        # category / difficulty / tags to draw from
+        self.filters = filters or {}
+        # Whose review history picks the questions; None draws them at random
+        self.user = user
+        # Reload questions.json when it changes, between sessions
+        self.watch = watch
+        self.watcher = None
+        # How long answer feedback stays on screen before the next question
+        self.feedback_ms = feedback_ms
+        self.master.title("Quiz")
+        self.master.configure(bg="#000000")
+        self.master.geometry("900x650")
+        self.master.resizable(False, False)
+
+        # Custom fonts, as descriptions Tk resolves when a widget first uses
+        # them rather than named font objects created up front
+        self.title_font = ("Arial", 44, "bold")
+        self.stats_font = ("Arial", 20, "bold")
+        self.feedback_font = ("Arial", 18, "bold")
+        self.button_font = ("Arial", 16, "bold")
+        self.option_font = ("Arial", 16, "bold")
+        self.question_font = ("Arial", 20, "bold")
+
+        # Quiz state
+        self.questions = []
+        self.order = []
+        self.session = None
+        self.stats = None
+        self.reviews = None
+        self.total_questions = 0
+        self.timer_label = None
+        self.timer_running = False
+        self.timer_job = None
+        # (seconds, Tcl commands) per rendered question, when instrumented
+        self.render_stats = [] if render_stats else None
+        # Seconds from an answer click to the next question being drawn
+        self.answer_latencies = [] if render_stats else None
+        self.answered_at = None
+
+        # Build both screens once; later questions only update text and colors
+        self.build_question_ui()
+        self.build_result_ui()
+        if fast_start:
+            # The window comes up at once; the questions load on a worker thread
+            self.load_in_background()
+        else:
+            error = None
+            try:
+                self.load_questions()
+            except (FileNotFoundError, ValueError) as e:  # includes invalid JSON
+                error = e
+            if self.loaded(error):
+                self.start_quiz()
+
+    def load_questions(self):
+        """Load questions from the configured storage
+        
+        Touches no widgets, so it can run off the Tk thread; errors are
+        raised for loaded() to report.
+        """
+        if self.watch:
+            self.watcher = BankWatcher(self.storage.questions_path)
+            self.questions = self.watcher.current
+        else:
+            self.questions = self.storage.open_bank()
+        self.stats = open_stats()
+        if self.user:
+            from scheduler import open_reviews
+            self.reviews = open_reviews(self.user)
+        # Draw positions only; questions are parsed as they are shown
+        self.order = draw_questions(self.questions, self.num_questions, self.seed, **self.filters)
+        self.total_questions = len(self.order)
+
+    def loaded(self, error=None):
+        """Finish loading on the Tk thread; returns False if the window was closed over an error
+
+        Also reports a question found to be invalid when it is shown.
+        """
+        if error is None and not self.order and any(self.filters.values()):
+            message = "No questions match the chosen category, difficulty and tags!"
+        elif error is None:
+            if self.watcher is not None:
+                self.master.after(WATCH_MS, self.check_for_changes)
+            return True
+        elif isinstance(error, FileNotFoundError):
+            message = "questions.json file not found!"
+        elif isinstance(error, json.JSONDecodeError):
+            message = "Invalid JSON format in questions.json!"
+        elif isinstance(error, ValueError):
+            message = f"Invalid question bank: {error}"
+        else:
+            raise error
+        from tkinter import messagebox
+        messagebox.showerror("Error", message)
+        self.master.destroy()
+        return False
+
+    def load_in_background(self):
+        """Show the question screen now and start the quiz once a worker thread has loaded the bank"""
+        self.show_question_ui()
+        self.canvas.itemconfig(self.question_text, text="Loading questions...")
+        outcome = []
+
+        def work():
+            try:
+                self.load_questions()
+                outcome.append(None)
+            except Exception as e:
+                outcome.append(e)
+        threading.Thread(target=work, daemon=True).start()
+        self.master.after(LOAD_POLL_MS, self._wait_for_questions, outcome)
+
+    def _wait_for_questions(self, outcome):
+        # Tk may only be used from its own thread, so poll rather than call back from the worker
+        if not outcome:
+            self.master.after(LOAD_POLL_MS, self._wait_for_questions, outcome)
+        elif self.loaded(outcome[0]):
+            self.start_quiz()
+
+    def check_for_changes(self):
+        """Pick up edits to questions.json; the quiz in progress keeps the questions it started with
+
+        The file is read and re-scanned on a worker thread, so a large bank
+        never freezes the window; the next check is scheduled once it ends.
+        """
+        outcome = []
+
+        def work():
+            try:
+                if self.watcher.poll():
+                    questions = self.watcher.current
+                    outcome.append((questions, draw_questions(questions, self.num_questions, self.seed,
+                                                              **self.filters)))
+                else:
+                    outcome.append(None)
+            except (OSError, ValueError) as e:  # includes invalid JSON
+                print(f"⚠️  Kept the previous questions, {self.watcher.path} could not be reloaded: {e}")
+                outcome.append(None)
+        threading.Thread(target=work, daemon=True).start()
+        self.master.after(LOAD_POLL_MS, self._wait_for_changes, outcome)
+
+    def _wait_for_changes(self, outcome):
+        # As with loading, only the Tk thread swaps in the reloaded questions
+        if not outcome:
+            self.master.after(LOAD_POLL_MS, self._wait_for_changes, outcome)
+            return
+        if outcome[0] is not None:
+            self.questions, self.order = outcome[0]
+            self.total_questions = len(self.order)
+            print(f"🔄 Reloaded {len(self.questions)} questions; they are used from the next quiz")
+        self.master.after(WATCH_MS, self.check_for_changes)
+
+    def start_quiz(self):
+        """Start the quiz"""
+        on_answer = chain_answers(self.stats.record if self.stats else None,
+                                  self.reviews.record if self.reviews else None)
+        # With a review history, _after_feedback's next question is picked
+        # from the due-time heap as the session reaches it
+        order = self.reviews.queue(self.questions, self.num_questions, self.seed, **self.filters) \
+            if self.reviews else self.order
+        self.session = QuizSession(self.questions, order, on_answer=on_answer)
+        self.session.start()
+        self.answered_at = None
+        self.show_question_ui()
+        self.timer_running = True
+        if self.timer_job is not None:
+            self.master.after_cancel(self.timer_job)
+        self.update_timer()
+        # Last, as an invalid first question closes the window
+        self.display_question()
+
+    def show_question_ui(self):
+        self.result_frame.pack_forget()
+        self.question_frame.pack(fill=tk.BOTH, expand=True)
+
+    def build_question_ui(self):
+        """Create the question screen and its event bindings, once"""
+        self.question_frame = tk.Frame(self.master, bg="#000000")
+        # Title
+        self.title_label = tk.Label(
+            self.question_frame,
+            text="Quiz",
+            font=self.title_font,
+            fg="white",
+            bg="#000000"
+        )
+        self.title_label.pack(pady=(30, 20))
+        # Rounded question box using Canvas
+        self.canvas = tk.Canvas(self.question_frame, width=800, height=120, bg="#000000", highlightthickness=0)
+        self.canvas.pack(pady=(0, 40))
+        self.rounded_box = self._draw_rounded_rect(self.canvas, 0, 0, 800, 120, radius=40, fill="#151515")
+        # Question text in the center
+        self.question_text = self.canvas.create_text(
+            400, 60,
+            text="",
+            font=self.question_font,
+            fill="white",
+            justify="center",
+            width=700
+        )
+        # Option canvases (2x2 grid)
+        self.options_frame = tk.Frame(self.question_frame, bg="#000000")
+        self.options_frame.pack(pady=(0, 0))
+        self.option_canvases = []
+        for row in range(2):
+            for col in range(2):
+                c = tk.Canvas(self.options_frame, width=340, height=70, bg="#000000", highlightthickness=0, bd=0)
+                c.grid(row=row, column=col, padx=30, pady=15)
+                # Draw rounded rectangle and text
+                rect = self._draw_rounded_rect(c, 0, 0, 340, 70, radius=35, fill="#222222")
+                text = c.create_text(170, 35, text="choose", font=self.option_font, fill="white", width=300)
+                # Canvas-level bindings also fire for the items drawn on it
+                idx = len(self.option_canvases)
+                c.config(cursor="hand2")
+                c.bind('<Button-1>', lambda e, idx=idx: self.check_answer(idx))
+                c.bind('<Enter>', lambda e, idx=idx: self._on_option_hover(idx, True))
+                c.bind('<Leave>', lambda e, idx=idx: self._on_option_hover(idx, False))
+                c.state = "normal"
+                self.option_canvases.append((c, rect, text))
+        for i in range(2):
+            self.options_frame.grid_rowconfigure(i, weight=1)
+            self.options_frame.grid_columnconfigure(i, weight=1)
+        # Inline answer feedback, so answering never blocks on a dialog
+        self.feedback_text = tk.Label(self.question_frame, text="", font=self.feedback_font, fg="white", bg="#000000")
+        self.feedback_text.pack(pady=(10, 0))
+        # Timer label at the bottom
+        self.timer_label = tk.Label(self.question_frame, text="Time: 00:00", font=self.button_font, fg="white", bg="#000000")
+        self.timer_label.pack(side=tk.BOTTOM, pady=(0, 10))
+
+    def _draw_rounded_rect(self, canvas, x1, y1, x2, y2, radius=25, **kwargs):
+        points = [
+            x1+radius, y1,
+            x2-radius, y1,
+            x2, y1,
+            x2, y1+radius,
+            x2, y2-radius,
+            x2, y2,
+            x2-radius, y2,
+            x1+radius, y2,
+            x1, y2,
+            x1, y2-radius,
+            x1, y1+radius,
+            x1, y1
+        ]
+        return canvas.create_polygon(points, smooth=True, splinesteps=36, **kwargs)
+
+    def update_timer(self):
+        if self.timer_running and self.session is not None:
+            elapsed_ns = self.session.elapsed_ns()
+            elapsed = elapsed_ns // 1_000_000_000
+            minutes = elapsed // 60
+            seconds = elapsed % 60
+            if self.timer_label:
+                self.timer_label.config(text=f"Time: {minutes:02d}:{seconds:02d}")
+            # Wake up just after the next whole second of quiz time rather than
+            # a fixed 1000ms later, so callback lateness never accumulates
+            delay_ms = (1_000_000_000 - elapsed_ns % 1_000_000_000) // 1_000_000 + 1
+            self.timer_job = self.master.after(delay_ms, self.update_timer)
+        else:
+            self.timer_job = None
+
+    def display_question(self):
+        """Display the current question"""
+        if not self.session.finished:
+            if self.render_stats is not None:
+                started = time.perf_counter()
+                commands = self._tcl_command_count()
+            try:
+                question = self.session.question
+            except ValueError as e:  # questions are only parsed as they are shown
+                self.timer_running = False
+                if self.timer_job is not None:
+                    self.master.after_cancel(self.timer_job)
+                    self.timer_job = None
+                self.loaded(e)
+                return
+            
+            # Display question
+            self.canvas.itemconfig(self.question_text, text=question.text)
+            self.feedback_text.config(text="")
+            
+            # Display options
+            for i, (c, rect, text) in enumerate(self.option_canvases):
+                c.itemconfig(rect, fill="#222222")
+                c.itemconfig(text, text=question.options[i] if i < len(question.options) else "choose")
+                c.state = "normal"
+            
+            if self.render_stats is not None:
+                # Include the redraw itself, not just queuing it
+                self.master.update_idletasks()
+                self.render_stats.append((time.perf_counter() - started,
+                                          self._tcl_command_count() - commands))
+                if self.answered_at is not None:
+                    self.answer_latencies.append(time.perf_counter() - self.answered_at)
+                    self.answered_at = None
+        else:
+            self.show_result()
+
+    def _tcl_command_count(self):
+        return int(self.master.tk.call("info", "cmdcount"))
+
+    def render_summary(self):
+        """Per-question render cost so far, or None when not instrumented"""
+        if not self.render_stats:
+            return None
+        times = sorted(seconds for seconds, _ in self.render_stats)
+        commands = [count for _, count in self.render_stats]
+        summary = {
+            "questions": len(times),
+            "median_ms": times[len(times) // 2] * 1000,
+            "max_ms": times[-1] * 1000,
+            "mean_tcl_commands": sum(commands) / len(commands),
+            "max_tcl_commands": max(commands)
+        }
+        if self.answer_latencies:
+            # Time on top of the configured feedback delay
+            overheads = sorted(latency * 1000 - self.feedback_ms for latency in self.answer_latencies)
+            summary["answer_overhead_median_ms"] = overheads[len(overheads) // 2]
+            summary["answer_overhead_max_ms"] = overheads[-1]
+        return summary
+
+    def _on_option_hover(self, idx, entering):
+        c, rect, text = self.option_canvases[idx]
+        if c.state == "disabled":
+            return
+        if entering:
+            c.itemconfig(rect, fill="#333333")
+        else:
+            c.itemconfig(rect, fill="#222222")
+
+    def check_answer(self, idx):
+        """Check if the selected answer is correct"""
+        if self.session is None or self.session.answered:  # still loading, or already answered
+            return
+        if self.answer_latencies is not None:
+            self.answered_at = time.perf_counter()
+        question = self.session.question
+        
+        # Disable all buttons until the next question is shown
+        for c, rect, text in self.option_canvases:
+            c.state = "disabled"
+        
+        if self.session.answer(idx):
+            # Show correct feedback
+            for c, rect, text in self.option_canvases:
+                c.itemconfig(rect, fill="#27ae60")
+            self.feedback_text.config(text="✅ Well done! That's correct!", fg="#27ae60")
+        else:
+            # Show incorrect feedback
+            for c, rect, text in self.option_canvases:
+                c.itemconfig(rect, fill="#e74c3c")
+            self.feedback_text.config(text=f"❌ Wrong! The correct answer is: {question.answer}", fg="#e74c3c")
+        
+        # display_question resets the colors and enables the options again
+        self.master.after(self.feedback_ms, self._after_feedback)
+
+    def _after_feedback(self):
+        if self.session.next():
+            self.display_question()
+        else:
+            self.timer_running = False
+            self.show_result()
+
+    def show_result(self):
+        """Display final results"""
+        session = self.session
+        session.finish()
+        
+        # Results details
+        self.results_label.config(text=f"""
+🗂️  Final Score: {session.score}/{session.total}
+📋 Percentage: {session.percentage:.1f}%
+⏰ Time Taken: {format_time_taken(session.elapsed())}
+        """)
+        
+        # Performance feedback
+        feedback_color = "#27ae60" if session.percentage >= PASS_PERCENTAGE else "#e67e22"
+        self.feedback_label.config(text=feedback_for(session.percentage), fg=feedback_color)
+        
+        self.question_frame.pack_forget()
+        self.result_frame.pack(fill=tk.BOTH, expand=True)
+
+    def build_result_ui(self):
+        """Create the results screen, once"""
+        results_frame = self.result_frame = tk.Frame(self.master, bg='#000000')
+        
+        # Results title
+        tk.Label(
+            results_frame,
+            text="🎉 Quiz Completed! 🎉",
+            font=self.title_font,
+            fg="white",
+            bg='#000000'
+        ).pack(pady=(50, 30))
+        
+        # Results details
+        self.results_label = tk.Label(
+            results_frame,
+            text="",
+            font=self.stats_font,
+            fg='white',
+            bg='#000000',
+            justify=tk.CENTER
+        )
+        self.results_label.pack(pady=(0, 30))
+        
+        # Performance feedback
+        self.feedback_label = tk.Label(
+            results_frame,
+            text="",
+            font=self.feedback_font,
+            fg="#27ae60",
+            bg='#000000'
+        )
+        self.feedback_label.pack(pady=(0, 30))
+        
+        # Buttons frame
+        buttons_frame = tk.Frame(results_frame, bg='#000000')
+        buttons_frame.pack()
+        
+        # Play again button
+        play_btn = tk.Button(
+            buttons_frame,
+            text="🗂️ Play Again",
+            font=self.button_font,
+            fg="white",
+            bg="#2196f3",
+            activebackground="#1976d2",
+            width=14,
+            height=2,
+            bd=0,
+            relief=tk.FLAT,
+            cursor="hand2",
+            command=self.start_quiz
+        )
+        play_btn.pack(side=tk.LEFT, padx=10)
+        
+        # Save results button
+        save_btn = tk.Button(
+            buttons_frame,
+            text="💾 Save Results",
+            font=self.button_font,
+            fg="white",
+            bg="#27ae60",
+            activebackground="#219150",
+            width=14,
+            height=2,
+            bd=0,
+            relief=tk.FLAT,
+            cursor="hand2",
+            command=self.save_results
+        )
+        save_btn.pack(side=tk.LEFT, padx=10)
+        
+        # Exit button
+        exit_btn = tk.Button(
+            buttons_frame,
+            text="🛑 Exit",
+            font=self.button_font,
+            fg="white",
+            bg="#e74c3c",
+            activebackground="#c0392b",
+            width=14,
+            height=2,
+            bd=0,
+            relief=tk.FLAT,
+            cursor="hand2",
+            command=self.master.destroy
+        )
+        exit_btn.pack(side=tk.LEFT, padx=10)
+
+    def save_results(self):
+        """Save quiz results to file"""
+        from tkinter import messagebox
+        try:
+            result_entry = self.session.result()
+            
+            with self.storage.open_results() as store:
+                store.append(result_entry)
+            
+            messagebox.showinfo("Success", f"💾 Results saved to {self.storage.results_location}!")
+            
+        except Exception as e:
+            messagebox.showerror("Error", f"Could not save results: {e}")
+
+def main():
+    """Main function to start the GUI quiz app"""
+    parser = argparse.ArgumentParser(description="Tkinter quiz")
+    parser.add_argument("-n", "--num-questions", type=positive_int, help="questions per session (default: all)")
+    parser.add_argument("--seed", type=int, help="seed for a reproducible question draw")
+    parser.add_argument("--category", help="only ask questions from this category")
+    parser.add_argument("--difficulty", help="only ask questions of this difficulty, e.g. hard")
+    parser.add_argument("--tag", dest="tags", action="append", default=[],
+                        help="only ask questions with this tag (repeat to require several)")
+    parser.add_argument("--adaptive", action="store_true",
+                        help="ask due and unseen questions first, by spaced repetition of your past answers")
+    parser.add_argument("--user", help="whose review history --adaptive uses (default: your login name)")
+    parser.add_argument("--watch", action="store_true",
+                        help="reload questions.json when it changes, without restarting; keeps the whole "
+                             "file and every question parsed so far in memory")
+    parser.add_argument("--fast-start", action="store_true",
+                        help="open the window at once and load the questions behind it")
+    parser.add_argument("--render-stats", action="store_true",
+                        help="print per-question render time and Tcl command counts on exit")
+    parser.add_argument("--feedback-ms", type=int, default=900,
+                        help="how long answer feedback is shown, in milliseconds (default: 900)")
+    parser.add_argument("--storage", choices=BACKENDS, default="file",
+                        help="read questions and save results from JSON files or a SQLite database")
+    parser.add_argument("--database", default=DATABASE_FILE, help="SQLite database for --storage sqlite")
+    parser.add_argument("--metrics", metavar="PATH",
+                        help="time load/render/answer/save into PATH (.prom for Prometheus text, else JSON)")
+    parser.add_argument("--profile", metavar="PATH", help="write cProfile stats for the session to PATH")
+    parser.add_argument("--tracemalloc", metavar="PATH", help="write the top memory allocations to PATH")
+    args = parser.parse_args()
+
+    try:
+        storage = open_storage(args.storage, args.database)
+    except ValueError as e:
+        print(f"❌ Error: {e}")
+        return
+    if args.watch and not isinstance(storage, FileStorage):
+        print("❌ Error: --watch only works with --storage file")
+        storage.close()
+        return
+    path = metrics_path(args.metrics)
+    metrics = Metrics() if path else None
+    user = None
+    if args.adaptive:
+        from scheduler import default_user
+        user = args.user or default_user()
+    root = tk.Tk()
+    try:
+        with profiling(args.profile, args.tracemalloc):
+            app = QuizGUI(root, args.num_questions, args.seed, render_stats=args.render_stats,
+                          feedback_ms=args.feedback_ms, metrics=metrics, storage=storage,
+                          filters={"category": args.category, "difficulty": args.difficulty,
+                                   "tags": tuple(args.tags)},
+                          user=user, watch=args.watch, fast_start=args.fast_start)
+            root.mainloop()
+    finally:
+        storage.close()
+    if metrics is not None:
+        metrics.write(path)
+        print(f"📏 Metrics written to {path}")
+    summary = app.render_summary()
+    if summary:
+        print(f"🖼️  Rendered {summary['questions']} questions: "
+              f"median {summary['median_ms']:.2f} ms, max {summary['max_ms']:.2f} ms, "
+              f"{summary['mean_tcl_commands']:.0f} Tcl commands on average "
+              f"(max {summary['max_tcl_commands']})")
+        if "answer_overhead_median_ms" in summary:
+            print(f"⏱️  Answer to next question: {summary['answer_overhead_median_ms']:.2f} ms median, "
+                  f"{summary['answer_overhead_max_ms']:.2f} ms max on top of the {args.feedback_ms} ms feedback")
+
+if __name__ == "__main__":
     main() 
\ No newline at end of file
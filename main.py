@@ -1,208 +1,368 @@
-import json
-import random
-import time
-from datetime import datetime
-
-class QuizApp:
-    def __init__(self):
-        self.questions = []
-        self.score = 0
-        self.total_questions = 0
-        self.start_time = None
-        self.end_time = None
-        
-    def load_questions(self):
-        """Load questions from JSON file"""
-        try:
-            with open("questions.json", "r") as f:
-                self.questions = json.load(f)
-            self.total_questions = len(self.questions)
-            print(f"✅ Loaded {self.total_questions} questions successfully!")
-        except FileNotFoundError:
-            print("❌ Error: questions.json file not found!")
-            return False
-        except json.JSONDecodeError:
-            print("❌ Error: Invalid JSON format in questions.json!")
-            return False
-        return True
-    
-    def shuffle_questions(self):
-        """Randomly shuffle the questions"""
-        random.shuffle(self.questions)
-        print("🔄 Questions shuffled!")
-    
-    def display_welcome(self):
-        """Display welcome message and instructions"""
-        print("=" * 60)
-        print("🎯 WELCOME TO THE QUIZ APP! 🎯")
-        print("=" * 60)
-        print("📝 Instructions:")
-        print("• You will be shown one question at a time")
-        print("• Choose the correct answer from the options (1-4)")
-        print("• Your score will be tracked throughout the quiz")
-        print("• At the end, you'll see your final score and time taken")
-        print("=" * 60)
-        input("Press Enter to start the quiz...")
-    
-    def display_question(self, question_data, question_num):
-        """Display a single question with options"""
-        print(f"\n{'='*50}")
-        print(f"Question {question_num}/{self.total_questions}")
-        print(f"{'='*50}")
-        print(f"❓ {question_data['question']}")
-        print()
-        
-        for idx, option in enumerate(question_data['options'], 1):
-            print(f"   {idx}. {option}")
-        print()
-    
-    def get_user_answer(self):
-        """Get and validate user input"""
-        while True:
-            try:
-                user_input = input("Your choice (1-4): ").strip()
-                choice = int(user_input)
-                if 1 <= choice <= 4:
-                    return choice
-                else:
-                    print("❌ Please enter a number between 1 and 4!")
-            except ValueError:
-                print("❌ Please enter a valid number!")
-    
-    def check_answer(self, question_data, user_choice):
-        """Check if the user's answer is correct"""
-        correct_answer = question_data['answer']
-        user_answer = question_data['options'][user_choice - 1]
-        
-        if user_answer == correct_answer:
-            print("✅ Correct! Well done!")
-            self.score += 1
-            return True
-        else:
-            print(f"❌ Wrong! The correct answer is: {correct_answer}")
-            return False
-    
-    def display_progress(self):
-        """Display current progress"""
-        percentage = (self.score / self.total_questions) * 100
-        print(f"\n📊 Progress: {self.score}/{self.total_questions} ({percentage:.1f}%)")
-    
-    def calculate_time_taken(self):
-        """Calculate time taken for the quiz"""
-        if self.start_time and self.end_time:
-            time_taken = self.end_time - self.start_time
-            minutes = int(time_taken // 60)
-            seconds = int(time_taken % 60)
-            return f"{minutes}m {seconds}s"
-        return "Unknown"
-    
-    def display_final_results(self):
-        """Display final results"""
-        print("\n" + "="*60)
-        print("🎉 QUIZ COMPLETED! 🎉")
-        print("="*60)
-        
-        percentage = (self.score / self.total_questions) * 100
-        time_taken = self.calculate_time_taken()
-        
-        print(f"📊 Final Score: {self.score}/{self.total_questions}")
-        print(f"📈 Percentage: {percentage:.1f}%")
-        print(f"⏱️  Time Taken: {time_taken}")
-        
-        # Performance feedback
-        if percentage >= 90:
-            print("🏆 Excellent! Outstanding performance!")
-        elif percentage >= 80:
-            print("🎯 Great job! Well done!")
-        elif percentage >= 70:
-            print("👍 Good work! Keep it up!")
-        elif percentage >= 60:
-            print("📚 Not bad! Room for improvement.")
-        else:
-            print("📖 Keep studying! Practice makes perfect!")
-        
-        print("="*60)
-    
-    def save_results(self):
-        """Save quiz results to file"""
-        try:
-            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            percentage = (self.score / self.total_questions) * 100
-            time_taken = self.calculate_time_taken()
-            
-            result_entry = {
-                "timestamp": timestamp,
-                "score": self.score,
-                "total": self.total_questions,
-                "percentage": round(percentage, 1),
-                "time_taken": time_taken
-            }
-            
-            # Load existing results or create new list
-            try:
-                with open("results.txt", "r") as f:
-                    results = json.load(f)
-            except (FileNotFoundError, json.JSONDecodeError):
-                results = []
-            
-            results.append(result_entry)
-            
-            # Save updated results
-            with open("results.txt", "w") as f:
-                json.dump(results, f, indent=2)
-            
-            print("💾 Results saved to results.txt")
-            
-        except Exception as e:
-            print(f"⚠️  Could not save results: {e}")
-    
-    def run_quiz(self):
-        """Main quiz execution"""
-        # Load questions
-        if not self.load_questions():
-            return
-        
-        # Display welcome
-        self.display_welcome()
-        
-        # Shuffle questions for variety
-        self.shuffle_questions()
-        
-        # Start timer
-        self.start_time = time.time()
-        
-        # Run through questions
-        for idx, question in enumerate(self.questions, 1):
-            self.display_question(question, idx)
-            user_choice = self.get_user_answer()
-            self.check_answer(question, user_choice)
-            self.display_progress()
-            
-            # Small pause between questions
-            time.sleep(1)
-        
-        # End timer
-        self.end_time = time.time()
-        
-        # Display final results
-        self.display_final_results()
-        
-        # Save results
-        self.save_results()
-        
-        # Ask if user wants to play again
-        play_again = input("\n🔄 Would you like to take the quiz again? (y/n): ").lower()
-        if play_again in ['y', 'yes']:
-            print("\n" + "="*50)
-            self.__init__()  # Reset the quiz
-            self.run_quiz()
-        else:
-            print("👋 Thanks for playing! Goodbye!")
-
-def main():
-    """Main function to start the quiz app"""
-    quiz = QuizApp()
-    quiz.run_quiz()
-
-if __name__ == "__main__":
+import argparse
+import json
+import sys
+import threading
+import time
+from metrics import Metrics, instrument, metrics_path, profiling
+from question_bank import draw_questions
+from question_stats import open_stats
+from quiz_engine import QuizSession, chain_answers, feedback_for, format_time_taken, non_negative_float, positive_int
+from storage import BACKENDS, DATABASE_FILE, FileStorage, open_storage
+
+class QuizApp:
+    def __init__(self, num_questions=None, seed=None, metrics=None, storage=None, filters=None, user=None,
+                 fast_start=False, delay=1.0, answers=None, out=None):
+        self.num_questions = num_questions
+        self.seed = seed
+        # category / difficulty / tags to draw from
+        self.filters = filters or {}
+        # Whose review history picks the questions; None draws them at random
+        self.user = user
+        # Load the bank in the background while the welcome screen waits for Enter
+        self.fast_start = fast_start
+        # Seconds the answer feedback stays up before the next question
+        self.delay = delay
+        # File of answers, one per line, for non-interactive runs; None reads the keyboard
+        self.answers = answers
+        # Where render() writes; None is whatever sys.stdout is at the time
+        self.out = out
+        # Lines of the screen being composed, written at once by render()
+        self.screen = []
+        self.metrics = metrics
+        self.storage = storage or FileStorage()
+        if metrics is not None:
+            instrument(self, metrics)
+        self.questions = []
+        self.order = []
+        self.session = None
+        self.stats = None
+        self.reviews = None
+        self.total_questions = 0
+        
+    def load_questions(self, say=print):
+        """Load questions from the configured storage, reporting through `say`"""
+        try:
+            self.questions = self.storage.open_bank()
+            if any(self.filters.values()) and not len(self.questions.matching(**self.filters)):
+                say("❌ Error: No questions match the chosen category, difficulty and tags!")
+                return False
+            self.stats = open_stats()
+            if self.user:
+                from scheduler import open_reviews
+                self.reviews = open_reviews(self.user)
+                if self.reviews is None:
+                    say("⚠️  Could not open your review history; questions will be drawn at random")
+            say(f"✅ Loaded {len(self.questions)} questions successfully!")
+        except FileNotFoundError:
+            say("❌ Error: questions.json file not found!")
+            return False
+        except json.JSONDecodeError:
+            say("❌ Error: Invalid JSON format in questions.json!")
+            return False
+        except ValueError as e:
+            say(f"❌ Error: Invalid question bank: {e}")
+            return False
+        return True
+
+    def load_in_background(self):
+        """Start loading questions on a worker thread
+        
+        Returns a function that waits for the load, prints its messages
+        (held back so they do not land in the middle of the welcome
+        screen) and returns whether it succeeded.
+        """
+        messages = []
+        outcome = []
+        worker = threading.Thread(target=lambda: outcome.append(self.load_questions(messages.append)),
+                                  daemon=True)
+        worker.start()
+
+        def wait():
+            worker.join()
+            for message in messages:
+                print(message)
+            return bool(outcome and outcome[0])
+        return wait
+    
+    def shuffle_questions(self):
+        """Randomly draw this session's questions, or queue them by review history"""
+        if self.reviews:
+            # Each question is picked from the due-time heap when the session reaches it
+            self.order = self.reviews.queue(self.questions, self.num_questions, self.seed, **self.filters)
+        else:
+            # Only the drawn positions are touched; questions are parsed as they are asked
+            self.order = draw_questions(self.questions, self.num_questions, self.seed, **self.filters)
+        on_answer = chain_answers(self.stats.record if self.stats else None,
+                                  self.reviews.record if self.reviews else None)
+        self.session = QuizSession(self.questions, self.order, on_answer=on_answer)
+        self.total_questions = self.session.total
+        self.add_line("🧠 Questions queued for review!" if self.reviews else "🔄 Questions shuffled!")
+    
+    def add_line(self, line=""):
+        """Add a line to the screen being composed; render() writes it"""
+        self.screen.append(line)
+
+    def render(self, prompt=""):
+        """Write the composed screen, and `prompt` after it, in one write"""
+        if self.screen:
+            prompt = "\n".join(self.screen) + "\n" + prompt
+            self.screen = []
+        if prompt:
+            out = self.out or sys.stdout
+            out.write(prompt)
+            out.flush()
+
+    def ask(self, prompt):
+        """Show the composed screen ending in `prompt` and read a reply
+        
+        In a non-interactive run the reply is the next line of `answers`,
+        echoed after the prompt, and nothing is written until the next
+        render(). Raises EOFError when there is no reply left.
+        """
+        if self.answers is None:
+            self.render(prompt)
+            return input()
+        reply = self.answers.readline()
+        if not reply:
+            raise EOFError
+        reply = reply.strip()
+        self.add_line(prompt + reply)
+        return reply
+    
+    def display_welcome(self):
+        """Display welcome message and instructions"""
+        self.add_line("=" * 60)
+        self.add_line("🎯 WELCOME TO THE QUIZ APP! 🎯")
+        self.add_line("=" * 60)
+        self.add_line("📝 Instructions:")
+        self.add_line("• You will be shown one question at a time")
+        self.add_line("• Choose the correct answer from the options (1-4)")
+        self.add_line("• Your score will be tracked throughout the quiz")
+        self.add_line("• At the end, you'll see your final score and time taken")
+        self.add_line("=" * 60)
+        if self.answers is None:
+            self.ask("Press Enter to start the quiz...")
+        else:
+            self.render()
+    
+    def display_question(self, question_data, question_num):
+        """Display a single question with options"""
+        self.add_line(f"\n{'='*50}")
+        self.add_line(f"Question {question_num}/{self.total_questions}")
+        self.add_line(f"{'='*50}")
+        self.add_line(f"❓ {question_data.text}")
+        self.add_line()
+        
+        for idx, option in enumerate(question_data.options, 1):
+            self.add_line(f"   {idx}. {option}")
+        self.add_line()
+    
+    def get_user_answer(self):
+        """Get and validate user input"""
+        while True:
+            try:
+                user_input = self.ask("Your choice (1-4): ").strip()
+                choice = int(user_input)
+                if 1 <= choice <= 4:
+                    return choice
+                else:
+                    self.add_line("❌ Please enter a number between 1 and 4!")
+            except ValueError:
+                self.add_line("❌ Please enter a valid number!")
+    
+    def check_answer(self, question_data, user_choice):
+        """Check if the user's answer is correct"""
+        if self.session.answer(user_choice - 1):
+            self.add_line("✅ Correct! Well done!")
+            return True
+        else:
+            self.add_line(f"❌ Wrong! The correct answer is: {question_data.answer}")
+            return False
+    
+    def display_progress(self):
+        """Display current progress"""
+        session = self.session
+        self.add_line(f"\n📊 Progress: {session.score}/{session.total} ({session.percentage:.1f}%)")
+    
+    def calculate_time_taken(self):
+        """Calculate time taken for the quiz"""
+        if self.session and self.session.end_time is not None:
+            return format_time_taken(self.session.elapsed())
+        return "Unknown"
+    
+    def display_final_results(self):
+        """Display final results"""
+        self.add_line("\n" + "="*60)
+        self.add_line("🎉 QUIZ COMPLETED! 🎉")
+        self.add_line("="*60)
+        
+        session = self.session
+        time_taken = self.calculate_time_taken()
+        
+        self.add_line(f"📊 Final Score: {session.score}/{session.total}")
+        self.add_line(f"📈 Percentage: {session.percentage:.1f}%")
+        self.add_line(f"⏱️  Time Taken: {time_taken}")
+        
+        # Performance feedback
+        self.add_line(feedback_for(session.percentage))
+        
+        self.add_line("="*60)
+        self.render()
+    
+    def save_results(self):
+        """Save quiz results to file"""
+        try:
+            result_entry = self.session.result()
+            
+            with self.storage.open_results() as store:
+                store.append(result_entry)
+            
+            self.add_line(f"💾 Results saved to {self.storage.results_location}")
+            
+        except Exception as e:
+            self.add_line(f"⚠️  Could not save results: {e}")
+    
+    def close(self):
+        if self.stats:
+            self.stats.close()
+        if self.reviews:
+            self.reviews.close()
+    
+    def run_quiz(self):
+        """Main quiz execution"""
+        try:
+            # Load questions, in the background while the welcome is read when starting fast
+            if self.fast_start:
+                loaded = self.load_in_background()
+                self.display_welcome()
+                if not loaded():
+                    return
+            else:
+                if not self.load_questions():
+                    return
+                
+                # Display welcome
+                self.display_welcome()
+            
+            # Shuffle questions for variety
+            self.shuffle_questions()
+            
+            # Start timer
+            self.session.start()
+            
+            # Run through questions
+            while not self.session.finished:
+                try:
+                    question = self.session.question
+                except ValueError as e:  # questions are only parsed as they are asked
+                    self.render()
+                    print(f"\n❌ Error: Invalid question bank: {e}")
+                    print("❌ The quiz was stopped; fix questions.json and start again")
+                    self.close()
+                    return
+                self.display_question(question, self.session.number)
+                user_choice = self.get_user_answer()
+                self.check_answer(question, user_choice)
+                self.display_progress()
+                
+                # Pause between questions, with the feedback on screen
+                self.render()
+                if self.delay:
+                    time.sleep(self.delay)
+                self.session.next()
+        except EOFError:
+            self.render()
+            print("\n❌ Ran out of answers; the quiz was not finished" if self.answers is not None
+                  else "\n👋 Quiz abandoned. Goodbye!")
+            self.close()
+            return
+        
+        # Display final results
+        self.display_final_results()
+        
+        # Save results
+        self.save_results()
+        self.close()
+        
+        # Ask if user wants to play again; a scripted run plays once
+        play_again = "n"
+        if self.answers is None:
+            try:
+                play_again = self.ask("\n🔄 Would you like to take the quiz again? (y/n): ").lower()
+            except EOFError:
+                pass
+        else:
+            self.render()
+        if play_again in ['y', 'yes']:
+            print("\n" + "="*50)
+            self.__init__(self.num_questions, self.seed, self.metrics, self.storage, self.filters,
+                          self.user, self.fast_start, self.delay, self.answers, self.out)  # Reset the quiz
+            self.run_quiz()
+        else:
+            print("👋 Thanks for playing! Goodbye!")
+
+def main():
+    """Main function to start the quiz app"""
+    parser = argparse.ArgumentParser(description="Command line quiz")
+    parser.add_argument("-n", "--num-questions", type=positive_int, help="questions per session (default: all)")
+    parser.add_argument("--seed", type=int, help="seed for a reproducible question draw")
+    parser.add_argument("--category", help="only ask questions from this category")
+    parser.add_argument("--difficulty", help="only ask questions of this difficulty, e.g. hard")
+    parser.add_argument("--tag", dest="tags", action="append", default=[],
+                        help="only ask questions with this tag (repeat to require several)")
+    parser.add_argument("--adaptive", action="store_true",
+                        help="ask due and unseen questions first, by spaced repetition of your past answers")
+    parser.add_argument("--user", help="whose review history --adaptive uses (default: your login name)")
+    parser.add_argument("--fast-start", action="store_true",
+                        help="show the welcome screen at once and load the questions behind it")
+    parser.add_argument("--delay", type=non_negative_float, metavar="SECONDS",
+                        help="pause after each answer (default: 1, or 0 with --answers)")
+    parser.add_argument("--answers", metavar="PATH",
+                        help="answer from PATH (- for stdin), one option number per line, without prompting")
+    parser.add_argument("--storage", choices=BACKENDS, default="file",
+                        help="read questions and save results from JSON files or a SQLite database")
+    parser.add_argument("--database", default=DATABASE_FILE, help="SQLite database for --storage sqlite")
+    parser.add_argument("--metrics", metavar="PATH",
+                        help="time load/render/answer/save into PATH (.prom for Prometheus text, else JSON)")
+    parser.add_argument("--profile", metavar="PATH", help="write cProfile stats for the session to PATH")
+    parser.add_argument("--tracemalloc", metavar="PATH", help="write the top memory allocations to PATH")
+    args = parser.parse_args()
+
+    try:
+        storage = open_storage(args.storage, args.database)
+    except ValueError as e:
+        print(f"❌ Error: {e}")
+        return
+    path = metrics_path(args.metrics)
+    metrics = Metrics() if path else None
+    filters = {"category": args.category, "difficulty": args.difficulty, "tags": tuple(args.tags)}
+    user = None
+    if args.adaptive:
+        from scheduler import default_user
+        user = args.user or default_user()
+    answers = None
+    if args.answers == "-":
+        answers = sys.stdin
+    elif args.answers:
+        try:
+            answers = open(args.answers, encoding="utf-8")
+        except OSError as e:
+            print(f"❌ Error: Could not read answers: {e}")
+            storage.close()
+            return
+    delay = args.delay if args.delay is not None else (0 if answers else 1.0)
+    quiz = QuizApp(args.num_questions, args.seed, metrics, storage, filters, user, args.fast_start,
+                   delay, answers)
+    try:
+        with profiling(args.profile, args.tracemalloc):
+            quiz.run_quiz()
+    finally:
+        if answers is not None and answers is not sys.stdin:
+            answers.close()
+        storage.close()
+        if metrics is not None:
+            metrics.write(path)
+            print(f"📏 Metrics written to {path}")
+
+if __name__ == "__main__":
     main() 
\ No newline at end of file
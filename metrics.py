@@ -0,0 +1,142 @@
+import functools
+import json
+import os
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+
+METRICS_ENV = "QUIZ_METRICS"
+
+# Methods timed on QuizApp and QuizGUI when metrics are enabled
+HOT_PATHS = ("load_questions", "display_question", "check_answer", "save_results")
+
+# Upper bounds (seconds) of the call duration histogram buckets
+DURATION_BOUNDS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01,
+                   0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+
+class Metrics:
+    """Call counters and duration histograms for instrumented methods
+
+    Nothing here runs unless instrument() has wrapped an object's methods,
+    so an app that never enables metrics pays nothing for them.
+    """
+
+    def __init__(self, bounds=DURATION_BOUNDS):
+        self.bounds = tuple(bounds)
+        self.histograms = {}
+        self.errors = {}
+
+    def observe(self, name, seconds):
+        """Record one call to `name` that took `seconds`"""
+        histogram = self.histograms.get(name)
+        if histogram is None:
+            # bucket counts (+Inf last), sum of seconds
+            histogram = self.histograms[name] = [[0] * (len(self.bounds) + 1), 0.0]
+        histogram[0][bisect_left(self.bounds, seconds)] += 1
+        histogram[1] += seconds
+
+    def error(self, name):
+        """Count a call to `name` that raised"""
+        self.errors[name] = self.errors.get(name, 0) + 1
+
+    def to_dict(self):
+        histograms = {}
+        for name, (buckets, total) in sorted(self.histograms.items()):
+            histograms[name] = {
+                "count": sum(buckets),
+                "sum": total,
+                "buckets": dict(zip([str(b) for b in self.bounds] + ["+Inf"], buckets))
+            }
+        return {"histograms": histograms, "errors": dict(sorted(self.errors.items()))}
+
+    def to_prometheus(self):
+        """The metrics in Prometheus text exposition format"""
+        lines = [
+            "# HELP quiz_call_duration_seconds Time spent in instrumented quiz methods",
+            "# TYPE quiz_call_duration_seconds histogram"
+        ]
+        for name, (buckets, total) in sorted(self.histograms.items()):
+            cumulative = 0
+            for bound, count in zip([repr(float(b)) for b in self.bounds] + ["+Inf"], buckets):
+                cumulative += count
+                lines.append(f'quiz_call_duration_seconds_bucket{{function="{name}",le="{bound}"}} {cumulative}')
+            lines.append(f'quiz_call_duration_seconds_sum{{function="{name}"}} {total!r}')
+            lines.append(f'quiz_call_duration_seconds_count{{function="{name}"}} {cumulative}')
+        lines.append("# HELP quiz_call_errors_total Instrumented quiz method calls that raised")
+        lines.append("# TYPE quiz_call_errors_total counter")
+        for name, count in sorted(self.errors.items()):
+            lines.append(f'quiz_call_errors_total{{function="{name}"}} {count}')
+        return "\n".join(lines) + "\n"
+
+    def write(self, path):
+        """Save to `path`: Prometheus text for .prom/.txt files, JSON otherwise"""
+        if path.endswith((".prom", ".txt")):
+            text = self.to_prometheus()
+        else:
+            text = json.dumps(self.to_dict(), indent=2) + "\n"
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text)
+
+
+def instrument(obj, metrics, names=HOT_PATHS):
+    """Time calls to the `names` methods of `obj` into `metrics`
+
+    Only this instance is wrapped, and always around the class's own
+    method, so instrumenting the same object twice does not time it twice.
+    """
+    for name in names:
+        method = getattr(type(obj), name).__get__(obj)
+        setattr(obj, name, _timed(method, name, metrics))
+    return obj
+
+
+def _timed(method, name, metrics):
+    @functools.wraps(method)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter_ns()
+        try:
+            return method(*args, **kwargs)
+        except BaseException:
+            metrics.error(name)
+            raise
+        finally:
+            metrics.observe(name, (time.perf_counter_ns() - start) / 1e9)
+    return wrapper
+
+
+def metrics_path(cli_path=None):
+    """Where to write metrics: the CLI flag, else $QUIZ_METRICS, else None (disabled)"""
+    return cli_path or os.environ.get(METRICS_ENV) or None
+
+
+@contextmanager
+def profiling(profile_path=None, tracemalloc_path=None, top=25):
+    """Run the enclosed block under cProfile and/or tracemalloc
+
+    cProfile stats are dumped to `profile_path` (open them with
+    `python -m pstats`); the `top` allocation sites and the peak traced
+    memory are written to `tracemalloc_path` as text.
+    """
+    profiler = None
+    if tracemalloc_path:
+        import tracemalloc
+        tracemalloc.start()
+    if profile_path:
+        import cProfile
+        profiler = cProfile.Profile()
+        profiler.enable()
+    try:
+        yield
+    finally:
+        if profiler is not None:
+            profiler.disable()
+            profiler.dump_stats(profile_path)
+        if tracemalloc_path:
+            snapshot = tracemalloc.take_snapshot()
+            current, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            with open(tracemalloc_path, "w", encoding="utf-8") as f:
+                f.write(f"Current: {current / 1024:.1f} KiB, peak: {peak / 1024:.1f} KiB\n\n")
+                for stat in snapshot.statistics("lineno")[:top]:
+                    f.write(f"{stat}\n")
@@ -0,0 +1,899 @@
+import argparse
+import json
+import mmap
+import os
+import re
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+
+QUESTIONS_FILE = "questions.json"
+COMPILED_SUFFIX = ".qbank"
+COMPARE_CHUNK = 1 << 16  # bytes compared at a time when diffing two versions of a bank
+
+INDEX_MAGIC = b"QIDX\x00\x00\x00\x01"
+INDEX_HEADER = struct.Struct("<8sQqQ")  # magic, source size, source mtime_ns, count
+
+COMPILED_MAGIC = b"QBNK\x00\x00\x00\x02"
+# magic, source size, source mtime_ns, source sha256, question count, option slot
+# count, string count, string bytes, tag slot count, facet count, facet posting
+# count, then the file offset of each section below
+COMPILED_SECTIONS = (
+    ("question_ids", "I"),     # string id of each question text
+    ("option_starts", "I"),    # first slot in option_ids for each question
+    ("option_counts", "B"),    # number of options for each question
+    ("answer_indexes", "B"),   # position of the correct answer in its options
+    ("category_ids", "I"),     # string id of each question's category, or NO_STRING
+    ("difficulty_ids", "I"),   # string id of each question's difficulty, or NO_STRING
+    ("tag_starts", "I"),       # first slot in tag_ids for each question
+    ("tag_counts", "B"),       # number of tags for each question
+    ("option_ids", "I"),       # string ids of every question's options, in order
+    ("tag_ids", "I"),          # string ids of every question's tags, in order
+    ("facet_key_ids", "I"),    # string id of each FacetIndex key
+    ("facet_starts", "Q"),     # first slot in facet_positions for each key, plus the end
+    ("facet_positions", "I"),  # sorted question positions listed under each key
+    ("string_offsets", "Q"),   # start of each interned string, plus the end of the last
+    ("string_data", "B"),      # UTF-8 bytes of all interned strings
+)
+COMPILED_HEADER = struct.Struct("<8sQq32sQQQQQQQ" + "Q" * len(COMPILED_SECTIONS))
+NO_STRING = 0xFFFFFFFF
+
+# One question object, allowing a single level of nested objects. Strings are
+# matched whole so braces inside question text do not confuse the scanner.
+# Every loop is written so text can only match one way, which keeps a
+# missing brace from sending the regex into exponential backtracking.
+_STRING = rb'"[^"\\]*(?:\\.[^"\\]*)*"'
+_NESTED = rb'\{[^{}"]*(?:' + _STRING + rb'[^{}"]*)*\}'
+_OBJECT = re.compile(
+    rb'\{[^{}"]*(?:(?:' + _STRING + rb'|' + _NESTED + rb')[^{}"]*)*\}',
+    re.DOTALL
+)
+# What may sit around the question objects: the array's brackets and the
+# commas between its items, with any JSON whitespace
+_OPENING = re.compile(rb'[ \t\r\n]*\[[ \t\r\n]*')
+_SEPARATOR = re.compile(rb'[ \t\r\n]*,[ \t\r\n]*')
+_CLOSING = re.compile(rb'[ \t\r\n]*\][ \t\r\n]*')
+_EMPTY = re.compile(rb'[ \t\r\n]*\[[ \t\r\n]*\][ \t\r\n]*')
+_GAP_ERRORS = {
+    _OPENING: "Expecting '[' before the first question",
+    _SEPARATOR: "Expecting ',' delimiter between questions",
+    _CLOSING: "Expecting ']' after the last question",
+    _EMPTY: "Expecting a JSON array of questions",
+}
+
+
+class Question:
+    """A quiz question with its correct option resolved to an index
+
+    The answer is looked up in the options once, when the question is
+    loaded, so grading an answer is an integer comparison. `category`,
+    `difficulty` and `tags` are optional.
+    """
+
+    __slots__ = ("text", "options", "answer_index", "category", "difficulty", "tags")
+
+    def __init__(self, text, options, answer_index, category=None, difficulty=None, tags=()):
+        self.text = text
+        self.options = options
+        self.answer_index = answer_index
+        self.category = category
+        self.difficulty = difficulty
+        self.tags = tags
+
+    @classmethod
+    def from_dict(cls, data):
+        """Build a question from a questions.json entry, validating its answer"""
+        try:
+            text = data["question"]
+            options = tuple(data["options"])
+            answer = data["answer"]
+        except (KeyError, TypeError) as e:
+            raise ValueError(f"missing or malformed field {e}") from None
+        try:
+            answer_index = options.index(answer)
+        except ValueError:
+            raise ValueError(f"answer {answer!r} is not one of its options") from None
+        category = data.get("category")
+        difficulty = data.get("difficulty")
+        tags = data.get("tags", ())
+        if not isinstance(category, (str, type(None))) or not isinstance(difficulty, (str, type(None))):
+            raise ValueError("category and difficulty must be strings")
+        if not isinstance(tags, (list, tuple)) or not all(isinstance(tag, str) for tag in tags):
+            raise ValueError("tags must be a list of strings")
+        return cls(text, options, answer_index, category, difficulty, tuple(tags))
+
+    @property
+    def answer(self):
+        return self.options[self.answer_index]
+
+    def is_correct(self, option_index):
+        """Whether the option at `option_index` (0-based) is the right one"""
+        return option_index == self.answer_index
+
+    def to_dict(self):
+        data = {"question": self.text, "options": list(self.options), "answer": self.answer}
+        if self.category is not None:
+            data["category"] = self.category
+        if self.difficulty is not None:
+            data["difficulty"] = self.difficulty
+        if self.tags:
+            data["tags"] = list(self.tags)
+        return data
+
+    def _key(self):
+        return (self.text, self.options, self.answer_index, self.category, self.difficulty, self.tags)
+
+    def __eq__(self, other):
+        if not isinstance(other, Question):
+            return NotImplemented
+        return self._key() == other._key()
+
+    def __repr__(self):
+        extra = ""
+        if self.category is not None or self.difficulty is not None or self.tags:
+            extra = f", {self.category!r}, {self.difficulty!r}, {self.tags!r}"
+        return f"Question({self.text!r}, {self.options!r}, {self.answer_index}{extra})"
+
+
+def _facet_value(value):
+    return value.strip().casefold()
+
+
+def index_keys(category=None, difficulty=None, tags=()):
+    """The facet index keys a question with these fields is listed under"""
+    keys = []
+    if category is not None:
+        keys.append("category=" + _facet_value(category))
+    if difficulty is not None:
+        keys.append("difficulty=" + _facet_value(difficulty))
+    if category is not None and difficulty is not None:
+        keys.append(keys[0] + "&" + keys[1])
+    keys.extend("tag=" + _facet_value(tag) for tag in dict.fromkeys(tags))
+    return keys
+
+
+def filter_keys(category=None, difficulty=None, tags=()):
+    """The facet index keys to intersect for a filter"""
+    keys = index_keys(category, difficulty, tags)
+    if category is not None and difficulty is not None:
+        del keys[:2]  # the category&difficulty pair key covers both
+    return keys
+
+
+class FacetIndex:
+    """Inverted index from category, difficulty and tag values to positions
+
+    Each key ("category=geography", "difficulty=hard", "tag=europe", and
+    the "category=...&difficulty=..." pair) maps to the sorted positions
+    of its questions, so a filter costs time proportional to the questions
+    it matches rather than to the size of the bank. Values are matched
+    case-insensitively.
+    """
+
+    def __init__(self, postings):
+        self.postings = postings
+
+    @classmethod
+    def build(cls, questions):
+        """Index an iterable of Questions given in bank order"""
+        postings = {}
+        for position, question in enumerate(questions):
+            for key in index_keys(question.category, question.difficulty, question.tags):
+                postings.setdefault(key, array("I")).append(position)
+        return cls(postings)
+
+    def matching(self, category=None, difficulty=None, tags=()):
+        """Sorted positions of the questions that pass every given filter"""
+        keys = filter_keys(category, difficulty, tags)
+        if not keys:
+            raise ValueError("no filter given")
+        # Walk the shortest list and binary-search the others
+        lists = sorted((self.postings.get(key, ()) for key in keys), key=len)
+        shortest, others = lists[0], lists[1:]
+        if not others:
+            return shortest
+        return array("I", (position for position in shortest
+                           if all(_contains(other, position) for other in others)))
+
+    def spliced(self, first, last, questions):
+        """The index once positions [first, last) hold `questions` instead, with later positions moved to follow them
+
+        Only the new questions are indexed; the rest of every list is copied,
+        shifted if the number of questions changed.
+        """
+        added = {}
+        for position, question in enumerate(questions, first):
+            for key in index_keys(question.category, question.difficulty, question.tags):
+                added.setdefault(key, array("I")).append(position)
+        shift = len(questions) - (last - first)
+        postings = {}
+        for key in list(self.postings) + [key for key in added if key not in self.postings]:
+            positions = self.postings.get(key, array("I"))
+            high = bisect_left(positions, last)
+            spliced = positions[:bisect_left(positions, first)]
+            spliced.extend(added.get(key, ()))
+            spliced.extend(map(shift.__add__, positions[high:]) if shift else positions[high:])
+            if spliced:
+                postings[key] = spliced
+        return FacetIndex(postings)
+
+
+def _contains(positions, position):
+    i = bisect_left(positions, position)
+    return i < len(positions) and positions[i] == position
+
+
+class JSONQuestionBank:
+    """Lazily parsed, read-only view over a questions.json array
+
+    Opening the bank only records where each question object starts and how
+    long it is; a question is parsed the first time it is asked for. The
+    offset index is cached next to the JSON file so later launches map it
+    straight from disk instead of scanning the file again.
+    """
+
+    def __init__(self, path=QUESTIONS_FILE, index_path=None):
+        self.path = path
+        self.index_path = index_path or path + ".idx"
+        self._file = open(path, "rb")
+        self._index_file = None
+        self._index_map = None
+        self._facets = None
+        try:
+            stat = os.fstat(self._file.fileno())
+            if stat.st_size == 0:
+                raise json.JSONDecodeError("Expecting value", "", 0)
+            self._data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            _check_array(self._data)
+            if not self._open_index(stat):
+                self._starts, self._lengths = self._scan()
+                self._write_index(stat)
+        except Exception:
+            self.close()
+            raise
+
+    def __len__(self):
+        return len(self._starts)
+
+    def __getitem__(self, i):
+        data = self.raw(i)
+        try:
+            return Question.from_dict(data)
+        except ValueError as e:
+            raise ValueError(f"Question {i % len(self) + 1}: {e}") from None
+
+    def raw(self, i):
+        """The questions.json entry of question i, as parsed JSON"""
+        start = self._starts[i]
+        return json.loads(self._data[start:start + self._lengths[i]])
+
+    def answer_index(self, i):
+        """0-based index of the correct option of question i"""
+        return self[i].answer_index
+
+    def option_count(self, i):
+        return len(self[i].options)
+
+    @property
+    def facets(self):
+        """The category/difficulty/tag index, built by one pass over the bank on first use
+
+        Compile the bank to have it built ahead of time instead.
+        """
+        if self._facets is None:
+            self._facets = FacetIndex.build(self)
+        return self._facets
+
+    def matching(self, category=None, difficulty=None, tags=()):
+        """Sorted positions of the questions that pass the given filters"""
+        return self.facets.matching(category, difficulty, tags)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def close(self):
+        # Release the index views before the maps they point into
+        self._starts = self._lengths = ()
+        self._facets = None
+        for handle in (getattr(self, "_data", None), self._index_map, self._index_file, self._file):
+            if handle is not None:
+                handle.close()
+        self._data = self._index_map = self._index_file = None
+
+    def _scan(self):
+        """Find the byte range of every question object in one pass"""
+        return scan_questions(self._data)
+
+    def _open_index(self, stat):
+        """Map a cached offset index if it matches the JSON file on disk"""
+        try:
+            index_file = open(self.index_path, "rb")
+        except OSError:
+            return False
+        header = index_file.read(INDEX_HEADER.size)
+        if len(header) < INDEX_HEADER.size:
+            index_file.close()
+            return False
+        magic, size, mtime_ns, count = INDEX_HEADER.unpack(header)
+        expected = INDEX_HEADER.size + count * 12
+        if (magic != INDEX_MAGIC or size != stat.st_size or mtime_ns != stat.st_mtime_ns
+                or os.fstat(index_file.fileno()).st_size != expected):
+            index_file.close()
+            return False
+        index_map = mmap.mmap(index_file.fileno(), 0, access=mmap.ACCESS_READ)
+        view = memoryview(index_map)
+        offset = INDEX_HEADER.size
+        self._starts = view[offset:offset + count * 8].cast("Q")
+        self._lengths = view[offset + count * 8:expected].cast("I")
+        self._index_file = index_file
+        self._index_map = index_map
+        return True
+
+    def _write_index(self, stat):
+        """Cache the offset index; a read-only directory just skips the cache"""
+        tmp_path = f"{self.index_path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(INDEX_HEADER.pack(INDEX_MAGIC, stat.st_size, stat.st_mtime_ns, len(self._starts)))
+                self._starts.tofile(f)
+                self._lengths.tofile(f)
+            os.replace(tmp_path, self.index_path)
+        except OSError:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+
+class CompiledQuestionBank:
+    """Read-only question bank backed by a memory-mapped .qbank file
+
+    Every section is a flat array, so fetching question i is a handful of
+    array lookups with no parsing. Option strings are interned: identical
+    options across questions are stored once.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, "rb")
+        try:
+            self._data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            self.header = read_compiled_header(self._data)
+            if self.header is None:
+                raise ValueError(f"{path} is not a compiled question bank")
+            view = memoryview(self._data)
+            lengths = _section_lengths(self.header)
+            for (name, code), offset, length in zip(COMPILED_SECTIONS, self.header["sections"], lengths):
+                end = offset + length * array(code).itemsize
+                setattr(self, "_" + name, view[offset:end].cast(code))
+            self._facets = None
+        except Exception:
+            self.close()
+            raise
+
+    def __len__(self):
+        return self.header["count"]
+
+    def __getitem__(self, i):
+        start = self._option_starts[i]
+        options = tuple(self._string(self._option_ids[slot])
+                        for slot in range(start, start + self._option_counts[i]))
+        start = self._tag_starts[i]
+        tags = tuple(self._string(self._tag_ids[slot]) for slot in range(start, start + self._tag_counts[i]))
+        return Question(self._string(self._question_ids[i]), options, self._answer_indexes[i],
+                        self._optional_string(self._category_ids[i]),
+                        self._optional_string(self._difficulty_ids[i]), tags)
+
+    def answer_index(self, i):
+        """0-based index of the correct option of question i, without decoding strings"""
+        return self._answer_indexes[i]
+
+    def option_count(self, i):
+        return self._option_counts[i]
+
+    @property
+    def facets(self):
+        """The category/difficulty/tag index stored at compile time
+
+        Posting lists are views into the mapped file; only the key names
+        are decoded.
+        """
+        if self._facets is None:
+            starts = self._facet_starts
+            self._facets = FacetIndex({
+                self._string(key_id): self._facet_positions[starts[f]:starts[f + 1]]
+                for f, key_id in enumerate(self._facet_key_ids)
+            })
+        return self._facets
+
+    def matching(self, category=None, difficulty=None, tags=()):
+        """Sorted positions of the questions that pass the given filters"""
+        return self.facets.matching(category, difficulty, tags)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def _string(self, string_id):
+        return str(self._string_data[self._string_offsets[string_id]:self._string_offsets[string_id + 1]],
+                   "utf-8")
+
+    def _optional_string(self, string_id):
+        return None if string_id == NO_STRING else self._string(string_id)
+
+    def close(self):
+        # Release the facet and section views before the map they point into
+        self._facets = None
+        for name, _ in COMPILED_SECTIONS:
+            setattr(self, "_" + name, None)
+        for handle in (getattr(self, "_data", None), self._file):
+            if handle is not None:
+                handle.close()
+        self._data = None
+
+
+def read_compiled_header(data):
+    """Decode the header of a compiled bank, or None if it is not one"""
+    if len(data) < COMPILED_HEADER.size:
+        return None
+    fields = COMPILED_HEADER.unpack_from(data)
+    if fields[0] != COMPILED_MAGIC:
+        return None
+    return {
+        "source_size": fields[1],
+        "source_mtime_ns": fields[2],
+        "source_sha256": fields[3],
+        "count": fields[4],
+        "option_slots": fields[5],
+        "string_count": fields[6],
+        "string_bytes": fields[7],
+        "tag_slots": fields[8],
+        "facet_count": fields[9],
+        "facet_postings": fields[10],
+        "sections": fields[11:]
+    }
+
+
+def _section_lengths(header):
+    """Item count of each section, in COMPILED_SECTIONS order"""
+    count = header["count"]
+    return (count, count, count, count, count, count, count, count,
+            header["option_slots"], header["tag_slots"], header["facet_count"],
+            header["facet_count"] + 1, header["facet_postings"],
+            header["string_count"] + 1, header["string_bytes"])
+
+
+def _file_sha256(path):
+    import hashlib  # only compiling and stale checks hash the source
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.digest()
+
+
+def compiled_path_for(path):
+    """Where the compiled form of a JSON bank lives"""
+    return os.path.splitext(path)[0] + COMPILED_SUFFIX
+
+
+def compile_bank(source=QUESTIONS_FILE, target=None):
+    """Compile a questions.json bank into the binary .qbank format"""
+    target = target or compiled_path_for(source)
+    stat = os.stat(source)
+    sha256 = _file_sha256(source)
+
+    strings = {}
+    string_data = bytearray()
+    string_offsets = array("Q")
+
+    def intern(text):
+        string_id = strings.get(text)
+        if string_id is None:
+            string_id = strings[text] = len(string_offsets)
+            string_offsets.append(len(string_data))
+            string_data.extend(text.encode("utf-8"))
+        return string_id
+
+    def intern_optional(text):
+        return NO_STRING if text is None else intern(text)
+
+    question_ids = array("I")
+    option_starts = array("I")
+    option_counts = array("B")
+    answer_indexes = array("B")
+    category_ids = array("I")
+    difficulty_ids = array("I")
+    tag_starts = array("I")
+    tag_counts = array("B")
+    option_ids = array("I")
+    tag_ids = array("I")
+    postings = {}
+    with JSONQuestionBank(source) as bank:
+        for position, question in enumerate(bank):
+            for name, items in (("options", question.options), ("tags", question.tags)):
+                if len(items) > 255:
+                    raise ValueError(f"Question {position + 1}: expected at most 255 {name}, got {len(items)}")
+            question_ids.append(intern(question.text))
+            option_starts.append(len(option_ids))
+            option_counts.append(len(question.options))
+            answer_indexes.append(question.answer_index)
+            option_ids.extend(intern(option) for option in question.options)
+            category_ids.append(intern_optional(question.category))
+            difficulty_ids.append(intern_optional(question.difficulty))
+            tag_starts.append(len(tag_ids))
+            tag_counts.append(len(question.tags))
+            tag_ids.extend(intern(tag) for tag in question.tags)
+            for key in index_keys(question.category, question.difficulty, question.tags):
+                postings.setdefault(key, array("I")).append(position)
+
+    facet_key_ids = array("I")
+    facet_starts = array("Q")
+    facet_positions = array("I")
+    for key in sorted(postings):
+        facet_key_ids.append(intern(key))
+        facet_starts.append(len(facet_positions))
+        facet_positions.extend(postings[key])
+    facet_starts.append(len(facet_positions))
+    string_count = len(string_offsets)
+    string_offsets.append(len(string_data))
+
+    sections = (question_ids, option_starts, option_counts, answer_indexes,
+                category_ids, difficulty_ids, tag_starts, tag_counts, option_ids, tag_ids,
+                facet_key_ids, facet_starts, facet_positions, string_offsets, string_data)
+    offsets = []
+    position = COMPILED_HEADER.size
+    for section in sections:
+        position += -position % 8  # keep every section 8-byte aligned
+        offsets.append(position)
+        position += len(section) * (section.itemsize if isinstance(section, array) else 1)
+
+    tmp_path = f"{target}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(COMPILED_HEADER.pack(COMPILED_MAGIC, stat.st_size, stat.st_mtime_ns, sha256,
+                                     len(question_ids), len(option_ids), string_count,
+                                     len(string_data), len(tag_ids), len(facet_key_ids),
+                                     len(facet_positions), *offsets))
+        for offset, section in zip(offsets, sections):
+            f.write(b"\x00" * (offset - f.tell()))
+            f.write(section)
+    os.replace(tmp_path, target)
+    return target
+
+
+def is_compiled_fresh(compiled, source):
+    """Whether a compiled bank still matches its JSON source
+
+    Size and mtime are checked first; if only the mtime moved (a fresh
+    checkout, a touch) the source hash decides.
+    """
+    try:
+        with open(compiled, "rb") as f:
+            fields = COMPILED_HEADER.unpack(f.read(COMPILED_HEADER.size))
+    except (OSError, struct.error):
+        return False
+    if fields[0] != COMPILED_MAGIC:
+        return False
+    try:
+        stat = os.stat(source)
+    except FileNotFoundError:
+        return True  # shipped without its source
+    if stat.st_size != fields[1]:
+        return False
+    return stat.st_mtime_ns == fields[2] or _file_sha256(source) == fields[3]
+
+
+def load_bank(path=QUESTIONS_FILE):
+    """Open the question bank at `path`, preferring an up-to-date compiled copy"""
+    compiled = compiled_path_for(path)
+    if os.path.exists(compiled) and is_compiled_fresh(compiled, path):
+        return CompiledQuestionBank(compiled)
+    return JSONQuestionBank(path)
+
+
+def _check_array(data):
+    """Make sure the file holds a JSON array before indexing it"""
+    head = data[:64].lstrip()
+    tail = data[-64:].rstrip()
+    if not head.startswith(b"[") or not tail.endswith(b"]"):
+        raise json.JSONDecodeError("Expecting a JSON array of questions", "", 0)
+
+
+def _check_gap(data, start, end, gap, problems=None):
+    """Make sure data[start:end] is exactly the bracket or comma `gap` allows"""
+    if not gap.fullmatch(data, start, end):
+        if problems is None:
+            raise json.JSONDecodeError(_GAP_ERRORS[gap], "", start)
+        problems.append((start, _GAP_ERRORS[gap]))
+
+
+def _scan_range(data, start, end, starts, lengths, leading=_SEPARATOR, trailing=_SEPARATOR, problems=None):
+    """Append the span of every question object in data[start:end] to starts and lengths
+
+    `leading` and `trailing` are what must come before the first object
+    and after the last one: the array's brackets at the ends of the file,
+    else a comma. Anything else between the objects, such as a missing
+    comma, a stray value or a second array, raises json.JSONDecodeError,
+    as does an object the scanner cannot match whole. Given a `problems`
+    list, each of those is appended to it as (offset, message) instead.
+    """
+    previous = start
+    gap = leading
+    for match in _OBJECT.finditer(data, start, end):
+        begin, finish = match.span()
+        _check_gap(data, previous, begin, gap, problems)
+        starts.append(begin)
+        lengths.append(finish - begin)
+        previous = finish
+        gap = _SEPARATOR
+    if previous == start:  # no objects: the gaps on both sides are one
+        if leading is _OPENING:
+            trailing = _EMPTY if trailing is _CLOSING else _OPENING
+        _check_gap(data, start, end, trailing, problems)
+    else:
+        _check_gap(data, previous, end, trailing, problems)
+
+
+def scan_questions(data, problems=None):
+    """(starts, lengths) of every question object in the bytes of a questions.json array
+
+    Raises json.JSONDecodeError at the first thing in the file that is not
+    a question object, a comma or the array's brackets, or with a
+    `problems` list records each of them there as (offset, message).
+    """
+    starts = array("Q")
+    lengths = array("I")
+    _scan_range(data, 0, len(data), starts, lengths, _OPENING, _CLOSING, problems)
+    return starts, lengths
+
+
+def _common_prefix(a, b, limit):
+    """Length of the longest common prefix of a and b, up to `limit` bytes"""
+    i = 0
+    while i < limit:
+        j = min(i + COMPARE_CHUNK, limit)
+        if a[i:j] != b[i:j]:
+            break
+        i = j
+    else:
+        return limit
+    while j - i > 1:  # a[:i] == b[:i] and a[i:j] != b[i:j]
+        middle = (i + j) // 2
+        if a[i:middle] == b[i:middle]:
+            i = middle
+        else:
+            j = middle
+    return i
+
+
+def _common_suffix(a, b, limit):
+    """Length of the longest common suffix of a and b, up to `limit` bytes"""
+    end_a, end_b = len(a), len(b)
+    i = 0
+    while i < limit:
+        j = min(i + COMPARE_CHUNK, limit)
+        if a[end_a - j:end_a - i] != b[end_b - j:end_b - i]:
+            break
+        i = j
+    else:
+        return limit
+    while j - i > 1:
+        middle = (i + j) // 2
+        if a[end_a - middle:end_a - i] == b[end_b - middle:end_b - i]:
+            i = middle
+        else:
+            j = middle
+    return i
+
+
+class BankSnapshot:
+    """An immutable copy of a questions.json bank that can be updated incrementally
+
+    The snapshot owns its bytes, so rewriting questions.json never changes
+    a snapshot a session is already using. updated() returns a new snapshot
+    for the new file contents: the bytes both versions share at the start
+    and at the end are found with a few memory comparisons, and only the
+    questions in between are scanned, parsed and validated again. Parsed
+    questions, offsets and the facet index outside the changed range carry
+    over.
+    """
+
+    def __init__(self, data, starts, lengths, questions):
+        self._data = data
+        self._starts = starts
+        self._lengths = lengths
+        self._questions = questions  # parsed Question per position, or None until asked for
+        self._facets = None
+
+    @classmethod
+    def load(cls, path=QUESTIONS_FILE):
+        """Snapshot of the bank at `path`, reusing its cached offset index"""
+        with JSONQuestionBank(path) as bank:
+            return cls(bytes(bank._data), array("Q", bank._starts), array("I", bank._lengths),
+                       [None] * len(bank))
+
+    def __len__(self):
+        return len(self._starts)
+
+    def __getitem__(self, i):
+        question = self._questions[i]
+        if question is None:
+            try:
+                question = Question.from_dict(self.raw(i))
+            except ValueError as e:
+                raise ValueError(f"Question {i % len(self) + 1}: {e}") from None
+            self._questions[i] = question
+        return question
+
+    def raw(self, i):
+        """The questions.json entry of question i, as parsed JSON"""
+        start = self._starts[i]
+        return json.loads(self._data[start:start + self._lengths[i]])
+
+    def answer_index(self, i):
+        return self[i].answer_index
+
+    def option_count(self, i):
+        return len(self[i].options)
+
+    @property
+    def facets(self):
+        """The category/difficulty/tag index, built on first use"""
+        if self._facets is None:
+            self._facets = FacetIndex.build(self)
+        return self._facets
+
+    def matching(self, category=None, difficulty=None, tags=()):
+        """Sorted positions of the questions that pass the given filters"""
+        return self.facets.matching(category, difficulty, tags)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def close(self):
+        pass  # nothing to release; sessions may still be reading it
+
+    def updated(self, data):
+        """The snapshot for new file contents `data`, or self if nothing changed
+
+        Raises ValueError (or json.JSONDecodeError) if a changed question is
+        invalid, leaving this snapshot as it was.
+        """
+        old = self._data
+        if data == old:
+            return self
+        _check_array(data)
+        prefix = _common_prefix(old, data, min(len(old), len(data)))
+        suffix = _common_suffix(old, data, min(len(old), len(data)) - prefix)
+        starts, lengths = self._starts, self._lengths
+        # Questions ending before the first changed byte are kept as they are...
+        first = bisect_left(starts, prefix)
+        if first and starts[first - 1] + lengths[first - 1] > prefix:
+            first -= 1
+        # ...and so are those starting after the last one, shifted by the size change
+        last = bisect_left(starts, len(old) - suffix)
+        shift = len(data) - len(old)
+        scan_from = starts[first - 1] + lengths[first - 1] if first else 0
+        scan_to = starts[last] + shift if last < len(starts) else len(data)
+
+        new_starts = starts[:first]
+        new_lengths = lengths[:first]
+        _scan_range(data, scan_from, scan_to, new_starts, new_lengths,
+                    _SEPARATOR if first else _OPENING, _SEPARATOR if last < len(starts) else _CLOSING)
+        changed = len(new_starts) - first
+        new_starts.extend(map(shift.__add__, starts[last:]) if shift else starts[last:])
+        new_lengths.extend(lengths[last:])
+        snapshot = BankSnapshot(data, new_starts, new_lengths,
+                                self._questions[:first] + [None] * changed + self._questions[last:])
+        for i in range(first, first + changed):
+            snapshot[i]  # validate the changed questions now, not mid-quiz
+        if self._facets is not None:
+            snapshot._facets = self._facets.spliced(first, last, snapshot._questions[first:first + changed])
+        return snapshot
+
+
+class BankWatcher:
+    """Keeps `current` in step with a questions.json file that may be edited
+
+    Call poll() now and then. It only reads the file when its size,
+    modification time or inode changed, and then swaps in the updated
+    BankSnapshot by a single attribute assignment. A session holding the
+    previous snapshot keeps using it until it finishes.
+    """
+
+    def __init__(self, path=QUESTIONS_FILE):
+        self.path = path
+        self._signature = self._stat()
+        self.current = BankSnapshot.load(path)
+
+    def _stat(self):
+        stat = os.stat(self.path)
+        return stat.st_size, stat.st_mtime_ns, stat.st_ino
+
+    def poll(self):
+        """Reload the bank if its file changed; returns whether `current` was replaced
+
+        A file that cannot be read or holds invalid questions raises
+        OSError or ValueError once, and `current` stays as it was until the
+        file changes again.
+        """
+        signature = self._stat()
+        if signature == self._signature:
+            return False
+        self._signature = signature
+        with open(self.path, "rb") as f:
+            data = f.read()
+        snapshot = self.current.updated(data)
+        if snapshot is self.current:
+            return False  # touched, or saved without changes
+        self.current = snapshot
+        return True
+
+
+def draw_questions(bank, num_questions=None, seed=None, category=None, difficulty=None, tags=()):
+    """Pick `num_questions` random question positions from `bank`
+
+    Sampling a range touches only the positions it returns, so drawing a
+    session is O(num_questions) however large the bank is. The same seed
+    always draws the same questions in the same order. With a category,
+    difficulty or tags filter, only matching questions are drawn; their
+    positions come straight from the bank's facet index.
+    """
+    if category is None and difficulty is None and not tags:
+        pool = None
+        count = len(bank)
+    else:
+        pool = bank.matching(category, difficulty, tags)
+        count = len(pool)
+    if num_questions is None or num_questions > count:
+        num_questions = count
+    import random  # on first draw rather than at startup
+    picks = random.Random(seed).sample(range(count), num_questions)
+    return picks if pool is None else [pool[i] for i in picks]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Question bank tools")
+    commands = parser.add_subparsers(dest="command", required=True)
+    compile_cmd = commands.add_parser("compile", help="compile questions.json into the binary bank format")
+    compile_cmd.add_argument("source", nargs="?", default=QUESTIONS_FILE)
+    compile_cmd.add_argument("-o", "--output", help="output path (default: <source>.qbank)")
+    args = parser.parse_args()
+
+    if args.command == "compile":
+        try:
+            target = compile_bank(args.source, args.output)
+        except FileNotFoundError:
+            print(f"❌ Error: {args.source} file not found!")
+            return 1
+        except ValueError as e:  # includes invalid JSON
+            print(f"❌ Error: Invalid question bank: {e}")
+            return 1
+        with CompiledQuestionBank(target) as bank:
+            print(f"✅ Compiled {len(bank)} questions into {target}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,166 @@
+import argparse
+import heapq
+import os
+import sys
+from bisect import bisect_right
+from question_bank import QUESTIONS_FILE, load_bank
+from record_file import KEY, RecordFile
+from results_store import lock_file, unlock_file
+
+STATS_FILE = "question_stats.bin"
+
+STATS_MAGIC = b"QSTA\x00\x00\x00\x02"
+
+OPTION_SLOTS = 6  # picks of any later option are counted in the last slot
+# Upper bounds (seconds) of the latency histogram buckets; one more bucket
+# catches everything slower
+LATENCY_BOUNDS = (1, 2, 3, 5, 8, 13, 21, 34, 55, 89, 144)
+
+# Each question's record is its key, then a run of unsigned 64-bit counters:
+# attempts, correct, total latency in ms, picks per option, latency buckets
+_ATTEMPTS, _CORRECT, _LATENCY_MS, _OPTIONS = KEY + 1, KEY + 2, KEY + 3, KEY + 4
+_BUCKETS = _OPTIONS + OPTION_SLOTS
+RECORD_WORDS = _BUCKETS + len(LATENCY_BOUNDS) + 1
+
+
+class QuestionStats(RecordFile):
+    """Per-question answer counters kept in a memory-mapped file
+
+    Each question in the bank owns a fixed-size record addressed by its
+    position, so recording an answer updates a few counters in place in
+    O(1) instead of appending to a log that has to be re-aggregated. The
+    file is sparse: questions nobody has answered take no disk space.
+    Records carry a key of their question's text, so a question that
+    moves in the bank starts afresh rather than inheriting another's.
+    """
+
+    MAGIC = STATS_MAGIC
+    RECORD_WORDS = RECORD_WORDS
+    WORD = "Q"
+    DESCRIPTION = "question stats file"
+
+    def __init__(self, path=STATS_FILE):
+        super().__init__(path)
+
+    def record(self, position, option_index, correct, latency, question):
+        """Count one answer to `question`, at bank `position`
+
+        `option_index` is the 0-based option picked and `latency` the
+        seconds the user took to answer.
+        """
+        lock_file(self._fd)
+        try:
+            base = self._claim(position, question)
+            words = self._words
+            words[base + _ATTEMPTS] += 1
+            if correct:
+                words[base + _CORRECT] += 1
+            words[base + _LATENCY_MS] += max(0, int(latency * 1000))
+            words[base + _OPTIONS + min(option_index, OPTION_SLOTS - 1)] += 1
+            words[base + _BUCKETS + bisect_right(LATENCY_BOUNDS, latency)] += 1
+        finally:
+            unlock_file(self._fd)
+
+    def get(self, position, bank=None):
+        """Aggregated statistics for one question, checked against the one at `position` in `bank` if given"""
+        if position >= self.capacity:
+            self._remap()  # pick up growth by other processes
+        if position >= self.capacity or not self._owned(position, bank):
+            return _summary(position, [0] * RECORD_WORDS)
+        base = position * RECORD_WORDS
+        return _summary(position, self._words[base:base + RECORD_WORDS].tolist())
+
+    def worst(self, limit=10, min_attempts=5, bank=None):
+        """The `limit` questions with the lowest correct rate
+
+        Ties go to the question that takes longest to answer. Questions
+        with fewer than `min_attempts` answers are left out, and given the
+        `bank`, so are records of questions that are no longer at their
+        position.
+        """
+        self._remap()
+        words = self._words
+        if words is None:
+            return []
+
+        def ranked():
+            for position in range(self.capacity):
+                base = position * RECORD_WORDS
+                attempts = words[base + _ATTEMPTS]
+                if attempts >= min_attempts:
+                    rate = words[base + _CORRECT] / attempts
+                    mean_latency = words[base + _LATENCY_MS] / attempts
+                    yield (rate, -mean_latency, position)
+
+        candidates = list(ranked())
+        heapq.heapify(candidates)
+        worst = []
+        while candidates and len(worst) < limit:
+            position = heapq.heappop(candidates)[2]
+            if self._owned(position, bank):
+                worst.append(self.get(position))
+        return worst
+
+
+def _summary(position, record):
+    attempts = record[_ATTEMPTS]
+    return {
+        "position": position,
+        "attempts": attempts,
+        "correct": record[_CORRECT],
+        "correct_rate": record[_CORRECT] / attempts if attempts else None,
+        "mean_latency": record[_LATENCY_MS] / attempts / 1000 if attempts else None,
+        "option_counts": record[_OPTIONS:_BUCKETS],
+        "latency_histogram": dict(zip(LATENCY_BOUNDS + (float("inf"),), record[_BUCKETS:]))
+    }
+
+
+def open_stats(path=STATS_FILE):
+    """Open the stats file, or None if it cannot be used (the quiz runs without it)"""
+    try:
+        return QuestionStats(path)
+    except (OSError, ValueError):
+        return None
+
+
+def main():
+    """List the worst-performing questions in the bank"""
+    parser = argparse.ArgumentParser(description="Per-question answer statistics")
+    parser.add_argument("-n", "--limit", type=int, default=10, help="questions to list")
+    parser.add_argument("--min-attempts", type=int, default=5, help="ignore questions answered fewer times")
+    parser.add_argument("--stats", default=STATS_FILE)
+    args = parser.parse_args()
+
+    if not os.path.exists(args.stats):
+        print(f"❌ Error: {args.stats} not found! Answer some questions first.")
+        return 1
+    try:
+        bank = load_bank(QUESTIONS_FILE)
+    except (OSError, ValueError):
+        bank = None  # list positions without checking them against the questions
+    with QuestionStats(args.stats) as stats:
+        try:
+            worst = stats.worst(args.limit, args.min_attempts, bank)
+        except ValueError:  # a malformed question
+            worst = stats.worst(args.limit, args.min_attempts)
+            bank = None
+    if not worst:
+        print(f"No question has been answered {args.min_attempts} times yet.")
+        return 0
+
+    print("=" * 60)
+    print("🔍 WORST-PERFORMING QUESTIONS")
+    print("=" * 60)
+    for row in worst:
+        position = row["position"]
+        text = bank[position].text if bank is not None else f"#{position}"
+        print(f"\n❓ {text}")
+        print(f"   ✅ {row['correct_rate']:.0%} correct of {row['attempts']} answers, "
+              f"⏱️  {row['mean_latency']:.1f}s on average")
+        picks = ", ".join(f"{i + 1}: {count}" for i, count in enumerate(row["option_counts"]) if count)
+        print(f"   📊 Picks per option: {picks}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,205 @@
+import argparse
+import math
+import re
+import time
+
+# (minimum percentage, feedback message), best first
+FEEDBACK_TIERS = (
+    (90, "🏆 Excellent! Outstanding performance!"),
+    (80, "🎯 Great job! Well done!"),
+    (70, "👍 Good work! Keep it up!"),
+    (60, "📚 Not bad! Room for improvement."),
+    (0, "📖 Keep studying! Practice makes perfect!"),
+)
+PASS_PERCENTAGE = 60
+
+# The "Xm Ys" strings format_time_taken writes
+TIME_TAKEN_PATTERN = r"^\s*(?P<minutes>\d+)m\s*(?P<seconds>\d+)s\s*$"
+_TIME_TAKEN = re.compile(TIME_TAKEN_PATTERN)
+
+
+def feedback_for(percentage):
+    """Performance feedback message for a final percentage"""
+    for minimum, message in FEEDBACK_TIERS:
+        if percentage >= minimum:
+            return message
+    return FEEDBACK_TIERS[-1][1]
+
+
+def format_time_taken(seconds):
+    """Format a duration as the "Xm Ys" string stored with results"""
+    seconds = int(seconds)
+    return f"{seconds // 60}m {seconds % 60}s"
+
+
+def time_taken_seconds(text):
+    """Seconds in an "Xm Ys" string from format_time_taken, or None if `text` is not one"""
+    match = _TIME_TAKEN.match(text or "")
+    return int(match["minutes"]) * 60 + int(match["seconds"]) if match else None
+
+
+def positive_int(text):
+    """argparse type for a count that must be at least 1, such as --num-questions"""
+    try:
+        value = int(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {text!r}") from None
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return value
+
+
+def non_negative_float(text):
+    """argparse type for a number of seconds that may be 0 but not negative, such as --delay"""
+    try:
+        value = float(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid float value: {text!r}") from None
+    if not math.isfinite(value) or value < 0:
+        raise argparse.ArgumentTypeError(f"must be a finite number of at least 0, got {text}")
+    return value
+
+
+def chain_answers(*callbacks):
+    """One on_answer callback that calls each of `callbacks` given, or None if none are"""
+    callbacks = [callback for callback in callbacks if callback is not None]
+    if len(callbacks) <= 1:
+        return callbacks[0] if callbacks else None
+
+    def on_answer(*args):
+        for callback in callbacks:
+            callback(*args)
+    return on_answer
+
+
+class QuizSession:
+    """Scoring, progress and timing for one quiz run, with no I/O
+
+    Front ends call start(), then for every question read `question`,
+    answer() it and move on with next() until `finished`. The session
+    only fetches questions from the bank as they come up, so thousands
+    of sessions can share one bank in a single process.
+
+    Timing uses a monotonic nanosecond clock (`clock`, perf_counter_ns by
+    default), so durations are exact and unaffected by wall clock changes.
+    The response latency of every answered question is kept in
+    `latencies_ns`.
+
+    `on_answer`, if given, is called as on_answer(position, option_index,
+    correct, latency, question) for every graded answer, where latency is
+    the seconds since the question came up.
+    """
+
+    __slots__ = ("bank", "positions", "clock", "on_answer", "score", "index", "answered",
+                 "latencies_ns", "start_time", "end_time", "question_start", "_question")
+
+    def __init__(self, bank, positions, clock=time.perf_counter_ns, on_answer=None):
+        self.bank = bank
+        self.positions = positions
+        self.clock = clock
+        self.on_answer = on_answer
+        self.score = 0
+        self.index = 0
+        self.answered = False
+        self.latencies_ns = []
+        self.start_time = None
+        self.end_time = None
+        self.question_start = None
+        self._question = None
+
+    @property
+    def total(self):
+        return len(self.positions)
+
+    @property
+    def number(self):
+        """1-based number of the current question"""
+        return self.index + 1
+
+    @property
+    def finished(self):
+        return self.index >= len(self.positions)
+
+    @property
+    def question(self):
+        """The current Question"""
+        if self._question is None and not self.finished:
+            self._question = self.bank[self.positions[self.index]]
+        return self._question
+
+    @property
+    def percentage(self):
+        return (self.score / len(self.positions)) * 100 if self.positions else 0.0
+
+    def start(self):
+        """Reset progress and start the clock"""
+        self.score = 0
+        self.index = 0
+        self.answered = False
+        self.latencies_ns = []
+        self._question = None
+        self.start_time = self.question_start = self.clock()
+        self.end_time = None
+
+    def answer(self, option_index):
+        """Grade the current question; returns whether it was correct
+
+        Only the first answer to a question counts.
+        """
+        if self.answered or self.finished:
+            return False
+        self.answered = True
+        latency_ns = self.clock() - self.question_start
+        self.latencies_ns.append(latency_ns)
+        correct = self.question.is_correct(option_index)
+        if correct:
+            self.score += 1
+        if self.on_answer is not None:
+            self.on_answer(self.positions[self.index], option_index, correct, latency_ns / 1e9, self.question)
+        return correct
+
+    def next(self):
+        """Move to the next question; returns False once the quiz is over"""
+        if not self.finished:
+            self.index += 1
+            self.answered = False
+            self._question = None
+            self.question_start = self.clock()
+        if self.finished:
+            self.finish()
+            return False
+        return True
+
+    def finish(self):
+        """Stop the clock"""
+        if self.end_time is None:
+            self.end_time = self.clock()
+
+    def elapsed_ns(self):
+        """Nanoseconds since start, frozen once the quiz is finished"""
+        if self.start_time is None:
+            return 0
+        end = self.end_time if self.end_time is not None else self.clock()
+        return end - self.start_time
+
+    def elapsed(self):
+        """Seconds since start, frozen once the quiz is finished"""
+        return self.elapsed_ns() / 1e9
+
+    def result(self, timestamp=None):
+        """The results entry for this session
+
+        "time_taken" is kept for people reading the file; the exact total
+        and per-question durations are stored as integer nanoseconds.
+        """
+        timestamp = timestamp or time.strftime("%Y-%m-%d %H:%M:%S")
+        elapsed_ns = self.elapsed_ns()
+        return {
+            "timestamp": timestamp,
+            "score": self.score,
+            "total": len(self.positions),
+            "percentage": round(self.percentage, 1),
+            "time_taken": format_time_taken(elapsed_ns / 1e9),
+            "time_taken_ns": elapsed_ns,
+            "latencies_ns": self.latencies_ns
+        }
@@ -0,0 +1,133 @@
+import mmap
+import os
+import struct
+import zlib
+from results_store import lock_file, unlock_file
+
+RECORD_HEADER = struct.Struct("<8sQ")  # magic, record size in bytes
+# The first word of every record is the question_key of the question it belongs to
+KEY = 0
+
+
+def question_key(question):
+    """32-bit hash of a question's text, telling whose record a position holds"""
+    return zlib.crc32(question.text.encode("utf-8"))
+
+
+class RecordFile:
+    """Fixed-size per-question records in a shared memory-mapped file
+
+    Subclasses set MAGIC, RECORD_WORDS, WORD (the array typecode of one
+    word of a record) and DESCRIPTION. The record of the question at bank
+    position p is words[p * RECORD_WORDS:(p + 1) * RECORD_WORDS], so an
+    update rewrites a few words in place in O(1). The file grows as higher
+    positions are written and is sparse: unwritten records take no disk
+    space. Every process maps the same pages; writers hold lock_file() on
+    `_fd` while they update a record.
+
+    Positions change when questions are inserted, removed or reordered,
+    so each record starts with the question_key of the question that
+    wrote it. A record whose key does not match the question now at its
+    position belongs to a question that has moved: it is read as empty
+    and started afresh by the next answer. A file from an older version,
+    whose records carry no key, is emptied when it is opened.
+    """
+
+    MAGIC = None
+    RECORD_WORDS = None
+    WORD = "Q"
+    DESCRIPTION = "record file"
+
+    def __init__(self, path):
+        self.path = path
+        self.record_size = self.RECORD_WORDS * struct.calcsize(self.WORD)
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+        self._map = None
+        self._words = None
+        try:
+            lock_file(self._fd)
+            try:
+                os.lseek(self._fd, 0, os.SEEK_SET)
+                header = os.read(self._fd, RECORD_HEADER.size)
+                if not header or (header[:4] == self.MAGIC[:4] and header[:8] < self.MAGIC):
+                    os.ftruncate(self._fd, 0)
+                    os.lseek(self._fd, 0, os.SEEK_SET)
+                    header = RECORD_HEADER.pack(self.MAGIC, self.record_size)
+                    os.write(self._fd, header)
+            finally:
+                unlock_file(self._fd)
+            magic, record_size = RECORD_HEADER.unpack(header)
+            if magic != self.MAGIC or record_size != self.record_size:
+                raise ValueError(f"{path} is not a {self.DESCRIPTION}")
+            self._remap()
+        except Exception:
+            self.close()
+            raise
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    @property
+    def capacity(self):
+        """Number of question records the file currently holds"""
+        return len(self._words) // self.RECORD_WORDS if self._words is not None else 0
+
+    def _remap(self):
+        if self._words is not None:
+            self._words.release()
+            self._map.close()
+            self._map = self._words = None
+        size = os.fstat(self._fd).st_size
+        if size > RECORD_HEADER.size:
+            self._map = mmap.mmap(self._fd, size)
+            records = (size - RECORD_HEADER.size) // self.record_size
+            end = RECORD_HEADER.size + records * self.record_size
+            self._words = memoryview(self._map)[RECORD_HEADER.size:end].cast(self.WORD)
+
+    def _ensure(self, position):
+        """Grow the file so that `position` has a record; call with the lock held"""
+        if position < self.capacity:
+            return
+        # Another process may already have grown the file
+        records = (os.fstat(self._fd).st_size - RECORD_HEADER.size) // self.record_size
+        if position >= records:
+            records = max(position + 1, records * 2, 1024)
+            os.ftruncate(self._fd, RECORD_HEADER.size + records * self.record_size)
+        self._remap()
+
+    def _claim(self, position, question):
+        """First word of `question`'s record at `position`, emptied if another question left it; call with the lock held"""
+        self._ensure(position)
+        words = self._words
+        base = position * self.RECORD_WORDS
+        key = question_key(question)
+        if words[base + KEY] != key:
+            for i in range(base, base + self.RECORD_WORDS):
+                words[i] = 0
+            words[base + KEY] = key
+        return base
+
+    def _owned(self, position, bank):
+        """Whether the record at `position` belongs to the question there now in `bank`; always true without a bank"""
+        if bank is None:
+            return True
+        return position < len(bank) and self._words[position * self.RECORD_WORDS + KEY] == question_key(bank[position])
+
+    def flush(self):
+        if self._map is not None:
+            self._map.flush()
+
+    def close(self):
+        if self._words is not None:
+            self._words.release()
+            self._words = None
+        if self._map is not None:
+            self._map.flush()
+            self._map.close()
+            self._map = None
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
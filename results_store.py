@@ -0,0 +1,158 @@
+import json
+import os
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+RESULTS_FILE = "results.jsonl"
+LEGACY_RESULTS_FILE = "results.txt"
+
+
+class ResultsStore:
+    """Append-only JSON Lines store for quiz results
+
+    Every save appends a single line, so the cost of a save does not depend
+    on how many results are already stored. Writes are serialized with an
+    exclusive file lock so several quiz sessions can save at the same time.
+    """
+
+    def __init__(self, path=RESULTS_FILE, legacy_path=LEGACY_RESULTS_FILE, fsync_every=1):
+        self.path = path
+        self.legacy_path = legacy_path
+        self.fsync_every = max(1, fsync_every)
+        self._fd = None
+        self._unsynced = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def _open(self):
+        if self._fd is None:
+            # Readable too, to check how the last line ends before appending
+            self._fd = os.open(self.path, os.O_RDWR | os.O_APPEND | os.O_CREAT, 0o644)
+            self._import_legacy()
+        return self._fd
+
+    def _lock(self):
+        lock_file(self._fd)
+
+    def _unlock(self):
+        unlock_file(self._fd)
+
+    def _import_legacy(self):
+        """Move entries from the old results.txt JSON array into the log, once"""
+        if not self.legacy_path or not os.path.exists(self.legacy_path):
+            return
+        self._lock()
+        try:
+            # Another session may have imported it while we waited for the lock
+            if not os.path.exists(self.legacy_path):
+                return
+            try:
+                with open(self.legacy_path, "r") as f:
+                    legacy = json.load(f)
+            except json.JSONDecodeError:
+                legacy = []
+            if isinstance(legacy, list) and legacy:
+                self._write(self._line_break() + _encode(legacy))
+                os.fsync(self._fd)
+            os.replace(self.legacy_path, self.legacy_path + ".imported")
+        finally:
+            self._unlock()
+
+    def _line_break(self):
+        """b"\n" if the log ends in a line torn by a crashed session, else b""; call with the lock held
+
+        Appending after a torn line would join the first new entry onto it,
+        and both would then be skipped as one unreadable line.
+        """
+        size = os.fstat(self._fd).st_size
+        if not size:
+            return b""
+        if hasattr(os, "pread"):
+            last = os.pread(self._fd, 1, size - 1)
+        else:  # Windows
+            os.lseek(self._fd, size - 1, os.SEEK_SET)
+            last = os.read(self._fd, 1)
+        return b"" if last == b"\n" else b"\n"
+
+    def _write(self, data):
+        view = memoryview(data)
+        while view:
+            written = os.write(self._fd, view)
+            view = view[written:]
+
+    def append(self, entry):
+        """Append a single result entry"""
+        self.append_many([entry])
+
+    def append_many(self, entries):
+        """Append several result entries with one write"""
+        entries = list(entries)
+        if not entries:
+            return
+        self._open()
+        data = _encode(entries)
+        self._lock()
+        try:
+            self._write(self._line_break() + data)
+        finally:
+            self._unlock()
+        self._unsynced += len(entries)
+        if self._unsynced >= self.fsync_every:
+            self.flush()
+
+    def flush(self):
+        """Force buffered appends to disk"""
+        if self._fd is not None and self._unsynced:
+            os.fsync(self._fd)
+            self._unsynced = 0
+
+    def close(self):
+        if self._fd is not None:
+            self.flush()
+            os.close(self._fd)
+            self._fd = None
+
+    def __iter__(self):
+        """Yield stored results, oldest first"""
+        if self._fd is None and os.path.exists(self.legacy_path or ""):
+            self._open()
+        try:
+            f = open(self.path, "r", encoding="utf-8")
+        except FileNotFoundError:
+            return
+        with f:
+            for line in f:
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    # Skip a line left half-written by a crashed session
+                    continue
+
+
+def lock_file(fd):
+    """Take an exclusive lock on an open file, waiting if another process holds it"""
+    if fcntl is not None:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+    else:
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+
+
+def unlock_file(fd):
+    if fcntl is not None:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+    else:
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+
+
+def _encode(entries):
+    return "".join(json.dumps(entry, ensure_ascii=False) + "\n" for entry in entries).encode("utf-8")
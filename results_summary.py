@@ -0,0 +1,378 @@
+import argparse
+import json
+import math
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from quiz_engine import FEEDBACK_TIERS, time_taken_seconds
+from results_store import RESULTS_FILE, ResultsStore
+
+SUMMARY_VERSION = 1
+SUMMARY_SUFFIX = ".summary.json"
+RELATIVE_ACCURACY = 0.01  # quantiles of time taken are within 1% of the true value
+MIN_SECONDS = 1e-3  # durations below this count as zero
+PERCENTILES = (10, 25, 50, 75, 90)
+TIME_PERCENTILES = (50, 90, 99)
+
+
+class QuantileSketch:
+    """Mergeable quantile estimates with a bounded relative error
+
+    Values are counted in logarithmic buckets: bucket k holds values in
+    (gamma**(k-1), gamma**k], with gamma chosen so that any value in a
+    bucket is within `relative_accuracy` of the bucket's estimate. Merging
+    two sketches adds their bucket counts, so a sketch built from shards
+    gives the same quantiles as one built from all the values at once. A
+    day's range of quiz durations, from milliseconds up, takes under a
+    thousand buckets at 1%.
+    """
+
+    def __init__(self, relative_accuracy=RELATIVE_ACCURACY):
+        self.relative_accuracy = relative_accuracy
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self.gamma)
+        self.buckets = {}
+        self.zeros = 0
+        self.count = 0
+
+    def add(self, value, count=1):
+        if value < MIN_SECONDS:
+            self.zeros += count
+        else:
+            key = math.ceil(math.log(value) / self._log_gamma)
+            self.buckets[key] = self.buckets.get(key, 0) + count
+        self.count += count
+
+    def merge(self, other):
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("cannot merge quantile sketches of different accuracy")
+        buckets = self.buckets
+        for key, count in other.buckets.items():
+            buckets[key] = buckets.get(key, 0) + count
+        self.zeros += other.zeros
+        self.count += other.count
+        return self
+
+    def quantile(self, q):
+        """Estimate of the `q` quantile (0-1), or None if the sketch is empty"""
+        if not self.count:
+            return None
+        rank = q * (self.count - 1)
+        seen = self.zeros
+        if seen > rank:
+            return 0.0
+        for key in sorted(self.buckets):
+            seen += self.buckets[key]
+            if seen > rank:
+                return 2 * self.gamma ** key / (self.gamma + 1)
+        return 2 * self.gamma ** max(self.buckets) / (self.gamma + 1)
+
+    def to_dict(self):
+        return {
+            "relative_accuracy": self.relative_accuracy,
+            "zeros": self.zeros,
+            "buckets": {str(key): count for key, count in sorted(self.buckets.items())}
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        sketch = cls(data["relative_accuracy"])
+        sketch.zeros = data["zeros"]
+        sketch.buckets = {int(key): count for key, count in data["buckets"].items()}
+        sketch.count = sketch.zeros + sum(sketch.buckets.values())
+        return sketch
+
+
+class ResultsSummary:
+    """Statistics over a results history that can be merged with others
+
+    Holds the number of quizzes, how many quizzes ended on each score
+    (an exact histogram, since quizzes only have so many questions), a
+    QuantileSketch of time taken with its sum, minimum and maximum, and
+    the first and last timestamps. Every field combines by adding or by
+    taking a minimum or maximum, so summaries built per machine or per
+    file merge into the same figures as one built from all the results.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.skipped = 0
+        self.scores = {}  # (score, total) -> quizzes
+        self.seconds = QuantileSketch()
+        self.seconds_sum = 0.0
+        self.seconds_min = None
+        self.seconds_max = None
+        self.first = None
+        self.last = None
+
+    def add(self, result):
+        """Count one results entry"""
+        try:
+            key = (int(result["score"]), int(result["total"]))
+            seconds = result_seconds(result)
+        except (KeyError, TypeError, ValueError):
+            self.skipped += 1
+            return
+        self.count += 1
+        self.scores[key] = self.scores.get(key, 0) + 1
+        if seconds is not None:
+            self.seconds.add(seconds)
+            self.seconds_sum += seconds
+            if self.seconds_min is None or seconds < self.seconds_min:
+                self.seconds_min = seconds
+            if self.seconds_max is None or seconds > self.seconds_max:
+                self.seconds_max = seconds
+        timestamp = result.get("timestamp")
+        if isinstance(timestamp, str):
+            # "%Y-%m-%d %H:%M:%S" strings sort in time order
+            if self.first is None or timestamp < self.first:
+                self.first = timestamp
+            if self.last is None or timestamp > self.last:
+                self.last = timestamp
+
+    def merge(self, other):
+        """Add `other`'s results to this summary; returns self"""
+        self.count += other.count
+        self.skipped += other.skipped
+        for key, count in other.scores.items():
+            self.scores[key] = self.scores.get(key, 0) + count
+        self.seconds.merge(other.seconds)
+        self.seconds_sum += other.seconds_sum
+        self.seconds_min = _pick(min, self.seconds_min, other.seconds_min)
+        self.seconds_max = _pick(max, self.seconds_max, other.seconds_max)
+        self.first = _pick(min, self.first, other.first)
+        self.last = _pick(max, self.last, other.last)
+        return self
+
+    def percentages(self):
+        """(percentage, quizzes) pairs, lowest first"""
+        counts = {}
+        for (score, total), count in self.scores.items():
+            percentage = score / total * 100 if total else 0.0
+            counts[percentage] = counts.get(percentage, 0) + count
+        return sorted(counts.items())
+
+    def percentage_percentile(self, p):
+        """Exact `p`th percentile (nearest rank) of the final percentages"""
+        if not self.count:
+            return None
+        rank = max(1, math.ceil(p / 100 * self.count))
+        seen = 0
+        for percentage, count in self.percentages():
+            seen += count
+            if seen >= rank:
+                return percentage
+        return None
+
+    def mean_percentage(self):
+        if not self.count:
+            return None
+        return sum(percentage * count for percentage, count in self.percentages()) / self.count
+
+    def seconds_quantile(self, q):
+        """Estimated `q` quantile (0-1) of time taken, kept within the observed range"""
+        estimate = self.seconds.quantile(q)
+        if estimate is None:
+            return None
+        return min(max(estimate, self.seconds_min), self.seconds_max)
+
+    def feedback_bands(self):
+        """Quizzes per feedback tier, best tier first"""
+        bands = {message: 0 for _, message in FEEDBACK_TIERS}
+        for percentage, count in self.percentages():
+            for minimum, message in FEEDBACK_TIERS:
+                if percentage >= minimum:
+                    bands[message] += count
+                    break
+        return bands
+
+    def to_dict(self):
+        return {
+            "version": SUMMARY_VERSION,
+            "count": self.count,
+            "skipped": self.skipped,
+            "scores": [[score, total, count] for (score, total), count in sorted(self.scores.items())],
+            "seconds": dict(self.seconds.to_dict(), sum=self.seconds_sum,
+                            min=self.seconds_min, max=self.seconds_max),
+            "first": self.first,
+            "last": self.last
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        if data.get("version") != SUMMARY_VERSION:
+            raise ValueError(f"unsupported summary version {data.get('version')!r}")
+        summary = cls()
+        summary.count = data["count"]
+        summary.skipped = data["skipped"]
+        summary.scores = {(score, total): count for score, total, count in data["scores"]}
+        summary.seconds = QuantileSketch.from_dict(data["seconds"])
+        summary.seconds_sum = data["seconds"]["sum"]
+        summary.seconds_min = data["seconds"]["min"]
+        summary.seconds_max = data["seconds"]["max"]
+        summary.first = data["first"]
+        summary.last = data["last"]
+        return summary
+
+    def save(self, path):
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path):
+        """Read a saved summary; raises ValueError if it is not one"""
+        with open(path, "r", encoding="utf-8") as f:
+            try:
+                return cls.from_dict(json.load(f))
+            except (KeyError, TypeError, AttributeError, ValueError) as e:  # includes invalid JSON
+                raise ValueError(f"{path} is not a results summary: {e}") from None
+
+
+def _pick(choose, a, b):
+    """choose(a, b), ignoring whichever is None"""
+    if a is None:
+        return b
+    if b is None:
+        return a
+    return choose(a, b)
+
+
+def result_seconds(result):
+    """A result's duration in seconds, from "time_taken_ns" or the older "Xm Ys" string"""
+    if result.get("time_taken_ns") is not None:
+        return result["time_taken_ns"] / 1e9
+    return time_taken_seconds(result.get("time_taken"))
+
+
+def iter_results(path):
+    """Yield the entries of a results.jsonl log, or of an old results.txt JSON array"""
+    with open(path, "r", encoding="utf-8") as f:
+        if f.read(64).lstrip().startswith("["):
+            f.seek(0)
+            yield from json.load(f)
+            return
+    yield from ResultsStore(path, legacy_path=None)
+
+
+def summarize_file(path):
+    """A ResultsSummary of one results file"""
+    summary = ResultsSummary()
+    add = summary.add
+    try:
+        for result in iter_results(path):
+            if isinstance(result, dict):
+                add(result)
+            else:
+                summary.skipped += 1
+    except json.JSONDecodeError as e:  # an old results.txt that is not a JSON array
+        raise ValueError(f"{path}: {e}") from None
+    return summary
+
+
+def summary_path(results_path):
+    return results_path + SUMMARY_SUFFIX
+
+
+def _build_one(path):
+    summary = summarize_file(path)
+    summary.save(summary_path(path))
+    return summary.count, summary.skipped
+
+
+def build_summaries(paths, jobs=None):
+    """Write `<shard>.summary.json` next to every results shard, several at a time
+
+    Returns (results counted, entries skipped) per shard, in order.
+    """
+    jobs = min(jobs or os.cpu_count() or 1, len(paths))
+    if jobs <= 1:
+        return [_build_one(path) for path in paths]
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        # Shards are whole files, so hand them out a few at a time
+        return list(pool.map(_build_one, paths, chunksize=max(1, len(paths) // (jobs * 4))))
+
+
+def merge_summaries(summaries):
+    """One ResultsSummary combining all of `summaries`"""
+    total = ResultsSummary()
+    for summary in summaries:
+        total.merge(summary)
+    return total
+
+
+def print_summary(summary, shards=1):
+    print("=" * 60)
+    print(f"📊 RESULTS SUMMARY ({summary.count} quizzes from {shards} shard{'s' if shards != 1 else ''})")
+    print("=" * 60)
+    if summary.first is not None:
+        print(f"📅 {summary.first} to {summary.last}")
+    if summary.count:
+        print("\n📈 Percentage")
+        print(f"mean  {summary.mean_percentage():6.1f}")
+        for p in PERCENTILES:
+            print(f"p{p:<4}{summary.percentage_percentile(p):6.1f}")
+        print("\n🏷️  Feedback tiers")
+        for message, count in summary.feedback_bands().items():
+            print(f"{count:>8}  {message}")
+        print("\n🗂️  Score distribution")
+        for (score, total), count in sorted(summary.scores.items()):
+            print(f"{score:>4}/{total:<4}{count:>8}")
+    sketch = summary.seconds
+    if sketch.count:
+        print(f"\n⏱️  Time taken (seconds, quantiles within {sketch.relative_accuracy:.0%})")
+        print(f"mean  {summary.seconds_sum / sketch.count:8.1f}")
+        print(f"min   {summary.seconds_min:8.1f}")
+        for p in TIME_PERCENTILES:
+            print(f"p{p:<4}{summary.seconds_quantile(p / 100):8.1f}")
+        print(f"max   {summary.seconds_max:8.1f}")
+    if summary.skipped:
+        print(f"\n⚠️  Skipped {summary.skipped} unreadable results")
+
+
+def main():
+    """Build per-shard results summaries and merge them"""
+    parser = argparse.ArgumentParser(description="Mergeable summaries of results histories")
+    commands = parser.add_subparsers(dest="command", required=True)
+    build_parser = commands.add_parser("build", help="summarize results files, writing <file>.summary.json")
+    build_parser.add_argument("results", nargs="*", default=[RESULTS_FILE],
+                              help="results.jsonl (or old results.txt) files, one per shard")
+    build_parser.add_argument("-j", "--jobs", type=int, help="worker processes (default: one per core)")
+    merge_parser = commands.add_parser("merge", help="combine summaries and print the overall statistics")
+    merge_parser.add_argument("summaries", nargs="+", help=".summary.json files written by build")
+    merge_parser.add_argument("-o", "--output", help="also save the merged summary here")
+    args = parser.parse_args()
+
+    if args.command == "build":
+        try:
+            counts = build_summaries(args.results, args.jobs)
+        except FileNotFoundError as e:
+            print(f"❌ Error: {e.filename} not found!")
+            return 1
+        except ValueError as e:  # includes invalid JSON in an old results.txt
+            print(f"❌ Error: Invalid results file: {e}")
+            return 1
+        results = sum(count for count, _ in counts)
+        print(f"✅ Summarized {results} results from {len(counts)} files")
+        skipped = sum(skipped for _, skipped in counts)
+        if skipped:
+            print(f"⚠️  Skipped {skipped} unreadable results")
+        return 0
+
+    try:
+        total = merge_summaries(ResultsSummary.load(path) for path in args.summaries)
+    except FileNotFoundError as e:
+        print(f"❌ Error: {e.filename} not found!")
+        return 1
+    except ValueError as e:  # includes invalid JSON
+        print(f"❌ Error: {e}")
+        return 1
+    if args.output:
+        total.save(args.output)
+    print_summary(total, len(args.summaries))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,284 @@
+import argparse
+import heapq
+import os
+import random
+import re
+import sys
+import time
+from itertools import compress
+from record_file import KEY, RecordFile
+from results_store import lock_file, unlock_file
+
+REVIEWS_DIR = "reviews"
+
+REVIEWS_MAGIC = b"QREV\x00\x00\x00\x02"
+
+DAY = 86400
+RELEARN_SECONDS = 600  # a missed question comes back after ten minutes
+MAX_INTERVAL = 3650 * DAY
+INITIAL_EASE = 2500  # SM-2 easiness factor 2.5, stored in thousandths
+MIN_EASE = 1300
+# Correct answers faster than these many seconds grade 5 and 4; slower ones 3
+FAST_ANSWER, SLOW_ANSWER = 5, 15
+NEW_TRIES = 32  # random draws for an unseen question before listing them all
+
+# Each question's record is five unsigned 32-bit words: its key, when it
+# is next due (epoch seconds, 0 if never answered), the current interval
+# in seconds, the easiness factor and the run of correct answers
+_DUE, _INTERVAL, _EASE, _REPETITIONS = KEY + 1, KEY + 2, KEY + 3, KEY + 4
+RECORD_WORDS = 5
+
+
+def grade(correct, latency):
+    """SM-2 response quality (0-5) for an answer that took `latency` seconds"""
+    if not correct:
+        return 1
+    if latency <= FAST_ANSWER:
+        return 5
+    return 4 if latency <= SLOW_ANSWER else 3
+
+
+def sm2(interval, ease, repetitions, quality):
+    """Next (interval seconds, ease, repetitions) after an answer of `quality`"""
+    if quality < 3:
+        interval, repetitions = RELEARN_SECONDS, 0
+    else:
+        if repetitions == 0:
+            interval = DAY
+        elif repetitions == 1:
+            interval = 6 * DAY
+        else:
+            interval = min(MAX_INTERVAL, interval * ease // 1000)
+        repetitions += 1
+    miss = 5 - quality
+    ease = max(MIN_EASE, ease + 100 - miss * (80 + miss * 20))
+    return interval, ease, repetitions
+
+
+class ReviewStore(RecordFile):
+    """One user's spaced-repetition state, kept in a memory-mapped file
+
+    Like question_stats.bin, every question owns a fixed 20-byte record
+    addressed by its bank position, so recording an answer rewrites one
+    record in place and the sparse file only takes space for questions the
+    user has answered. A question that moves in the bank is treated as
+    unseen rather than inheriting the record left at its new position.
+    """
+
+    MAGIC = REVIEWS_MAGIC
+    RECORD_WORDS = RECORD_WORDS
+    WORD = "I"
+    DESCRIPTION = "review history file"
+
+    def seen(self, position, bank=None):
+        """Whether the user has answered the question at `position` before
+
+        Given the `bank`, a record left by a question that used to be at
+        `position` does not count.
+        """
+        return (position < self.capacity and self._words[position * RECORD_WORDS + _DUE] != 0
+                and self._owned(position, bank))
+
+    def get(self, position, bank=None):
+        """The review state of one question, or None if it was never answered"""
+        if not self.seen(position, bank):
+            return None
+        base = position * RECORD_WORDS
+        due, interval, ease, repetitions = self._words[base:base + RECORD_WORDS].tolist()
+        return {"position": position, "due": due, "interval": interval,
+                "ease": ease / 1000, "repetitions": repetitions}
+
+    def record(self, position, option_index, correct, latency, question, now=None):
+        """Reschedule `question`, at bank `position`, after an answer
+
+        Takes the same arguments as QuizSession's on_answer callback.
+        """
+        now = int(now if now is not None else time.time())
+        lock_file(self._fd)
+        try:
+            base = self._claim(position, question)
+            words = self._words
+            if words[base + _DUE]:
+                interval, ease, repetitions = words[base + _INTERVAL:base + RECORD_WORDS].tolist()
+            else:
+                interval, ease, repetitions = 0, INITIAL_EASE, 0
+            interval, ease, repetitions = sm2(interval, ease, repetitions, grade(correct, latency))
+            words[base + _DUE] = now + interval
+            words[base + _INTERVAL] = interval
+            words[base + _EASE] = ease
+            words[base + _REPETITIONS] = repetitions
+        finally:
+            unlock_file(self._fd)
+
+    def unseen(self, size, positions=None):
+        """Positions below `size`, or in `positions`, that have no record, read from the record words alone"""
+        dues = self._words[_DUE::RECORD_WORDS].tolist() if self._words is not None else []
+        if positions is None:
+            dues = dues[:size]
+            return list(compress(range(len(dues)), [not due for due in dues])) + list(range(len(dues), size))
+        return [position for position in positions if position >= len(dues) or not dues[position]]
+
+    def due_heap(self, positions=None):
+        """Heap of (due, position) for every answered question, or only those in `positions`
+
+        Records are not checked against the bank here; ReviewQueue skips
+        those of moved questions as it pops them.
+        """
+        self._remap()  # pick up answers recorded by other processes
+        if self._words is None:
+            return []
+        dues = self._words[_DUE::RECORD_WORDS].tolist()
+        if positions is None:
+            heap = list(zip(compress(dues, dues), compress(range(len(dues)), dues)))
+        else:
+            heap = [(dues[position], position) for position in positions
+                    if position < len(dues) and dues[position]]
+        heapq.heapify(heap)
+        return heap
+
+    def queue(self, bank, num_questions=None, seed=None, category=None, difficulty=None, tags=()):
+        """A ReviewQueue of `num_questions` from `bank`, filtered like draw_questions"""
+        if category is None and difficulty is None and not tags:
+            pool = None
+        else:
+            pool = bank.matching(category, difficulty, tags)
+        return ReviewQueue(self, len(bank) if pool is None else len(pool), num_questions, seed, pool,
+                           bank=bank)
+
+
+class ReviewQueue:
+    """Question positions for one adaptive session, picked as they come up
+
+    Pass it to QuizSession in place of a drawn list. Each position is
+    chosen only when the session reaches it, so answers given earlier in
+    the session count: overdue questions come first (most overdue first,
+    from a heap of due times, O(log n) per pick), then questions the user
+    has never seen, in random order, then whatever is due soonest. The
+    heap is built once per session from the due times in the store.
+    Given the `bank`, a record is checked against its question only when
+    it is popped off the heap, so picks never parse more than the question
+    picked; a question that has moved is then asked as an unseen one.
+    """
+
+    def __init__(self, store, size, num_questions=None, seed=None, pool=None, clock=time.time, bank=None):
+        self.store = store
+        self.bank = bank
+        self.size = size
+        self.count = size if num_questions is None else min(num_questions, size)
+        self.pool = pool  # sorted positions to pick from, or None for the whole bank
+        self.clock = clock
+        self.rng = random.Random(seed)
+        self.due = store.due_heap(pool)
+        self.picked = []
+        self.taken = set()
+        self._unseen = None
+        self._moved = []  # popped off the heap, but their records belong to other questions
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, index):
+        if not 0 <= index < self.count:
+            raise IndexError("review queue index out of range")
+        while len(self.picked) <= index:
+            position = self._pick()
+            self.taken.add(position)
+            self.picked.append(position)
+        return self.picked[index]
+
+    def _pick(self):
+        now = self.clock()
+        while self.due and self.due[0][0] <= now:
+            position = self._pop_due()
+            if position is not None:
+                return position
+        position = self._new()
+        while position is None:
+            # Everything has been seen: review ahead, soonest due first
+            position = self._pop_due()
+            if position is None:
+                position = self._new()
+        return position
+
+    def _pop_due(self):
+        """The next position off the due heap, or None if its record belongs to a moved question"""
+        position = heapq.heappop(self.due)[1]
+        if position in self.taken:
+            return None
+        if not self.store.seen(position, self.bank):
+            self._moved.append(position)  # unseen after all; _new hands it out
+            return None
+        return position
+
+    def _new(self):
+        """A random position the user has never answered, or None"""
+        while self._moved:
+            position = self._moved.pop()
+            if position not in self.taken:
+                return position
+        if self._unseen is None:
+            # Records alone tell seen from unseen here; a moved question's
+            # stale record is caught when the heap hands it out
+            for _ in range(NEW_TRIES):
+                i = self.rng.randrange(self.size)
+                position = self.pool[i] if self.pool is not None else i
+                if position not in self.taken and not self.store.seen(position):
+                    return position
+            # Mostly seen already: list the rest once instead of guessing
+            self._unseen = self.store.unseen(self.size, self.pool)
+            self.rng.shuffle(self._unseen)
+        while self._unseen:
+            position = self._unseen.pop()
+            if position not in self.taken:
+                return position
+        return None
+
+
+def default_user():
+    import getpass
+    try:
+        return getpass.getuser()
+    except (KeyError, OSError):
+        return "default"
+
+
+def reviews_path(user, directory=REVIEWS_DIR):
+    return os.path.join(directory, re.sub(r"[^\w.-]", "_", user) + ".bin")
+
+
+def open_reviews(user, directory=REVIEWS_DIR):
+    """Open `user`'s review history, or None if it cannot be used (questions are drawn at random)"""
+    try:
+        os.makedirs(directory, exist_ok=True)
+        return ReviewStore(reviews_path(user, directory))
+    except (OSError, ValueError):
+        return None
+
+
+def main():
+    """Summarize a user's review history"""
+    parser = argparse.ArgumentParser(description="Spaced-repetition review history")
+    parser.add_argument("--user", default=default_user(), help="whose history to show (default: your login name)")
+    args = parser.parse_args()
+
+    path = reviews_path(args.user)
+    if not os.path.exists(path):
+        print(f"❌ Error: no review history for {args.user}! Play with --adaptive first.")
+        return 1
+    now = time.time()
+    with ReviewStore(path) as store:
+        heap = store.due_heap()
+    due_now = sum(1 for due, _ in heap if due <= now)
+    print("=" * 60)
+    print(f"🧠 REVIEW HISTORY: {args.user}")
+    print("=" * 60)
+    print(f"📚 Questions seen: {len(heap)}")
+    print(f"⏰ Due now: {due_now}")
+    if len(heap) > due_now:
+        upcoming = min(due for due, _ in heap if due > now)
+        print(f"📅 Next review: {time.strftime('%Y-%m-%d %H:%M', time.localtime(upcoming))}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,177 @@
+import argparse
+import asyncio
+import json
+from question_bank import BankWatcher, draw_questions
+from question_stats import open_stats
+from quiz_engine import QuizSession, feedback_for, positive_int
+from storage import BACKENDS, DATABASE_FILE, FileStorage, open_storage
+
+DEFAULT_PORT = 8765
+WATCH_SECONDS = 1.0  # how often --watch checks questions.json for changes
+
+
+class QuizServer:
+    """Serves quiz sessions to many TCP clients from one process
+
+    The protocol is newline-delimited JSON. The server sends "welcome",
+    then a "question" message; the client replies with the chosen option
+    number (a bare number or {"answer": n}) and gets "feedback" followed
+    by the next question, until a final "result" message. Every session
+    draws from the same read-only question bank. A question that turns
+    out to be invalid when it is drawn ends the session with an "error"
+    message and the connection closed; nothing is saved for it.
+
+    With a BankWatcher, edits to questions.json replace `bank` while the
+    server runs. Each session keeps the bank it started with.
+    """
+
+    def __init__(self, bank, num_questions=None, store=None, stats=None, watcher=None):
+        self.bank = bank
+        self.num_questions = num_questions
+        self.store = store
+        self.stats = stats
+        self.watcher = watcher
+        self.active_sessions = 0
+
+    async def serve(self, host="127.0.0.1", port=DEFAULT_PORT, backlog=4096):
+        server = await asyncio.start_server(self.handle, host, port, backlog=backlog)
+        print(f"🚀 Serving quiz sessions on {host}:{port}", flush=True)
+        watch = asyncio.create_task(self.watch()) if self.watcher is not None else None
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            if watch is not None:
+                watch.cancel()
+
+    async def watch(self, interval=WATCH_SECONDS):
+        """Swap in edits to questions.json, reading the file off the event loop"""
+        loop = asyncio.get_running_loop()
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                if await loop.run_in_executor(None, self.watcher.poll):
+                    self.bank = self.watcher.current
+                    print(f"🔄 Reloaded {len(self.bank)} questions", flush=True)
+            except (OSError, ValueError) as e:  # includes invalid JSON
+                print(f"⚠️  Kept the previous questions, {self.watcher.path} could not be reloaded: {e}",
+                      flush=True)
+
+    async def handle(self, reader, writer):
+        """Run one quiz session over a client connection"""
+        self.active_sessions += 1
+        on_answer = self.stats.record if self.stats else None
+        bank = self.bank  # stays the same for this session even if the file is reloaded
+        session = QuizSession(bank, draw_questions(bank, self.num_questions), on_answer=on_answer)
+        try:
+            session.start()
+            await self._send(writer, {"type": "welcome", "total": session.total})
+            while not session.finished:
+                try:
+                    question = session.question
+                except ValueError as e:  # questions are only parsed as they are drawn
+                    print(f"⚠️  Ended a session on an invalid question bank: {e}", flush=True)
+                    await self._send(writer, {"type": "error", "message": f"Invalid question bank: {e}"})
+                    return
+                await self._send(writer, {
+                    "type": "question",
+                    "number": session.number,
+                    "total": session.total,
+                    "question": question.text,
+                    "options": question.options
+                })
+                choice = await self._read_choice(reader, writer, len(question.options))
+                if choice is None:
+                    return  # client disconnected mid-quiz
+                correct = session.answer(choice - 1)
+                await self._send(writer, {
+                    "type": "feedback",
+                    "correct": correct,
+                    "answer": question.answer,
+                    "score": session.score
+                })
+                session.next()
+            result = session.result()
+            if self.store is not None:
+                self.store.append(result)
+            await self._send(writer, dict(result, type="result", feedback=feedback_for(session.percentage)))
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self.active_sessions -= 1
+            writer.close()
+
+    async def _read_choice(self, reader, writer, option_count):
+        """Read answers until a valid option number arrives, or None on EOF"""
+        while True:
+            line = await reader.readline()
+            if not line:
+                return None
+            try:
+                message = json.loads(line)
+                choice = int(message["answer"] if isinstance(message, dict) else message)
+            except (ValueError, KeyError, TypeError):
+                await self._send(writer, {"type": "error", "message": "Please enter a valid number!"})
+                continue
+            if 1 <= choice <= option_count:
+                return choice
+            await self._send(writer, {
+                "type": "error",
+                "message": f"Please enter a number between 1 and {option_count}!"
+            })
+
+    async def _send(self, writer, message):
+        writer.write(json.dumps(message, ensure_ascii=False).encode("utf-8") + b"\n")
+        await writer.drain()
+
+
+def main():
+    """Start the multi-user quiz server"""
+    parser = argparse.ArgumentParser(description="Serve quiz sessions to many clients over TCP")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("-n", "--num-questions", type=positive_int, help="questions per session (default: all)")
+    parser.add_argument("--no-save", action="store_true", help="do not record results or answer statistics")
+    parser.add_argument("--watch", action="store_true",
+                        help="reload questions.json when it changes; running sessions finish on the old questions. "
+                             "Keeps the whole file and every question parsed so far in memory")
+    parser.add_argument("--storage", choices=BACKENDS, default="file",
+                        help="read questions and save results from JSON files or a SQLite database")
+    parser.add_argument("--database", default=DATABASE_FILE, help="SQLite database for --storage sqlite")
+    args = parser.parse_args()
+
+    try:
+        storage = open_storage(args.storage, args.database)
+        if args.watch and not isinstance(storage, FileStorage):
+            print("❌ Error: --watch only works with --storage file")
+            storage.close()
+            return
+        watcher = BankWatcher(storage.questions_path) if args.watch else None
+        bank = watcher.current if watcher is not None else storage.open_bank()
+    except FileNotFoundError:
+        print("❌ Error: questions.json file not found!")
+        return
+    except ValueError as e:  # includes invalid JSON
+        print(f"❌ Error: Invalid question bank: {e}")
+        return
+
+    # Results are written as sessions end but synced to disk in batches rather than one by one
+    store = None if args.no_save else storage.open_results(batch_size=100)
+    stats = None if args.no_save else open_stats()
+    server = QuizServer(bank, args.num_questions, store, stats, watcher)
+    print(f"✅ Loaded {len(bank)} questions successfully!", flush=True)
+    try:
+        asyncio.run(server.serve(args.host, args.port))
+    except KeyboardInterrupt:
+        print("👋 Server stopped")
+    finally:
+        if store is not None:
+            store.close()
+        if stats is not None:
+            stats.close()
+        bank.close()
+        storage.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,410 @@
+import abc
+import argparse
+import json
+import sys
+import threading
+from array import array
+from contextlib import contextmanager
+from itertools import islice
+from question_bank import QUESTIONS_FILE, FacetIndex, JSONQuestionBank, Question, index_keys, load_bank
+from results_store import LEGACY_RESULTS_FILE, RESULTS_FILE, ResultsStore
+
+DATABASE_FILE = "quiz.db"
+BACKENDS = ("file", "sqlite")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS questions (
+    id INTEGER PRIMARY KEY,  -- 0-based position, as in questions.json
+    text TEXT NOT NULL,
+    options TEXT NOT NULL,   -- JSON array
+    option_count INTEGER NOT NULL,
+    answer_index INTEGER NOT NULL,
+    category TEXT,
+    difficulty TEXT,
+    tags TEXT                -- JSON array, or NULL
+);
+CREATE INDEX IF NOT EXISTS questions_category ON questions (category);
+CREATE INDEX IF NOT EXISTS questions_difficulty ON questions (difficulty);
+-- The FacetIndex keys of every question, for filtered draws
+CREATE TABLE IF NOT EXISTS question_facets (
+    key TEXT NOT NULL,
+    question_id INTEGER NOT NULL,
+    PRIMARY KEY (key, question_id)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS results (
+    id INTEGER PRIMARY KEY,
+    timestamp TEXT NOT NULL,
+    score INTEGER NOT NULL,
+    total INTEGER NOT NULL,
+    percentage REAL NOT NULL,
+    time_taken_ns INTEGER,
+    data TEXT NOT NULL       -- the full results entry as JSON
+);
+CREATE INDEX IF NOT EXISTS results_timestamp ON results (timestamp);
+"""
+SCHEMA_VERSION = 2
+
+MIGRATE_BATCH = 10000
+
+
+class Storage(abc.ABC):
+    """Where the question bank and the results history live
+
+    Both quiz apps and the server only talk to a Storage, so the files and
+    the SQLite database are interchangeable. open_bank() returns a bank
+    with the question_bank interface (len, indexing, answer_index,
+    option_count, close) and open_results() a store with the ResultsStore
+    interface (append, append_many, flush, close, iteration).
+    """
+
+    results_location = None
+
+    @abc.abstractmethod
+    def open_bank(self):
+        pass
+
+    @abc.abstractmethod
+    def open_results(self, batch_size=1):
+        pass
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+class FileStorage(Storage):
+    """questions.json (or its compiled copy) and the results.jsonl log"""
+
+    def __init__(self, questions_path=QUESTIONS_FILE, results_path=RESULTS_FILE):
+        self.questions_path = questions_path
+        self.results_path = results_path
+        self.results_location = results_path
+
+    def open_bank(self):
+        return load_bank(self.questions_path)
+
+    def open_results(self, batch_size=1):
+        return ResultsStore(self.results_path, fsync_every=batch_size)
+
+
+class ConnectionPool:
+    """A few reusable SQLite connections shared across threads
+
+    Connections are opened in WAL mode, so readers never wait for the
+    results writer, and go back to the pool after each use instead of
+    being reopened.
+    """
+
+    def __init__(self, path, size=4):
+        self.path = path
+        self.size = size
+        self._idle = []
+        self._lock = threading.Lock()
+
+    def _connect(self):
+        import sqlite3  # the file backend never loads it
+        conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        # WAL keeps the database consistent with NORMAL; only the last
+        # commits can be lost on power failure
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    @contextmanager
+    def connection(self):
+        with self._lock:
+            conn = self._idle.pop() if self._idle else None
+        if conn is None:
+            conn = self._connect()
+        try:
+            yield conn
+        finally:
+            with self._lock:
+                if len(self._idle) < self.size:
+                    self._idle.append(conn)
+                    conn = None
+            if conn is not None:
+                conn.close()
+
+    def close(self):
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.close()
+
+
+class SQLiteStorage(Storage):
+    """Questions and results in one SQLite database
+
+    Questions are looked up by primary key and indexed by category and
+    difficulty; results are indexed by timestamp, so date-range queries
+    do not scan the whole history.
+    """
+
+    def __init__(self, path=DATABASE_FILE, pool_size=4):
+        self.path = path
+        self.results_location = path
+        import sqlite3
+        self.pool = ConnectionPool(path, pool_size)
+        try:
+            with self.pool.connection() as conn:
+                (version,) = conn.execute("PRAGMA user_version").fetchone()
+                if version < SCHEMA_VERSION:
+                    # The question tables only copy questions.json; an older
+                    # layout is dropped and refilled by the next migrate
+                    conn.executescript("DROP TABLE IF EXISTS questions; DROP TABLE IF EXISTS question_facets;")
+                conn.executescript(SCHEMA)
+                conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        except sqlite3.DatabaseError as e:
+            self.pool.close()
+            raise ValueError(f"{path}: {e}") from None
+
+    def open_bank(self):
+        return SQLiteQuestionBank(self.pool)
+
+    def open_results(self, batch_size=1):
+        return SQLiteResultsStore(self.pool, batch_size)
+
+    def close(self):
+        self.pool.close()
+
+
+class SQLiteQuestionBank:
+    """Read-only question bank over the questions table
+
+    Questions are fetched by primary key as they are asked for, like the
+    JSON bank's lazy parsing, so opening it costs the same for any size.
+    """
+
+    def __init__(self, pool):
+        self.pool = pool
+        self.facets = FacetIndex(_FacetPostings(pool))
+        with pool.connection() as conn:
+            # ids are 0..n-1, so the largest id gives the count without a scan
+            (last,) = conn.execute("SELECT MAX(id) FROM questions").fetchone()
+        if last is None:
+            raise ValueError(f"no questions in {pool.path}; run: python storage.py migrate")
+        self._count = last + 1
+
+    def __len__(self):
+        return self._count
+
+    def _row(self, i, columns):
+        if i < 0:
+            i += self._count
+        with self.pool.connection() as conn:
+            row = conn.execute(f"SELECT {columns} FROM questions WHERE id = ?", (i,)).fetchone()
+        if row is None:
+            raise IndexError("question index out of range")
+        return row
+
+    def __getitem__(self, i):
+        return _question(self._row(i, QUESTION_COLUMNS))
+
+    def answer_index(self, i):
+        """0-based index of the correct option of question i, without decoding options"""
+        return self._row(i, "answer_index")[0]
+
+    def option_count(self, i):
+        return self._row(i, "option_count")[0]
+
+    def matching(self, category=None, difficulty=None, tags=()):
+        """Sorted positions of the questions that pass the given filters"""
+        return self.facets.matching(category, difficulty, tags)
+
+    def __iter__(self):
+        with self.pool.connection() as conn:
+            for row in conn.execute(f"SELECT {QUESTION_COLUMNS} FROM questions ORDER BY id"):
+                yield _question(row)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def close(self):
+        pass  # connections belong to the storage's pool
+
+
+QUESTION_COLUMNS = "text, options, answer_index, category, difficulty, tags"
+
+
+def _question(row):
+    text, options, answer_index, category, difficulty, tags = row
+    return Question(text, tuple(json.loads(options)), answer_index, category, difficulty,
+                    tuple(json.loads(tags)) if tags else ())
+
+
+class _FacetPostings:
+    """FacetIndex posting lists read from the question_facets primary key"""
+
+    def __init__(self, pool):
+        self.pool = pool
+
+    def get(self, key, default=()):
+        with self.pool.connection() as conn:
+            rows = conn.execute("SELECT question_id FROM question_facets WHERE key = ? ORDER BY question_id",
+                                (key,)).fetchall()
+        return array("I", (row[0] for row in rows)) if rows else default
+
+
+class SQLiteResultsStore:
+    """Results table with the same interface as ResultsStore
+
+    Like the JSON Lines log, every append is committed at once, so no
+    result waits in memory. `batch_size` only sets how many are committed
+    between checkpoints, which sync the write-ahead log to disk the way
+    ResultsStore's fsync_every does; append_many() inserts its entries in
+    a single transaction.
+    """
+
+    def __init__(self, pool, batch_size=1):
+        self.pool = pool
+        self.batch_size = max(1, batch_size)
+        self._unsynced = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def append(self, entry):
+        """Append a single result entry"""
+        self.append_many([entry])
+
+    def append_many(self, entries):
+        """Append several result entries in one transaction"""
+        rows = [(entry["timestamp"], entry["score"], entry["total"], entry["percentage"],
+                 entry.get("time_taken_ns"), json.dumps(entry, ensure_ascii=False))
+                for entry in entries]
+        if not rows:
+            return
+        with self.pool.connection() as conn, conn:
+            conn.executemany("INSERT INTO results (timestamp, score, total, percentage, time_taken_ns, data) "
+                             "VALUES (?, ?, ?, ?, ?, ?)", rows)
+        self._unsynced += len(rows)
+        if self._unsynced >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        """Force committed appends to disk"""
+        if not self._unsynced:
+            return
+        with self.pool.connection() as conn:
+            # With synchronous=NORMAL the log is synced before it is checkpointed
+            conn.execute("PRAGMA wal_checkpoint(PASSIVE)")
+        self._unsynced = 0
+
+    def close(self):
+        self.flush()
+
+    def __iter__(self):
+        """Yield stored results, oldest first"""
+        return self._query("SELECT data FROM results ORDER BY id", ())
+
+    def between(self, start, end):
+        """Results with start <= timestamp < end ("YYYY-MM-DD HH:MM:SS" strings)"""
+        return self._query("SELECT data FROM results WHERE timestamp >= ? AND timestamp < ? "
+                           "ORDER BY timestamp", (start, end))
+
+    def _query(self, sql, params):
+        with self.pool.connection() as conn:
+            for (data,) in conn.execute(sql, params):
+                yield json.loads(data)
+
+
+def open_storage(backend="file", database=DATABASE_FILE):
+    """The Storage for a --storage choice"""
+    if backend == "sqlite":
+        return SQLiteStorage(database)
+    if backend == "file":
+        return FileStorage()
+    raise ValueError(f"unknown storage backend {backend!r}")
+
+
+def migrate(storage, questions_path=QUESTIONS_FILE, results_path=RESULTS_FILE, replace_results=False):
+    """Copy the JSON question bank and results history into a SQLiteStorage
+
+    The question tables are replaced, so running it again re-imports the
+    bank from scratch. Results are only imported into an empty results
+    table, as sessions run with --storage sqlite save theirs nowhere else;
+    with `replace_results` the table is emptied and re-imported instead.
+    Returns (questions, results) copied, with results None when existing
+    results were kept.
+    """
+    with JSONQuestionBank(questions_path) as bank, storage.pool.connection() as conn, conn:
+        conn.execute("DELETE FROM questions")
+        conn.execute("DELETE FROM question_facets")
+        rows, facets = [], []
+        for i, question in enumerate(bank):
+            rows.append((i, question.text, json.dumps(question.options, ensure_ascii=False),
+                         len(question.options), question.answer_index, question.category,
+                         question.difficulty, json.dumps(question.tags, ensure_ascii=False) if question.tags else None))
+            facets.extend((key, i) for key in index_keys(question.category, question.difficulty, question.tags))
+            if len(rows) == MIGRATE_BATCH:
+                _insert_questions(conn, rows, facets)
+                rows, facets = [], []
+        _insert_questions(conn, rows, facets)
+        questions = len(bank)
+
+    with storage.pool.connection() as conn, conn:
+        if replace_results:
+            conn.execute("DELETE FROM results")
+        elif conn.execute("SELECT 1 FROM results LIMIT 1").fetchone() is not None:
+            return questions, None
+    results = 0
+    with ResultsStore(results_path, legacy_path=LEGACY_RESULTS_FILE) as source, \
+            SQLiteResultsStore(storage.pool, batch_size=MIGRATE_BATCH) as store:
+        entries = iter(source)
+        while True:
+            batch = list(islice(entries, MIGRATE_BATCH))
+            if not batch:
+                break
+            store.append_many(batch)
+            results += len(batch)
+    return questions, results
+
+
+def _insert_questions(conn, rows, facets):
+    conn.executemany("INSERT INTO questions VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows)
+    conn.executemany("INSERT INTO question_facets VALUES (?, ?)", facets)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Quiz storage tools")
+    commands = parser.add_subparsers(dest="command", required=True)
+    migrate_parser = commands.add_parser("migrate", help="copy questions.json and results.jsonl into SQLite")
+    migrate_parser.add_argument("--questions", default=QUESTIONS_FILE)
+    migrate_parser.add_argument("--results", default=RESULTS_FILE)
+    migrate_parser.add_argument("--database", default=DATABASE_FILE)
+    migrate_parser.add_argument("--replace-results", action="store_true",
+                                help="delete the results already in the database and import --results again")
+    args = parser.parse_args()
+
+    try:
+        with SQLiteStorage(args.database) as storage:
+            questions, results = migrate(storage, args.questions, args.results, args.replace_results)
+    except FileNotFoundError:
+        print(f"❌ Error: {args.questions} file not found!")
+        return 1
+    except ValueError as e:  # includes invalid JSON
+        print(f"❌ Error: Invalid question bank: {e}")
+        return 1
+    if results is None:
+        print(f"✅ Migrated {questions} questions into {args.database}")
+        print(f"⚠️  Kept the results already in {args.database}; "
+              f"use --replace-results to import {args.results} over them")
+    else:
+        print(f"✅ Migrated {questions} questions and {results} results into {args.database}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())